@@ -1,5 +1,55 @@
+import subprocess
+import sys
+
+# optional dependencies that are imported on first use, and not when importing uxarray
+LAZY_MODULES = [
+    "holoviews",
+    "datashader",
+    "cartopy",
+    "matplotlib",
+    "dask.dataframe",
+    "spatialpandas",
+    "sklearn",
+]
+
+
+def _run_in_subprocess(code):
+    """Runs code in a fresh interpreter, returning its standard output."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
 class Imports:
     """Benchmark importing uxarray."""
 
     def timeraw_import_uxarray(self):
         return "import uxarray"
+
+    def track_import_uxarray_memory(self):
+        """Increase in peak resident memory from importing uxarray in a fresh
+        interpreter."""
+        code = (
+            "import resource, sys\n"
+            "before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+            "import uxarray\n"
+            "after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+            # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+            "scale = 1 if sys.platform == 'darwin' else 1024\n"
+            "print((after - before) * scale / 2**20)\n"
+        )
+        return float(_run_in_subprocess(code))
+
+    track_import_uxarray_memory.unit = "MB"
+
+    def track_import_uxarray_lazy_modules(self):
+        """Number of optional dependencies that are imported when importing
+        uxarray, which should remain zero."""
+        code = (
+            "import sys\n"
+            "import uxarray\n"
+            f"print(sum(module in sys.modules for module in {LAZY_MODULES!r}))\n"
+        )
+        return int(_run_in_subprocess(code))
+
+    track_import_uxarray_lazy_modules.unit = "modules"
@@ -0,0 +1,49 @@
+import os
+from pathlib import Path
+
+import numpy as np
+
+import uxarray as ux
+from uxarray.grid.integrate import _get_zonal_intervals, _get_zonal_weights, _process_overlapped_intervals_batch
+
+current_path = Path(os.path.dirname(os.path.realpath(__file__))).parents[0]
+
+grid_mpas = current_path / "test" / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+grid_ne30 = current_path / "test" / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+
+
+class ZonalAverage:
+
+    param_names = ['grid_path', 'n_lat']
+    params = [[grid_mpas, grid_ne30],
+              [19, 181]]
+
+
+    def setup(self, grid_path, n_lat):
+        self.uxgrid = ux.open_grid(grid_path)
+        self.latitudes = np.linspace(-90, 90, n_lat)
+        self.uxda = ux.UxDataArray(np.ones((10, self.uxgrid.n_face)),
+                                   dims=["time", "n_face"],
+                                   uxgrid=self.uxgrid)
+
+        # intervals of the candidate faces at every latitude, used to time the sweep line on its own
+        self.starts, self.ends, self.faces, self.lat_indices = _get_zonal_intervals(self.uxgrid, self.latitudes)
+
+    def teardown(self, grid_path, n_lat):
+        del self.uxgrid, self.uxda
+
+    def time_zonal_weights(self, grid_path, n_lat):
+        """Time to compute the zonal weights of all faces at each latitude"""
+        _get_zonal_weights(self.uxgrid, self.latitudes)
+
+    def time_process_overlapped_intervals(self, grid_path, n_lat):
+        """Time to resolve the overlaps of the intervals at all latitudes"""
+        _process_overlapped_intervals_batch(self.starts, self.ends, self.faces, self.lat_indices, n_lat)
+
+    def time_zonal_mean(self, grid_path, n_lat):
+        """Time to compute the zonal mean using cached zonal weights"""
+        self.uxda.zonal_mean(lat=self.latitudes)
+
+    def peakmem_zonal_weights(self, grid_path, n_lat):
+        """Peak memory usage to compute the zonal weights"""
+        _get_zonal_weights(self.uxgrid, self.latitudes)
@@ -70,6 +70,42 @@ class TestAPI(TestCase):
 
         nt.assert_equal(uxds_mf_ne30.source_datasets, self.dsfiles_mf_ne30)
 
+    def test_open_dataset_shared_grid(self):
+        """Datasets opened on the same grid share a single grid instance."""
+        data_paths = [
+            self.geoflow_data_v1, self.geoflow_data_v2, self.geoflow_data_v3
+        ]
+
+        uxds_list = [ux.open_dataset(self.gridfile_geoflow, path, share_grid=True) for path in data_paths]
+        uxds_mf = ux.open_mfdataset(self.gridfile_geoflow, data_paths, share_grid=True)
+
+        for uxds in uxds_list[1:] + [uxds_mf]:
+            assert uxds.uxgrid is uxds_list[0].uxgrid
+
+        # caches constructed on one dataset are reused by the others
+        uxds_list[0].uxgrid.face_areas
+        assert "face_areas" in uxds_list[1].uxgrid._ds
+
+        uxds_unshared = ux.open_dataset(self.gridfile_geoflow, data_paths[0])
+        assert uxds_unshared.uxgrid is not uxds_list[0].uxgrid
+        assert uxds_unshared.uxgrid == uxds_list[0].uxgrid
+
+    def test_open_dataset_unshared_grid(self):
+        """Changes to the grid of one dataset do not affect the grid of
+        another dataset unless sharing is requested."""
+        uxds_a = ux.open_dataset(self.gridfile_ne30, self.dsfile_var2_ne30)
+        uxds_b = ux.open_dataset(self.gridfile_ne30, self.dsfile_var2_ne30)
+        assert uxds_a.uxgrid is not uxds_b.uxgrid
+
+        face_lon_b = uxds_b.uxgrid.face_lon.values.copy()
+        uxds_a.uxgrid.compute_face_centroids(method="spherical")
+        assert not np.array_equal(uxds_a.uxgrid.face_lon.values, face_lon_b)
+        nt.assert_array_equal(uxds_b.uxgrid.face_lon.values, face_lon_b)
+
+        uxds_c = ux.open_dataset(self.gridfile_ne30, self.dsfile_var2_ne30, share_grid=True)
+        uxds_d = ux.open_dataset(self.gridfile_ne30, self.dsfile_var2_ne30, share_grid=True)
+        assert uxds_c.uxgrid is uxds_d.uxgrid
+
     def test_open_grid(self):
         """Loads only a grid topology file using uxarray's open_grid call."""
         uxgrid = ux.open_grid(self.gridfile_geoflow)
@@ -10,7 +10,8 @@ from pathlib import Path
 import uxarray as ux
 
 from uxarray.grid.coordinates import _lonlat_rad_to_xyz
-from uxarray.grid.arcs import point_within_gca
+from uxarray.grid.arcs import point_within_gca, point_within_gca_batch, \
+    extreme_gca_latitude, extreme_gca_latitude_batch
 
 try:
     import constants
@@ -144,3 +145,42 @@ class TestIntersectionPoint(TestCase):
         self.assertFalse(point_within_gca(pt_cart, gcr_cart, is_directed=False))
         with self.assertRaises(ValueError):
             point_within_gca(pt_cart, gcr_cart, is_directed=True)
+
+
+class TestBatch(TestCase):
+
+    def setUp(self):
+        self.gcas_cart = np.array([
+            [_lonlat_rad_to_xyz(np.deg2rad(10.0), np.deg2rad(10.0)),
+             _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(10.0))],
+            [_lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(89.0)),
+             _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(-10.0))],
+            [_lonlat_rad_to_xyz(np.deg2rad(350.0), np.deg2rad(-20.0)),
+             _lonlat_rad_to_xyz(np.deg2rad(10.0), np.deg2rad(-30.0))],
+        ])
+
+    def test_pt_within_gcr_batch(self):
+        pts_cart = np.array([
+            _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(30.0)),
+            _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(-30.0)),
+            self.gcas_cart[0][0],
+            self.gcas_cart[2][1],
+        ])
+
+        within = point_within_gca_batch(pts_cart, self.gcas_cart)
+        self.assertEqual(within.shape, (4, 3))
+
+        for i, pt_cart in enumerate(pts_cart):
+            for j, gca_cart in enumerate(self.gcas_cart):
+                self.assertEqual(within[i, j],
+                                 point_within_gca(pt_cart, gca_cart.copy()))
+
+    def test_extreme_gca_latitude_batch(self):
+        for extreme_type in ["max", "min"]:
+            res = extreme_gca_latitude_batch(self.gcas_cart, extreme_type)
+            expected = [extreme_gca_latitude(gca_cart, extreme_type)
+                        for gca_cart in self.gcas_cart]
+            nt.assert_allclose(res, expected, atol=ux.constants.ERROR_TOLERANCE)
+
+        with self.assertRaises(ValueError):
+            extreme_gca_latitude_batch(self.gcas_cart, "mean")
@@ -4,7 +4,8 @@ import numpy as np
 import numpy.testing as nt
 import uxarray as ux
 from pathlib import Path
-from uxarray.grid.coordinates import _populate_face_centroids, _populate_edge_centroids, _normalize_xyz
+from uxarray.grid.coordinates import _populate_face_centroids, _populate_edge_centroids, _normalize_xyz, \
+    _lonlat_rad_to_xyz, _xyz_to_lonlat_deg
 
 current_path = Path(os.path.dirname(os.path.realpath(__file__)))
 
@@ -72,6 +73,80 @@ class TestCentroids(TestCase):
         nt.assert_array_almost_equal(expected_face_x, computed_face_x)
         nt.assert_array_almost_equal(expected_face_y, computed_face_y)
 
+    def test_face_xyz_from_latlon_scrip(self):
+        """Cartesian centroids derived from the spherical ones stored in a
+        SCRIP dataset."""
+        uxgrid = ux.open_grid(gridfile_CSne8)
+
+        face_lon, face_lat = _xyz_to_lonlat_deg(uxgrid.face_x.values,
+                                                uxgrid.face_y.values,
+                                                uxgrid.face_z.values)
+
+        nt.assert_array_almost_equal(face_lon, uxgrid.face_lon.values)
+        nt.assert_array_almost_equal(face_lat, uxgrid.face_lat.values)
+
+    def test_spherical_centroid_triangle(self):
+        """Spherical centroid of a triangle compared to the area-weighted
+        average of the centroids of its subdivisions."""
+        lonlat = np.deg2rad([[0.0, 0.0], [60.0, 10.0], [20.0, 70.0]])
+        verts = np.array([_lonlat_rad_to_xyz(*v) for v in lonlat])
+
+        def subdivide(a, b, c, level):
+            if level == 0:
+                area = 2 * np.arctan2(abs(np.dot(a, np.cross(b, c))),
+                                      1 + a @ b + b @ c + c @ a)
+                centroid = a + b + c
+                return area * centroid / np.linalg.norm(centroid)
+            ab, bc, ca = (a + b, b + c, c + a)
+            ab, bc, ca = (ab / np.linalg.norm(ab), bc / np.linalg.norm(bc),
+                          ca / np.linalg.norm(ca))
+            return (subdivide(a, ab, ca, level - 1) +
+                    subdivide(ab, b, bc, level - 1) +
+                    subdivide(ca, bc, c, level - 1) +
+                    subdivide(ab, bc, ca, level - 1))
+
+        expected = subdivide(*verts, 6)
+        expected /= np.linalg.norm(expected)
+
+        # both orientations of the face
+        for face in [verts, verts[::-1]]:
+            uxgrid = ux.open_grid(face)
+            uxgrid.compute_face_centroids(method="spherical")
+
+            nt.assert_array_almost_equal(
+                [uxgrid.face_x[0], uxgrid.face_y[0], uxgrid.face_z[0]],
+                expected)
+
+        # the cartesian average is offset from the spherical centroid
+        assert np.linalg.norm(
+            np.mean(verts, axis=0) / np.linalg.norm(np.mean(verts, axis=0)) -
+            expected) > 1e-3
+
+    def test_spherical_centroids_mpas(self):
+        """Spherical centroids of a symmetric grid are close to its cartesian
+        average centroids."""
+        uxgrid = ux.open_grid(mpasfile_QU)
+
+        uxgrid.compute_face_centroids(method="cartesian average")
+        face_xyz = np.stack(
+            [uxgrid.face_x.values, uxgrid.face_y.values, uxgrid.face_z.values])
+
+        uxgrid.compute_face_centroids(method="spherical")
+        spherical_face_xyz = np.stack(
+            [uxgrid.face_x.values, uxgrid.face_y.values, uxgrid.face_z.values])
+
+        nt.assert_array_almost_equal(np.linalg.norm(spherical_face_xyz, axis=0), 1.0)
+        nt.assert_array_almost_equal(spherical_face_xyz, face_xyz, decimal=2)
+
+        face_lon, face_lat = _xyz_to_lonlat_deg(*spherical_face_xyz)
+        nt.assert_array_almost_equal(face_lat, uxgrid.face_lat.values)
+
+    def test_invalid_centroid_method(self):
+        uxgrid = ux.open_grid(mpasfile_QU)
+
+        with self.assertRaises(ValueError):
+            uxgrid.compute_face_centroids(method="invalid")
+
     def test_edge_centroids_from_triangle(self):
         """Test finding the centroid of a triangle."""
         # Create a triangle
@@ -62,6 +62,24 @@ class TestFMAOperations(TestCase):
         self.assertEqual(y, pyfma.fma(a, b, -x))
         self.assertAlmostEqual(a * b, x + y, places=15)
 
+    def test_two_prod_split(self):
+        """Test the compiled two_prod_split function against two_prod_fma."""
+        a = 0.1
+        b = 3.0
+        x, y = ac_utils._two_prod_fma(a, b)
+        xs, ys = ac_utils._two_prod_split(a, b)
+        self.assertEqual(x, xs)
+        self.assertEqual(y, ys)
+
+    def test_cross_split(self):
+        """Test the compiled cross product against cross_fma."""
+        v1 = np.array(_normalize_xyz(*[1.0, 2.0, 3.0]))
+        v2 = np.array(_normalize_xyz(*[4.0, 5.0, 6.0]))
+
+        split_cross = ac_utils._cross_split(*v1, *v2)
+        fma_cross = ac_utils.cross_fma(v1, v2)
+        nt.assert_allclose(split_cross, fma_cross, atol=ERROR_TOLERANCE)
+
     def test_fast_two_mult(self):
         """Test the two_prod_fma function."""
         a = 1.0
@@ -127,3 +145,53 @@ class TestNorm(TestCase):
         a = 10.0
         res = ac_utils._two_square(a)
         self.assertAlmostEqual(a * a, res[0], places=15)
+
+
+class TestBatch(TestCase):
+    """Tests that the compiled array versions match the scalar operations."""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.v1 = rng.standard_normal((50, 3))
+        self.v2 = rng.standard_normal((50, 3))
+
+    def test_cross_fma_batch(self):
+        res = ac_utils.cross_fma_batch(self.v1, self.v2)
+        expected = np.array(
+            [ac_utils.cross_fma(a, b) for a, b in zip(self.v1, self.v2)])
+        nt.assert_allclose(res, expected, rtol=0, atol=ERROR_TOLERANCE)
+
+        # broadcasting a single vector
+        res = ac_utils.cross_fma_batch(self.v1, self.v2[0])
+        self.assertEqual(res.shape, (50, 3))
+
+    def test_dot_fma_batch(self):
+        res = ac_utils.dot_fma_batch(self.v1, self.v2)
+        expected = [ac_utils.dot_fma(a, b) for a, b in zip(self.v1, self.v2)]
+        nt.assert_array_equal(res, expected)
+
+    def test_vec_sum_batch(self):
+        res = ac_utils._vec_sum_batch(self.v1)
+        expected = [ac_utils._vec_sum(a) for a in self.v1]
+        nt.assert_array_equal(res, expected)
+
+    def test_comp_prod_batch(self):
+        res = ac_utils._comp_prod_batch(self.v1)
+        expected = [ac_utils._comp_prod_fma(a) for a in self.v1]
+        nt.assert_allclose(res, expected, rtol=0, atol=ERROR_TOLERANCE)
+
+    def test_norm_faithful_batch(self):
+        res = ac_utils._norm_faithful_batch(self.v1)
+        expected = [ac_utils._norm_faithful(a) for a in self.v1]
+        nt.assert_array_equal(res, expected)
+
+    def test_two_prod_batch(self):
+        x, y = ac_utils._two_prod_batch(self.v1, self.v2)
+        for a, b, xi, yi in zip(self.v1.ravel(), self.v2.ravel(), x.ravel(),
+                                y.ravel()):
+            self.assertEqual((xi, yi), ac_utils._two_prod_fma(a, b))
+
+    def test_acc_sqrt_batch(self):
+        res = ac_utils._acc_sqrt_batch([9.0, 10.0], [0.0, 0.0])
+        nt.assert_array_equal(res, [ac_utils._acc_sqrt(9.0, 0.0),
+                                    ac_utils._acc_sqrt(10.0, 0.0)])
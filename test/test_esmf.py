@@ -45,3 +45,33 @@ def test_read_esmf_dataset():
 
     for dim in dims:
         assert dim in uxds.dims
+
+def test_read_esmf_padded_elements():
+    """Tests the conversion of ``elementConn`` with padded elements to a
+    zero-indexed ``face_node_connectivity``."""
+    import numpy as np
+    import xarray as xr
+    import numpy.testing as nt
+
+    from uxarray.constants import INT_FILL_VALUE
+    from uxarray.io._esmf import _read_esmf
+
+    node_coords = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0],
+                            [2.0, 0.0]])
+    element_conn = np.array([[1, 2, 3, 4], [2, 5, 3, np.nan]])
+
+    in_ds = xr.Dataset({
+        "nodeCoords": xr.DataArray(node_coords,
+                                   dims=["nodeCount", "coordDim"],
+                                   attrs={"units": "degrees"}),
+        "elementConn": xr.DataArray(element_conn,
+                                    dims=["elementCount", "maxNodePElement"]),
+        "numElementConn": xr.DataArray(np.array([4, 3], dtype=np.int8),
+                                       dims=["elementCount"]),
+    })
+
+    out_ds, _ = _read_esmf(in_ds)
+
+    nt.assert_array_equal(out_ds["face_node_connectivity"].values,
+                          [[0, 1, 2, 3], [1, 4, 2, INT_FILL_VALUE]])
+    nt.assert_array_equal(out_ds["n_nodes_per_face"].values, [4, 3])
@@ -30,6 +30,31 @@ class TestExodus(TestCase):
     def test_encode_exodus(self):
         """Read a UGRID dataset and encode that as an Exodus format."""
 
+    def test_encode_exodus_blocks(self):
+        """Encodes a grid with triangles and quadrilaterals, checking that
+        faces are grouped into one element block per face type."""
+        node_lon = np.array([0.0, 10.0, 10.0, 0.0, 20.0])
+        node_lat = np.array([0.0, 0.0, 10.0, 10.0, 5.0])
+        face_node_connectivity = np.array([[0, 1, 2, 3],
+                                           [1, 4, 2, INT_FILL_VALUE],
+                                           [0, 1, 3, INT_FILL_VALUE]])
+
+        uxgrid = ux.Grid.from_topology(node_lon,
+                                       node_lat,
+                                       face_node_connectivity,
+                                       fill_value=INT_FILL_VALUE)
+
+        exo_ds = uxgrid.to_xarray("exodus")
+
+        assert exo_ds["connect1"].attrs["elem_type"] == "TRI"
+        assert exo_ds["connect2"].attrs["elem_type"] == "SHELL4"
+
+        np.testing.assert_array_equal(exo_ds["connect1"].values,
+                                      [[2, 5, 3], [1, 2, 4]])
+        np.testing.assert_array_equal(exo_ds["connect2"].values,
+                                      [[1, 2, 3, 4]])
+        np.testing.assert_array_equal(exo_ds["global_id2"].values, [3])
+
     def test_mixed_exodus(self):
         """Read/write an exodus file with two types of faces (triangle and
         quadrilaterals) and writes a ugrid file."""
@@ -12,7 +12,9 @@ import uxarray.utils.computing as ac_utils
 from uxarray.grid.coordinates import _populate_node_latlon, _lonlat_rad_to_xyz, _normalize_xyz, _xyz_to_lonlat_rad
 from uxarray.grid.arcs import extreme_gca_latitude
 from uxarray.grid.utils import _get_cartesian_face_edge_nodes, _get_lonlat_rad_face_edge_nodes
-from uxarray.grid.geometry import _populate_face_latlon_bound, _populate_bounds
+from uxarray.grid.geometry import (_populate_face_latlon_bound, _populate_bounds, _build_polygon_shells,
+                                   _build_corrected_polygon_shells, _build_trimesh, _build_edge_segments,
+                                   _get_edge_segments, _face_edges_follow_nodes)
 
 from spatialpandas.geometry import MultiPolygon
 
@@ -24,6 +26,8 @@ datafile_CSne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne3
 gridfile_geoflow = current_path / "meshfiles" / "ugrid" / "geoflow-small" / "grid.nc"
 datafile_geoflow = current_path / "meshfiles" / "ugrid" / "geoflow-small" / "v1.nc"
 
+gridfile_mpas = current_path / 'meshfiles' / "mpas" / "QU" / 'mesh.QU.1920km.151026.nc'
+
 grid_files = [gridfile_CSne8, gridfile_geoflow]
 data_files = [datafile_CSne30, datafile_geoflow]
 
@@ -48,6 +52,45 @@ class TestAntimeridian(TestCase):
 
         assert len(uxgrid.antimeridian_face_indices) == 1
 
+    def test_split_shells(self):
+        """Faces that cross the antimeridian are split into shells on either
+        side of it, while faces touching it or a pole are kept whole."""
+        verts = [[[-170, 40], [180, 30], [165, 25], [-170, 20]],
+                 [[-170, 40], [180, 30], [-170, 20], [-170, 20]],
+                 [[0, 90], [90, 87], [135, 85], [-180, 87]],
+                 [[10, 10], [20, 10], [20, 20], [10, 20]]]
+
+        uxgrid = ux.open_grid(verts, latlon=True)
+
+        polygon_shells = _build_polygon_shells(uxgrid.node_lon.values, uxgrid.node_lat.values,
+                                               uxgrid.face_node_connectivity.values, uxgrid.n_face,
+                                               uxgrid.n_max_face_nodes, uxgrid.n_nodes_per_face.values)
+
+        corrected_shells, corrected_to_original = _build_corrected_polygon_shells(polygon_shells)
+
+        nt.assert_array_equal(uxgrid.antimeridian_face_indices, [0, 1, 2])
+        nt.assert_array_equal(corrected_to_original, [0, 0, 1, 2, 3])
+
+        # split shells are on opposite sides of the antimeridian
+        nt.assert_allclose(corrected_shells[0, :, 0].max(), 180.0)
+        nt.assert_allclose(corrected_shells[0, :, 0].min(), 165.0)
+        nt.assert_allclose(corrected_shells[1, :, 0].min(), -180.0)
+        nt.assert_allclose(corrected_shells[1, :, 0].max(), -170.0)
+        nt.assert_allclose(corrected_shells[2, :, 0].min(), -180.0)
+
+        # the pole vertex is stretched along the pole
+        nt.assert_allclose(np.unique(corrected_shells[3, corrected_shells[3, :, 1] == 90, 0]), [90.0, 180.0])
+
+        # faces that do not cross the antimeridian are unchanged
+        nt.assert_allclose(corrected_shells[4, :polygon_shells.shape[1]], polygon_shells[3])
+
+        # each shell is closed
+        nt.assert_array_equal(corrected_shells[:, 0], corrected_shells[:, -1])
+
+        gdf = uxgrid.to_geodataframe()
+        assert len(gdf) == uxgrid.n_face
+        assert len(gdf.geometry.values[0].to_shapely().geoms) == 2
+
 
 class TestLineCollection(TestCase):
 
@@ -55,6 +98,31 @@ class TestLineCollection(TestCase):
         uxgrid = ux.open_grid(gridfile_CSne8)
         lines = uxgrid.to_linecollection()
 
+        # each edge is drawn once, with antimeridian edges split in two
+        _, antimeridian_edge_indices = _get_edge_segments(uxgrid)
+        assert len(lines.get_segments()) == uxgrid.n_edge + len(antimeridian_edge_indices)
+
+    def test_edge_segments(self):
+        node_lon = np.array([170.0, -170.0, 0.0, 10.0])
+        node_lat = np.array([0.0, 10.0, 90.0, 0.0])
+        edge_node_connectivity = np.array([[0, 1], [1, 0], [2, 3], [3, 0]])
+
+        edge_segments, antimeridian_edge_indices = _build_edge_segments(node_lon, node_lat,
+                                                                        edge_node_connectivity)
+
+        nt.assert_array_equal(antimeridian_edge_indices, [0, 1])
+
+        expected = np.array([
+            [[170.0, 0.0], [180.0, 5.0]],
+            [[-170.0, 10.0], [-180.0, 5.0]],
+            # edges to a pole lie along the meridian of their other node
+            [[10.0, 90.0], [10.0, 0.0]],
+            [[10.0, 0.0], [170.0, 0.0]],
+            [[-180.0, 5.0], [-170.0, 10.0]],
+            [[180.0, 5.0], [170.0, 0.0]],
+        ])
+        nt.assert_allclose(edge_segments, expected)
+
 
 class TestPredicate(TestCase):
 
@@ -925,6 +993,33 @@ class TestLatlonBoundsMix(TestCase):
             nt.assert_allclose(face_bounds[i], expected_bounds[i], atol=ERROR_TOLERANCE)
 
 
+    def test_populate_bounds_edge_order(self):
+        """The cached latitude extremes of the edges are only used for faces
+        whose edges follow their nodes."""
+        face_1 = [[10.0, 60.0], [10.0, 10.0], [50.0, 10.0], [50.0, 60.0]]
+        face_2 = [[350, 60.0], [350, 10.0], [50.0, 10.0], [50.0, 60.0]]
+        face_3 = [[210.0, 80.0], [350.0, 60.0], [10.0, 60.0], [30.0, 80.0]]
+
+        def bounds(edge_order, extremes_offset):
+            grid = ux.Grid.from_face_vertices([face_1, face_2, face_3], latlon=True)
+            grid._ds["face_edge_connectivity"] = grid.face_edge_connectivity[:, edge_order]
+            grid._ds["edge_latitude_extremes"] = grid.edge_latitude_extremes + extremes_offset
+            edges_follow_nodes = _face_edges_follow_nodes(grid.face_node_connectivity.values,
+                                                          grid.face_edge_connectivity.values,
+                                                          grid.edge_node_connectivity.values)
+            return edges_follow_nodes, _populate_bounds(grid, return_array=True).values
+
+        # edges that follow the nodes use the cached extremes
+        edges_follow_nodes, face_bounds = bounds([0, 1, 2, 3], 0.0)
+        assert edges_follow_nodes.all()
+        assert not np.allclose(bounds([0, 1, 2, 3], -0.05)[1], face_bounds)
+
+        # edges in a different order compute their own extremes
+        edges_follow_nodes, face_bounds = bounds([0, 3, 2, 1], 0.0)
+        assert not edges_follow_nodes.any()
+        nt.assert_array_equal(bounds([0, 3, 2, 1], -0.05)[1], face_bounds)
+
+
 class TestGeoDataFrame(TestCase):
 
     def test_to_gdf(self):
@@ -963,3 +1058,235 @@ class TestGeoDataFrame(TestCase):
         gdf_f = uxgrid.to_geodataframe(exclude_antimeridian=True)
 
         assert gdf_f is not gdf_e
+
+    def test_trimmed_shells(self):
+        """Shells of faces with fewer than the maximum number of nodes are
+        trimmed instead of padded with repeated vertices."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        gdf = uxgrid.to_geodataframe(exclude_antimeridian=True)
+
+        n_nodes_per_face = np.delete(uxgrid.n_nodes_per_face.values, uxgrid.antimeridian_face_indices)
+
+        # each ring is closed with a single repeated vertex
+        nt.assert_array_equal(np.diff(gdf.geometry.array.buffer_inner_offsets), 2 * (n_nodes_per_face + 1))
+
+    def test_partitioned_gdf(self):
+        """Partitioned construction matches the GeoDataFrame that is
+        constructed at once."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        for exclude_antimeridian in [False, True]:
+            gdf = uxgrid.to_geodataframe(exclude_antimeridian=exclude_antimeridian)
+            partitioned_gdf = uxgrid.to_geodataframe(exclude_antimeridian=exclude_antimeridian, npartitions=4)
+
+            assert partitioned_gdf.npartitions == 4
+
+            computed_gdf = partitioned_gdf.compute()
+            assert len(computed_gdf) == len(gdf)
+            nt.assert_allclose(computed_gdf.geometry.array.area, gdf.geometry.array.area, rtol=1e-5)
+
+        # partitions are indexed by face
+        nt.assert_array_equal(computed_gdf.index.values,
+                              np.delete(np.arange(uxgrid.n_face), uxgrid.antimeridian_face_indices))
+
+        # each partition contains at least one face
+        partitioned_gdf = uxgrid.to_geodataframe(npartitions=uxgrid.n_face + 10)
+        assert partitioned_gdf.npartitions == uxgrid.n_face
+        assert len(partitioned_gdf.compute()) == uxgrid.n_face
+
+        with self.assertRaises(ValueError):
+            uxgrid.to_geodataframe(npartitions=0)
+
+
+class TestGeometryCache(TestCase):
+
+    def test_shared_geometry(self):
+        """Polygon shells are constructed once and shared by every geometry
+        export."""
+        uxgrid = ux.open_grid(gridfile_geoflow)
+
+        poly_collection, corrected_to_original = uxgrid.to_polycollection()
+        polygon_shells = uxgrid._geometry_cache["polygon_shells"]
+        corrected_shells = uxgrid._geometry_cache["corrected_polygon_shells"]
+
+        uxgrid.to_linecollection()
+        uxgrid.to_geodataframe()
+        uxgrid.to_geodataframe(exclude_antimeridian=True)
+
+        assert uxgrid._geometry_cache["polygon_shells"] is polygon_shells
+        assert uxgrid._geometry_cache["corrected_polygon_shells"] is corrected_shells
+
+        # cached poly collections are returned along with their original face indices
+        cached_poly_collection, cached_corrected_to_original = uxgrid.to_polycollection()
+        assert cached_poly_collection is poly_collection
+        nt.assert_array_equal(cached_corrected_to_original, corrected_to_original)
+
+        nbytes = uxgrid.geometry_cache_nbytes
+        assert nbytes["polygon_shells"] == polygon_shells.nbytes
+        for key in ["geodataframe", "geodataframe_exclude_antimeridian", "poly_collection", "line_collection"]:
+            assert nbytes[key] > 0
+
+        # tuples are measured by their members, and other objects by their size
+        uxgrid._geometry_cache["tuple_entry"] = (polygon_shells, [corrected_shells])
+        uxgrid._geometry_cache["object_entry"] = "entry"
+        nbytes = uxgrid.geometry_cache_nbytes
+        assert nbytes["tuple_entry"] == polygon_shells.nbytes + corrected_shells.nbytes
+        assert nbytes["object_entry"] > 0
+
+        uxgrid.clear_geometry_cache()
+        assert uxgrid.geometry_cache_nbytes == {}
+
+        # line collections are constructed from the edges, without polygon shells
+        assert uxgrid.to_linecollection() is not None
+        assert "polygon_shells" not in uxgrid._geometry_cache
+
+    def test_projected_geometry(self):
+        """Projected coordinates and polygons are transformed once for each
+        projection."""
+        import cartopy.crs as ccrs
+        from uxarray.grid.geometry import _get_projected_coordinates, _get_projected_polygon_shells
+
+        uxgrid = ux.open_grid(gridfile_CSne8)
+        projection = ccrs.Robinson()
+
+        projected_faces = _get_projected_coordinates(uxgrid, "face", projection)
+        expected = projection.transform_points(ccrs.PlateCarree(), uxgrid.face_lon.values,
+                                               uxgrid.face_lat.values)[:, :2]
+        nt.assert_allclose(projected_faces, expected)
+        assert _get_projected_coordinates(uxgrid, "face", projection) is projected_faces
+        assert _get_projected_coordinates(uxgrid, "face", ccrs.Mollweide()) is not projected_faces
+
+        gdf = uxgrid.to_geodataframe(projection=projection)
+        assert len(gdf) == uxgrid.n_face
+        assert uxgrid.to_geodataframe(projection=projection) is gdf
+        assert uxgrid.to_geodataframe() is not gdf
+
+        # polygons are in projected coordinates
+        x_min, y_min, x_max, y_max = gdf.geometry.total_bounds
+        assert x_max > 180 and y_max > 90
+
+        gdf_exclude = uxgrid.to_geodataframe(projection=projection, exclude_antimeridian=True)
+        assert len(gdf_exclude) == uxgrid.n_face - len(uxgrid.antimeridian_face_indices)
+
+        # projected shells are cached as separate arrays, which are included in the memory of the cache
+        uxgrid.to_raster_lookup(100, 50, projection=projection)
+        nbytes = uxgrid.geometry_cache_nbytes
+        projected_shells, shell_faces, seam_face_indices = _get_projected_polygon_shells(uxgrid, projection)
+        assert nbytes[("projected_polygon_shells", projection.proj4_init)] == projected_shells.nbytes
+        assert nbytes[("projected_polygon_shell_faces", projection.proj4_init)] == shell_faces.nbytes
+        assert nbytes[("projected_seam_face_indices", projection.proj4_init)] == seam_face_indices.nbytes
+
+    def test_projected_geometry_central_longitude(self):
+        """Polygons are split at the seam of a projection with a shifted
+        central longitude instead of the antimeridian."""
+        import cartopy.crs as ccrs
+        from uxarray.grid.geometry import _get_projected_polygon_shells
+
+        uxgrid = ux.open_grid(gridfile_CSne8)
+
+        for projection in [ccrs.Robinson(central_longitude=180), ccrs.PlateCarree(central_longitude=-77.5)]:
+            x_width = projection.x_limits[1] - projection.x_limits[0]
+
+            projected_shells, shell_faces, _ = _get_projected_polygon_shells(uxgrid, projection)
+            nt.assert_array_equal(np.unique(shell_faces), np.arange(uxgrid.n_face))
+
+            # no shell is stretched across the map
+            shell_widths = projected_shells[..., 0].max(axis=1) - projected_shells[..., 0].min(axis=1)
+            assert shell_widths.max() < x_width / 2
+
+            # partitions are split at the same seam
+            gdf = uxgrid.to_geodataframe(projection=projection)
+            partitioned_gdf = uxgrid.to_geodataframe(projection=projection, npartitions=3).compute()
+            assert len(gdf) == len(partitioned_gdf) == uxgrid.n_face
+            nt.assert_allclose(partitioned_gdf.geometry.bounds.values, gdf.geometry.bounds.values)
+
+
+class TestTrimesh(TestCase):
+
+    def test_fan_triangulation(self):
+        """Each face with n nodes is split into n - 2 triangles, with a shifted
+        copy of each triangle that crosses the antimeridian."""
+        node_lon = np.array([0.0, 10.0, 10.0, 0.0, 5.0, 170.0, -170.0, -170.0, 170.0])
+        node_lat = np.array([0.0, 0.0, 10.0, 10.0, 15.0, 0.0, 0.0, 10.0, 10.0])
+        face_nodes = np.array([[0, 1, 2, 4, 3], [5, 6, 7, 8, INT_FILL_VALUE]])
+        n_nodes_per_face = np.array([5, 4])
+
+        triangles, triangle_faces, vertices, vertex_nodes = _build_trimesh(
+            node_lon, node_lat, face_nodes, n_nodes_per_face)
+
+        # three triangles for the pentagon and two east and two west copies for the quadrilateral
+        nt.assert_array_equal(np.bincount(triangle_faces), [3, 4])
+        nt.assert_array_equal(triangles[triangle_faces == 0], [[0, 1, 2], [0, 2, 4], [0, 4, 3]])
+
+        # vertices of the triangles that cross the antimeridian are contiguous in longitude
+        triangle_lon = vertices[triangles[triangle_faces == 1], 0]
+        assert np.all(triangle_lon.max(axis=1) - triangle_lon.min(axis=1) < 180)
+        nt.assert_array_equal(np.sort(triangle_lon.min(axis=1)), [-190, -190, 170, 170])
+
+        # every vertex maps back to a node with the same latitude
+        nt.assert_array_equal(vertices[:, 1], node_lat[vertex_nodes])
+
+    def test_pole_faces(self):
+        """Faces that touch or encircle a pole are extended along it."""
+        # a triangle with a node on the north pole
+        node_lon = np.array([0.0, 10.0, 0.0])
+        node_lat = np.array([80.0, 80.0, 90.0])
+        face_nodes = np.array([[0, 1, 2]])
+
+        triangles, triangle_faces, vertices, vertex_nodes = _build_trimesh(
+            node_lon, node_lat, face_nodes, np.array([3]))
+
+        assert triangles.shape[0] == 2
+        pole_vertices = np.unique(triangles[np.isclose(vertices[triangles, 1], 90.0)])
+        nt.assert_array_equal(np.sort(vertices[pole_vertices, 0]), [0.0, 10.0])
+        nt.assert_array_equal(vertex_nodes[pole_vertices], [2, 2])
+
+        # a square that encircles the south pole
+        node_lon = np.array([0.0, 90.0, 180.0, -90.0])
+        node_lat = np.full(4, -80.0)
+        face_nodes = np.array([[3, 2, 1, 0]])
+
+        triangles, triangle_faces, vertices, vertex_nodes = _build_trimesh(
+            node_lon, node_lat, face_nodes, np.array([4]))
+
+        # two triangles between each edge and the pole, covering every longitude
+        assert np.all(vertices[:, 1][triangles].min(axis=1) == -90.0)
+        triangle_lon = vertices[triangles, 0]
+        assert np.all(triangle_lon.max(axis=1) - triangle_lon.min(axis=1) <= 180)
+        nt.assert_array_equal(np.unique(vertex_nodes), np.arange(4))
+
+
+class TestRasterLookup(TestCase):
+
+    def test_raster_lookup(self):
+        """The face that covers each pixel is computed once for each canvas,
+        and the pixel that contains the center of each face maps to it."""
+        uxgrid = ux.open_grid(gridfile_CSne8)
+
+        raster_lookup = uxgrid.to_raster_lookup(width=360, height=180)
+        assert raster_lookup.shape == (180, 360)
+        assert uxgrid.to_raster_lookup(width=360, height=180) is raster_lookup
+        assert uxgrid.to_raster_lookup(width=180, height=90) is not raster_lookup
+
+        # first row at the top of the canvas
+        row = np.clip((90 - uxgrid.face_lat.values).astype(int), 0, 179)
+        col = np.clip((uxgrid.face_lon.values + 180).astype(int), 0, 359)
+        nt.assert_array_equal(raster_lookup[row, col], np.arange(uxgrid.n_face))
+
+    def test_to_raster(self):
+        """Rasterized data is the data of the face that covers each pixel,
+        for every slice along the other dimensions."""
+        uxgrid = ux.open_grid(gridfile_CSne8)
+        data = np.arange(2 * uxgrid.n_face, dtype=np.float64).reshape(2, uxgrid.n_face)
+        uxda = ux.UxDataArray(data, dims=["time", "n_face"], uxgrid=uxgrid, name="var")
+
+        raster = uxda.to_raster(width=72, height=36)
+        raster_lookup = uxgrid.to_raster_lookup(width=72, height=36)
+
+        assert raster.dims == ("time", "y", "x")
+        covered = raster_lookup != INT_FILL_VALUE
+        nt.assert_array_equal(raster.values[1][covered], data[1][raster_lookup[covered]])
+        assert np.isnan(raster.values[0][~covered]).all()
+        nt.assert_allclose(raster.x.values[[0, -1]], [-177.5, 177.5])
+        nt.assert_allclose(raster.y.values[[0, -1]], [87.5, -87.5])
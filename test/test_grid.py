@@ -15,6 +15,7 @@ from uxarray.grid.coordinates import _populate_node_latlon, _lonlat_rad_to_xyz
 from uxarray.constants import INT_FILL_VALUE, ERROR_TOLERANCE
 
 from uxarray.grid.arcs import extreme_gca_latitude
+from uxarray.grid.validation import _find_duplicate_nodes
 
 try:
     import constants
@@ -47,6 +48,59 @@ class TestGrid(TestCase):
         grid_mpas = ux.open_grid(gridfile_mpas)
         assert (grid_mpas.validate())
 
+    def test_validate_report(self):
+        """Test the elements reported by each validation check."""
+        node_lon = np.array([0.0, 10.0, 10.0, 0.0, 0.0, 50.0])
+        node_lat = np.array([0.0, 0.0, 10.0, 10.0, 0.0, 50.0])
+
+        # valid faces, with a duplicate and a dangling node
+        uxgrid = ux.Grid.from_topology(node_lon, node_lat, np.array([[0, 1, 2], [0, 2, 3]]))
+        report = uxgrid.validate(report=True)
+
+        assert not report["valid"]
+        nt.assert_array_equal(report["duplicate_nodes"], [4])
+        nt.assert_array_equal(report["dangling_nodes"], [4, 5])
+        assert report["non_manifold_edges"].shape == (0, 2)
+        assert report["inconsistent_edges"].shape == (0, 2)
+        assert report["degenerate_faces"].size == 0
+
+        with self.assertRaises(RuntimeError):
+            uxgrid.validate()
+
+        # the second face is oriented clockwise
+        uxgrid = ux.Grid.from_topology(node_lon[:4], node_lat[:4], np.array([[0, 1, 2], [0, 3, 2]]))
+        report = uxgrid.validate(report=True)
+        nt.assert_array_equal(report["inconsistent_edges"], [[2, 0]])
+
+        # an edge shared by three faces
+        uxgrid = ux.Grid.from_topology(np.array([0.0, 10.0, 10.0, 0.0, -10.0]),
+                                       np.array([0.0, 0.0, 10.0, 10.0, 5.0]),
+                                       np.array([[0, 1, 2], [0, 2, 3], [0, 2, 4]]))
+        report = uxgrid.validate(report=True)
+        nt.assert_array_equal(report["non_manifold_edges"], [[0, 2]])
+
+        # a face with all of its nodes on the equator
+        uxgrid = ux.Grid.from_topology(np.array([0.0, 10.0, 20.0]),
+                                       np.array([0.0, 0.0, 0.0]),
+                                       np.array([[0, 1, 2]]))
+        report = uxgrid.validate(report=True)
+        nt.assert_array_equal(report["degenerate_faces"], [0])
+
+    def test_find_duplicate_nodes(self):
+        """Duplicate nodes are found within the tolerance, including on a grid
+        without any nodes."""
+        uxgrid = ux.Grid.from_topology(np.array([0.0, 10.0, 10.0, 1e-12]),
+                                       np.array([0.0, 0.0, 10.0, 0.0]),
+                                       np.array([[0, 1, 2], [3, 1, 2]]))
+        nt.assert_array_equal(_find_duplicate_nodes(uxgrid), [3])
+        assert _find_duplicate_nodes(uxgrid, tolerance=1e-20).size == 0
+
+        # the nodes are removed after their Cartesian coordinates are constructed
+        uxgrid.node_x
+        uxgrid._ds = uxgrid._ds.isel(n_node=slice(0, 0))
+        assert uxgrid.n_node == 0
+        assert _find_duplicate_nodes(uxgrid).size == 0
+
     def test_encode_as(self):
         """Reads a ugrid file and encodes it as `xarray.Dataset` in various
         types."""
@@ -287,6 +341,31 @@ class TestOperators(TestCase):
         """Test Not Equals ('!=') operator."""
         assert self.grid_CSne30_01 != self.grid_RLL1deg
 
+    def test_fingerprint(self):
+        """Grids with the same topology share a fingerprint, which changes with
+        either their coordinates or connectivity."""
+        assert self.grid_CSne30_01.fingerprint == self.grid_CSne30_02.fingerprint
+        assert self.grid_CSne30_01.fingerprint != self.grid_RLL1deg.fingerprint
+        assert self.grid_CSne30_01.copy().fingerprint == self.grid_CSne30_01.fingerprint
+
+        # only the latitude of a single node differs
+        grid_ds = self.grid_CSne30_01._ds[["node_lon", "node_lat", "face_node_connectivity"]].copy(deep=True)
+        grid_ds["node_lat"][0] += 1.0
+        modified_grid = ux.Grid(grid_ds, source_grid_spec=self.grid_CSne30_01.source_grid_spec)
+
+        assert modified_grid != self.grid_CSne30_01
+
+        # same faces, but a different order of the stored edges
+        grid_ds = self.grid_CSne30_01._ds[["node_lon", "node_lat", "face_node_connectivity"]].copy(deep=True)
+        grid_ds["edge_node_connectivity"] = self.grid_CSne30_01.edge_node_connectivity.copy(deep=True)
+        grid_with_edges = ux.Grid(grid_ds, source_grid_spec=self.grid_CSne30_01.source_grid_spec)
+
+        reordered_ds = grid_ds.copy(deep=True)
+        reordered_ds["edge_node_connectivity"].values[:] = reordered_ds["edge_node_connectivity"].values[::-1]
+        grid_with_reordered_edges = ux.Grid(reordered_ds, source_grid_spec=self.grid_CSne30_01.source_grid_spec)
+
+        assert grid_with_edges != grid_with_reordered_edges
+
 
 class TestFaceAreas(TestCase):
     grid_CSne30 = ux.open_grid(gridfile_CSne30)
@@ -911,6 +990,54 @@ class TestClassMethods(TestCase):
 
         single_face_cart = [(0.0,)]
 
+    def test_from_face_vertices_node_tolerance(self):
+        # shared corners that differ by round-off
+        faces_latlon = [[(0.0, 90.0), (-180, 0.0), (0.0, -90)],
+                        [(1e-10, 90.0), (180, 0.0), (0.0, -90 + 1e-10)]]
+
+        uxgrid = ux.Grid.from_face_vertices(faces_latlon, latlon=True)
+        self.assertEqual(uxgrid.n_node, 6)
+
+        uxgrid = ux.Grid.from_face_vertices(faces_latlon,
+                                            latlon=True,
+                                            node_tolerance=1e-8)
+        self.assertEqual(uxgrid.n_node, 4)
+        nt.assert_array_equal(uxgrid.face_node_connectivity.values[0][[0, 2]],
+                              uxgrid.face_node_connectivity.values[1][[0, 2]])
+
+
+    def test_scrip_node_tolerance(self):
+        # corners of neighboring faces that differ by round-off
+        ds = xr.open_dataset(gridfile_CSne8)
+        n_node = ux.open_grid(ds).n_node
+
+        rng = np.random.default_rng(0)
+        for name in ["grid_corner_lat", "grid_corner_lon"]:
+            ds[name] = ds[name] + rng.uniform(-1e-9, 1e-9, ds[name].shape)
+
+        self.assertEqual(ux.open_grid(ds).n_node, ds["grid_corner_lat"].size)
+        self.assertEqual(ux.open_grid(ds, node_tolerance=1e-6).n_node, n_node)
+
+
+class TestEdgeLatitudeExtremes(TestCase):
+
+    def test_edge_latitude_extremes(self):
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        extremes = uxgrid.edge_latitude_extremes
+        self.assertEqual(extremes.shape, (uxgrid.n_edge, 2))
+        self.assertIn("edge_latitude_extremes", uxgrid._ds)
+
+        edge_nodes = uxgrid.edge_node_connectivity.values
+        node_xyz = np.stack([uxgrid.node_x.values, uxgrid.node_y.values,
+                             uxgrid.node_z.values], axis=-1)
+        for edge_idx in range(0, uxgrid.n_edge, 97):
+            gca_cart = node_xyz[edge_nodes[edge_idx]]
+            nt.assert_allclose(extremes.values[edge_idx],
+                               [extreme_gca_latitude(gca_cart, "min"),
+                                extreme_gca_latitude(gca_cart, "max")],
+                               atol=ERROR_TOLERANCE)
+
 
 class TestLatlonBounds(TestCase):
     def test_populate_bounds_GCA_mix(self):
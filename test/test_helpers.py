@@ -14,7 +14,8 @@ from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
 
 from uxarray.grid.coordinates import _lonlat_rad_to_xyz, _normalize_xyz, _xyz_to_lonlat_rad
 from uxarray.grid.arcs import point_within_gca, _angle_of_2_vectors, in_between
-from uxarray.grid.utils import _get_cartesian_face_edge_nodes, _get_lonlat_rad_face_edge_nodes
+from uxarray.grid.utils import _get_cartesian_face_edge_nodes, _get_lonlat_rad_face_edge_nodes, _deduplicate_nodes, \
+    _hash_unique_nodes
 from uxarray.grid.geometry import _pole_point_inside_polygon
 
 try:
@@ -218,6 +219,35 @@ class TestSparseMatrix(TestCase):
         nt.assert_array_equal(nodes_indices, expected_nodes_indices)
 
 
+class TestDeduplicateNodes(TestCase):
+
+    def test_exact_match_unique(self):
+        """Without a tolerance, the unique nodes match ``np.unique``."""
+        rng = np.random.default_rng(0)
+        coords = rng.integers(0, 4, (1000, 3)) * 0.25
+        # negative zeros are the same node as positive zeros
+        coords[rng.random(coords.shape) < 0.1] = -0.0
+
+        unique_coords, inverse_indices = _deduplicate_nodes(coords, fill_value=None)
+        expected_coords, expected_inverse = np.unique(coords, axis=0, return_inverse=True)
+
+        nt.assert_array_equal(unique_coords, expected_coords)
+        nt.assert_array_equal(inverse_indices, expected_inverse.ravel())
+
+    def test_nodes_in_same_cell(self):
+        """Nodes in the same cell that are further apart than the tolerance
+        are kept as separate unique nodes."""
+        keys = np.zeros((4, 1), dtype=np.int64)
+        coords = np.array([[0.0], [0.2], [0.25], [0.05]])
+        probe_offsets = np.array([[0], [-1], [1]], dtype=np.int64)
+
+        unique_indices, inverse_indices = _hash_unique_nodes(keys, coords, np.ones(4, dtype=np.bool_), 0.1,
+                                                             probe_offsets)
+
+        nt.assert_array_equal(unique_indices, [0, 1])
+        nt.assert_array_equal(inverse_indices, [0, 1, 1, 0])
+
+
 class TestOperators(TestCase):
 
     def test_in_between(self):
@@ -9,7 +9,8 @@ import numpy.testing as nt
 
 import uxarray as ux
 from uxarray.grid.coordinates import _lonlat_rad_to_xyz
-from uxarray.grid.integrate import _get_zonal_face_interval, _process_overlapped_intervals, _get_zonal_faces_weight_at_constLat
+from uxarray.grid.integrate import _get_zonal_face_interval, _process_overlapped_intervals, _get_zonal_faces_weight_at_constLat, \
+    _process_overlapped_intervals_batch
 
 current_path = Path(os.path.dirname(os.path.realpath(__file__)))
 
@@ -273,6 +274,28 @@ class TestFaceWeights(TestCase):
         nt.assert_array_equal(overlap_contributions,
                               expected_overlap_contributions)
 
+    def test_process_overlapped_intervals_batch(self):
+        """Overlapped intervals of multiple groups resolved in a single sweep,
+        including a face with overlapping intervals of its own."""
+        starts = np.array([0.0, 50.0, 140.0, 150.0, 260.0, 0.0, 10.0, 50.0])
+        ends = np.array([100.0, 150.0, 150.0, 250.0, 350.0, 40.0, 60.0, 100.0])
+        faces = np.array([0, 1, 2, 3, 4, 0, 0, 1])
+        groups = np.array([0, 0, 0, 0, 0, 1, 1, 1])
+
+        faces_out, contributions, total_length = _process_overlapped_intervals_batch(
+            starts, ends, faces, groups)
+
+        nt.assert_array_equal(total_length, [340.0, 100.0])
+
+        # first group matches ``test_process_overlapped_intervals``
+        nt.assert_array_almost_equal(
+            np.bincount(faces_out[0], weights=contributions[0]),
+            [75.0, 70.0, 5.0, 100.0, 90.0])
+
+        # face 0 is only counted once where its own intervals overlap
+        nt.assert_array_almost_equal(
+            np.bincount(faces_out[1], weights=contributions[1]), [55.0, 45.0])
+
     def test_get_zonal_faces_weight_at_constLat_equator(self):
         face_0 = [[1.7 * np.pi, 0.25 * np.pi], [1.7 * np.pi, 0.0],
                   [0.3 * np.pi, 0.0], [0.3 * np.pi, 0.25 * np.pi]]
@@ -468,3 +491,87 @@ class TestFaceWeights(TestCase):
                                                         np.deg2rad(20),
                                                         latlon_bounds,
                                                         is_directed=False)
+
+
+class TestZonalMean(TestCase):
+    gridfile_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+
+    def test_zonal_weights_regular(self):
+        """Weights of the faces of ``test_get_zonal_faces_weight_at_constLat_regular``
+        computed from a grid."""
+        faces = np.array([
+            [[1.7 * np.pi, 0.25 * np.pi], [1.7 * np.pi, 0.0],
+             [0.3 * np.pi, 0.0], [0.3 * np.pi, 0.25 * np.pi]],
+            [[0.4 * np.pi, 0.3 * np.pi], [0.4 * np.pi, 0.0],
+             [0.5 * np.pi, 0.0], [0.5 * np.pi, 0.3 * np.pi]],
+            [[0.5 * np.pi, 0.25 * np.pi], [0.5 * np.pi, 0.0], [np.pi, 0.0],
+             [np.pi, 0.25 * np.pi]],
+            [[1.2 * np.pi, 0.25 * np.pi], [1.2 * np.pi, 0.0],
+             [1.6 * np.pi, -0.01 * np.pi], [1.6 * np.pi, 0.25 * np.pi]],
+        ])
+
+        uxgrid = ux.Grid.from_face_vertices(np.rad2deg(faces), latlon=True)
+
+        weights = uxgrid._get_zonal_weights([18.0]).toarray()
+
+        nt.assert_array_almost_equal(weights[0], [0.375, 0.0625, 0.3125, 0.25],
+                                     decimal=3)
+
+    def test_zonal_weights_sum(self):
+        """The weights at each latitude of a global grid sum to one, including
+        at the poles."""
+        uxgrid = ux.open_grid(self.gridfile_ne30)
+
+        weights = uxgrid._get_zonal_weights(np.arange(-90, 91, 5.0))
+
+        nt.assert_array_almost_equal(np.asarray(weights.sum(axis=1)).ravel(),
+                                     1.0)
+
+        # the weights are only computed once for each set of latitudes
+        assert uxgrid._get_zonal_weights(np.arange(-90, 91, 5.0)) is weights
+
+    def test_zonal_mean_constant(self):
+        """Zonal mean of a constant field."""
+        uxgrid = ux.open_grid(self.gridfile_ne30)
+
+        uxda = ux.UxDataArray(data=np.ones(uxgrid.n_face),
+                              dims=["n_face"],
+                              uxgrid=uxgrid,
+                              name='var2')
+
+        zonal_mean = uxda.zonal_mean()
+
+        assert zonal_mean.dims == ("latitudes",)
+        nt.assert_array_equal(zonal_mean.latitudes, np.arange(-90, 91, 10.0))
+        nt.assert_array_almost_equal(zonal_mean, 1.0)
+        assert zonal_mean.name == "var2_zonal_mean"
+
+        # names that are not strings are formatted
+        uxda.name = 2
+        assert uxda.zonal_mean().name == "2_zonal_mean"
+
+    def test_zonal_mean_dask(self):
+        """Zonal mean of chunked multi-dimensional data."""
+        uxgrid = ux.open_grid(self.gridfile_ne30)
+
+        data = np.random.random((3, 2, uxgrid.n_face))
+        uxda = ux.UxDataArray(data=data,
+                              dims=["time", "lev", "n_face"],
+                              uxgrid=uxgrid)
+
+        expected = uxda.zonal_mean(lat=[-45.0, 0.0, 30.0])
+        zonal_mean = uxda.chunk({"time": 1}).zonal_mean(lat=[-45.0, 0.0, 30.0])
+
+        assert zonal_mean.dims == ("time", "lev", "latitudes")
+        nt.assert_array_almost_equal(zonal_mean.compute(), expected)
+
+    def test_zonal_mean_node_centered(self):
+        """Zonal mean is not supported for node-centered data."""
+        uxgrid = ux.open_grid(self.gridfile_ne30)
+
+        uxda = ux.UxDataArray(data=np.ones(uxgrid.n_node),
+                              dims=["n_node"],
+                              uxgrid=uxgrid)
+
+        with self.assertRaises(ValueError):
+            uxda.zonal_mean()
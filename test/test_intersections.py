@@ -6,7 +6,8 @@ from uxarray.constants import ERROR_TOLERANCE
 # from uxarray.grid.coordinates import node_lonlat_rad_to_xyz, node_xyz_to_lonlat_rad
 
 from uxarray.grid.coordinates import _lonlat_rad_to_xyz, _xyz_to_lonlat_rad
-from uxarray.grid.intersections import gca_gca_intersection, gca_constLat_intersection
+from uxarray.grid.intersections import gca_gca_intersection, gca_constLat_intersection, \
+    gca_gca_intersection_batch, gca_constLat_intersection_batch
 
 
 class TestGCAGCAIntersection(TestCase):
@@ -97,6 +98,37 @@ class TestGCAGCAIntersection(TestCase):
                         np.array([np.deg2rad(170.0),
                                   np.deg2rad(0.0)])))
 
+    def test_GCA_GCA_intersection_batch(self):
+        gca1 = np.array([
+            [_lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(0.0)),
+             _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(10.0))],
+            [_lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(89.99)),
+             _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(10.0))],
+        ])
+        gca2 = np.array([
+            [_lonlat_rad_to_xyz(0.5 * np.pi, 0.0),
+             _lonlat_rad_to_xyz(-0.5 * np.pi - 0.01, 0.0)],
+            [_lonlat_rad_to_xyz(np.deg2rad(70.0), 0.0),
+             _lonlat_rad_to_xyz(np.deg2rad(179.0), 0.0)],
+        ])
+
+        for fma_disabled in (False, True):
+            res, valid = gca_gca_intersection_batch(gca1, gca2,
+                                                    fma_disabled=fma_disabled)
+            self.assertEqual(res.shape, (2, 2, 3))
+
+            for i in range(2):
+                for j in range(2):
+                    expected = gca_gca_intersection(gca1[i].copy(),
+                                                    gca2[j].copy(),
+                                                    fma_disabled=fma_disabled)
+                    self.assertEqual(valid[i, j], expected.size > 0)
+                    if valid[i, j]:
+                        np.testing.assert_allclose(res[i, j], expected,
+                                                   atol=ERROR_TOLERANCE)
+                    else:
+                        self.assertTrue(np.isnan(res[i, j]).all())
+
 
 class TestGCAconstLatIntersection(TestCase):
 
@@ -139,3 +171,26 @@ class TestGCAconstLatIntersection(TestCase):
 
         res = gca_constLat_intersection(GCR1_cart, np.sin(query_lat), verbose=False)
         self.assertTrue(res.shape[0] == 2)
+
+    def test_GCA_constLat_intersection_batch(self):
+        gca_cart = np.array([
+            [_lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(89.99)),
+             _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(10.0))],
+            [_lonlat_rad_to_xyz(np.deg2rad(10.0), np.deg2rad(10.0)),
+             _lonlat_rad_to_xyz(np.deg2rad(170.0), np.deg2rad(10.0))],
+            [_lonlat_rad_to_xyz(np.deg2rad(10.0), np.deg2rad(-20.0)),
+             _lonlat_rad_to_xyz(np.deg2rad(15.0), np.deg2rad(-30.0))],
+        ])
+        max_lat = ux.grid.arcs.extreme_gca_latitude(gca_cart[1], 'max')
+        constZ = np.sin((np.deg2rad(10.0) + max_lat) / 2.0)
+
+        res, valid = gca_constLat_intersection_batch(gca_cart, constZ)
+        self.assertEqual(res.shape, (3, 2, 3))
+        np.testing.assert_array_equal(valid, [[True, False], [True, True],
+                                              [False, False]])
+
+        for i in range(3):
+            expected = gca_constLat_intersection(gca_cart[i].copy(), constZ)
+            np.testing.assert_allclose(res[i][valid[i]],
+                                       expected.reshape(-1, 3),
+                                       atol=ERROR_TOLERANCE)
@@ -0,0 +1,82 @@
+import os
+from unittest import TestCase
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as nt
+
+import uxarray as ux
+from uxarray.grid.lod import (_get_lod_pyramid, _coarsen_face_values, _select_lod_level, LOD_FACTOR,
+                              LOD_MIN_CLUSTERS)
+
+current_path = Path(os.path.dirname(os.path.realpath(__file__)))
+
+gridfile_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+dsfile_vortex_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30_vortex.nc"
+
+
+class TestLodPyramid(TestCase):
+
+    def test_pyramid_levels(self):
+        """Each level merges LOD_FACTOR clusters of the previous level, down to
+        at most LOD_MIN_CLUSTERS clusters, and preserves the total area."""
+        uxgrid = ux.open_grid(gridfile_ne30)
+
+        face_order, level_offsets, cluster_lon, cluster_lat, cluster_area = _get_lod_pyramid(uxgrid)
+
+        nt.assert_array_equal(np.sort(face_order), np.arange(uxgrid.n_face))
+        level_sizes = np.diff(level_offsets)
+        assert level_sizes[0] == uxgrid.n_face
+        assert level_sizes[-1] <= LOD_MIN_CLUSTERS
+        nt.assert_array_equal(level_sizes[1:], np.ceil(level_sizes[:-1] / LOD_FACTOR))
+
+        for level in range(level_sizes.size):
+            level_area = cluster_area[level_offsets[level]:level_offsets[level + 1]]
+            nt.assert_allclose(level_area.sum(), uxgrid.face_areas.values.sum())
+
+        # the pyramid is cached on the grid
+        assert _get_lod_pyramid(uxgrid)[0] is face_order
+
+    def test_coarsen_face_values(self):
+        """Clusters store the area-weighted mean of their faces, ignoring
+        missing values."""
+        uxds = ux.open_dataset(gridfile_ne30, dsfile_vortex_ne30)
+        face_areas = uxds.uxgrid.face_areas.values
+
+        values = uxds["psi"].values.copy()
+        values[:10] = np.nan
+
+        face_order, level_offsets, _, _, cluster_area = _get_lod_pyramid(uxds.uxgrid)
+        cluster_values = _coarsen_face_values(values, face_order, level_offsets, cluster_area)
+
+        valid = np.isfinite(values)
+        global_mean = (values[valid] * face_areas[valid]).sum() / face_areas[valid].sum()
+
+        # the first cluster of the second level contains the first LOD_FACTOR faces along the curve
+        first_faces = face_order[:LOD_FACTOR]
+        nt.assert_allclose(cluster_values[level_offsets[1]],
+                           np.nansum(values[first_faces] * face_areas[first_faces]) /
+                           face_areas[first_faces][valid[first_faces]].sum())
+
+        # the coarsest level has the same global mean
+        start, stop = level_offsets[-2], level_offsets[-1]
+        coarsest_area = np.add.reduceat(np.where(valid, face_areas, 0.0)[face_order],
+                                        np.arange(0, uxds.uxgrid.n_face, LOD_FACTOR**(level_offsets.size - 2)))
+        nt.assert_allclose((cluster_values[start:stop] * coarsest_area).sum() / coarsest_area.sum(), global_mean)
+
+    def test_select_lod_level(self):
+        """The finest level with at most the given number of visible clusters
+        is selected."""
+        uxgrid = ux.open_grid(gridfile_ne30)
+        _, level_offsets, cluster_lon, cluster_lat, _ = _get_lod_pyramid(uxgrid)
+
+        level, visible = _select_lod_level(level_offsets, cluster_lon, cluster_lat, (-180, 180), (-90, 90),
+                                           max_clusters=2000)
+        assert level == 1
+        assert visible.size == level_offsets[2] - level_offsets[1]
+
+        # a small viewport shows every face
+        level, visible = _select_lod_level(level_offsets, cluster_lon, cluster_lat, (0, 20), (0, 20),
+                                           max_clusters=2000)
+        assert level == 0
+        assert np.all((cluster_lon[visible] >= 0) & (cluster_lon[visible] <= 20))
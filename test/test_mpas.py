@@ -1,9 +1,10 @@
 from uxarray.io._mpas import _replace_padding, _replace_zeros, _to_zero_index
-from uxarray.io._mpas import _read_mpas
+from uxarray.io._mpas import _read_mpas, _to_ugrid_connectivity
 import uxarray as ux
 import xarray as xr
 from unittest import TestCase
 import numpy as np
+import numpy.testing as nt
 import os
 from pathlib import Path
 
@@ -106,6 +107,53 @@ class TestMPAS(TestCase):
 
         assert np.array_equal(verticesOnCell, gold_output)
 
+    def test_to_ugrid_connectivity(self):
+        """Tests that ``_to_ugrid_connectivity`` matches the output of
+        chaining the padding, zero and index helpers without modifying the
+        source variable."""
+        verticesOnCell = xr.DataArray(
+            np.array([[1, 2, 1, 1], [3, 4, 5, 3], [6, 7, 0, 0]], dtype=np.int32))
+        nEdgesOnCell = xr.DataArray(np.array([2, 3, 2], dtype=np.int32))
+
+        gold_output = np.array([[0, 1, self.fv, self.fv], [2, 3, 4, self.fv],
+                                [5, 6, self.fv, self.fv]],
+                               dtype=INT_DTYPE)
+
+        face_nodes = _to_ugrid_connectivity(verticesOnCell, nEdgesOnCell)
+
+        assert face_nodes.dtype == INT_DTYPE
+        assert np.array_equal(face_nodes, gold_output)
+        assert verticesOnCell.values[2, 0] == 6
+
+    def test_lazy_read(self):
+        """Tests that a lazily read grid defers the conversion of connectivity
+        variables and matches the eagerly read grid once accessed."""
+        for use_dual in [False, True]:
+            uxgrid = ux.open_grid(self.mpas_grid_path, use_dual=use_dual)
+            uxgrid_lazy = ux.open_grid(self.mpas_grid_path,
+                                       use_dual=use_dual,
+                                       lazy=True)
+
+            assert "face_node_connectivity" in uxgrid_lazy._ds
+            assert "edge_node_connectivity" not in uxgrid_lazy._ds
+            assert "node_face_connectivity" not in uxgrid_lazy._ds
+
+            assert uxgrid_lazy.n_edge == uxgrid.n_edge
+
+            for conn_name in [
+                    "face_node_connectivity", "edge_node_connectivity",
+                    "face_edge_connectivity", "edge_face_connectivity",
+                    "node_face_connectivity"
+            ]:
+                nt.assert_array_equal(uxgrid_lazy[conn_name].values,
+                                      uxgrid[conn_name].values)
+
+            nt.assert_array_equal(uxgrid_lazy.edge_node_distances.values,
+                                  uxgrid.edge_node_distances.values)
+
+            # only the unaccessed descriptor remains deferred
+            assert list(uxgrid_lazy._deferred_parsers) == ["edge_face_distances"]
+
     def test_set_attrs(self):
         """Tests the execution of ``_set_global_attrs``, checking for
         attributes being correctly stored in ``Grid._ds``"""
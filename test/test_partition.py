@@ -0,0 +1,126 @@
+import os
+from unittest import TestCase
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as nt
+
+import uxarray as ux
+
+current_path = Path(os.path.dirname(os.path.realpath(__file__)))
+
+gridfile_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+dsfile_vortex_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30_vortex.nc"
+gridfile_mpas = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+
+
+class TestPartition(TestCase):
+
+    def test_partition_ownership(self):
+        """Each element is owned by exactly one partition and partitions are
+        balanced."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        partitions = uxgrid.partition(5)
+
+        face_owners = np.zeros(uxgrid.n_face, dtype=int)
+        edge_owners = np.zeros(uxgrid.n_edge, dtype=int)
+        node_owners = np.zeros(uxgrid.n_node, dtype=int)
+        for part in partitions:
+            np.add.at(face_owners, part["face_indices"][part["owned_faces"]], 1)
+            np.add.at(edge_owners, part["edge_indices"][part["owned_edges"]], 1)
+            np.add.at(node_owners, part["node_indices"][part["owned_nodes"]], 1)
+
+            nt.assert_array_equal(part["grid"]._ds["subgrid_face_indices"].values,
+                                  part["face_indices"])
+
+        nt.assert_array_equal(face_owners, 1)
+        nt.assert_array_equal(edge_owners, 1)
+        nt.assert_array_equal(node_owners, 1)
+
+        n_owned = [part["owned_faces"].size for part in partitions]
+        assert max(n_owned) - min(n_owned) <= 1
+
+    def test_partition_fill_first_edge_face(self):
+        """Edges whose first face is a fill value, as in connectivity read from
+        the boundary of a limited-area mesh, are owned by their other face."""
+        uxgrid = ux.Grid.from_topology(np.array([0.0, 10.0, 10.0, 0.0, 20.0, 20.0]),
+                                       np.array([0.0, 0.0, 10.0, 10.0, 0.0, 10.0]),
+                                       np.array([[0, 1, 2, 3], [1, 4, 5, 2]]))
+
+        # place the fill value of each boundary edge first
+        edge_faces = uxgrid.edge_face_connectivity.values
+        boundary = edge_faces[:, 1] == ux.INT_FILL_VALUE
+        edge_faces[boundary] = edge_faces[boundary][:, ::-1]
+        assert (edge_faces[:, 0] == ux.INT_FILL_VALUE).any()
+
+        edge_owners = np.zeros(uxgrid.n_edge, dtype=int)
+        for part in uxgrid.partition(2):
+            np.add.at(edge_owners, part["edge_indices"][part["owned_edges"]], 1)
+
+        nt.assert_array_equal(edge_owners, 1)
+
+    def test_partition_lazy(self):
+        """Partitions of a lazily read grid keep the edges of each face."""
+        uxgrid = ux.open_grid(gridfile_mpas, lazy=True)
+
+        for part in uxgrid.partition(3):
+            subgrid = part["grid"]
+            face_nodes = subgrid.face_node_connectivity.values
+            face_edges = subgrid.face_edge_connectivity.values
+            edge_nodes = subgrid.edge_node_connectivity.values
+
+            for face_idx in range(subgrid.n_face):
+                face_edge_indices = face_edges[face_idx][face_edges[face_idx] != ux.INT_FILL_VALUE]
+                assert np.isin(edge_nodes[face_edge_indices], face_nodes[face_idx]).all()
+
+    def test_partition_halo(self):
+        """Halo faces are the faces outside a partition that share an edge with
+        its owned faces."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+        edge_faces = uxgrid.edge_face_connectivity.values
+
+        for part in uxgrid.partition(4):
+            owned = part["face_indices"][part["owned_faces"]]
+            halo = part["face_indices"][part["halo_faces"]]
+
+            saddle_edges = edge_faces[(edge_faces != ux.INT_FILL_VALUE).all(axis=1)]
+            crossing = np.isin(saddle_edges, owned).sum(axis=1) == 1
+            expected_halo = saddle_edges[crossing][~np.isin(saddle_edges[crossing], owned)]
+
+            nt.assert_array_equal(np.sort(halo), np.unique(expected_halo))
+
+        # wider halos contain narrower ones
+        for narrow, wide in zip(uxgrid.partition(4, halo_width=1), uxgrid.partition(4, halo_width=2)):
+            assert np.isin(narrow["face_indices"], wide["face_indices"]).all()
+
+        for part in uxgrid.partition(4, halo_width=0):
+            assert part["halo_faces"].size == 0
+
+    def test_partition_gradient(self):
+        """Gradients computed on each partition and scattered back match the
+        gradient computed on the whole grid."""
+        uxds = ux.open_dataset(gridfile_ne30, dsfile_vortex_ne30)
+        uxgrid = uxds.uxgrid
+
+        expected = uxds["psi"].gradient().values
+
+        grad = np.full(uxgrid.n_edge, np.nan)
+        for part in uxgrid.partition(6):
+            local_uxda = ux.UxDataArray(uxds["psi"].values[part["face_indices"]],
+                                        uxgrid=part["grid"],
+                                        dims=["n_face"])
+            local_grad = local_uxda.gradient().values
+
+            grad[part["edge_indices"][part["owned_edges"]]] = local_grad[part["owned_edges"]]
+
+        nt.assert_array_equal(grad, expected)
+
+    def test_partition_invalid(self):
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        with self.assertRaises(ValueError):
+            uxgrid.partition(0)
+
+        with self.assertRaises(ValueError):
+            uxgrid.partition(4, halo_width=-1)
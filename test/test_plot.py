@@ -1,4 +1,9 @@
 import os
+import subprocess
+import sys
+import tempfile
+import numpy as np
+import numpy.testing as nt
 import uxarray as ux
 
 from unittest import TestCase
@@ -20,6 +25,15 @@ grid_files = [gridfile_geoflow, gridfile_mpas]
 
 class TestPlot(TestCase):
 
+    def test_lazy_imports(self):
+        """Plotting libraries are imported on first use, and not when
+        importing uxarray."""
+        code = ("import sys, uxarray; "
+                "print([m for m in ['holoviews', 'datashader', 'cartopy', 'matplotlib', 'sklearn'] if m in sys.modules])")
+        imported = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+        assert imported.strip() == "[]"
+
     def test_topology(self):
         """Tests execution on Grid elements."""
         uxgrid = ux.open_grid(gridfile_mpas)
@@ -30,6 +44,8 @@ class TestPlot(TestCase):
 
             uxgrid.plot.mesh(backend=backend)
 
+            uxgrid.plot.mesh(backend=backend, rasterize=True)
+
             uxgrid.plot.edges(backend=backend)
 
             uxgrid.plot.nodes(backend=backend)
@@ -70,6 +86,65 @@ class TestPlot(TestCase):
 
             uxds['psi'].plot.rasterize(method='polygon', backend=backend)
 
+            uxds['psi'].plot.rasterize(method='trimesh', backend=backend)
+
+            uxds['psi'].plot.rasterize(method='lookup', backend=backend)
+
+            uxds['psi'].plot.rasterize(method='point', lod=True, backend=backend)
+
+            uxds['psi'].plot.rasterize(method='point', lod=True, dynamic=True, backend=backend)
+
+    def test_projection(self):
+        """Tests execution of plotting methods with a projection."""
+        import cartopy.crs as ccrs
+
+        uxds = ux.open_dataset(gridfile_ne30, datafile_ne30)
+        projection = ccrs.Robinson()
+
+        for backend in ['matplotlib', 'bokeh']:
+
+            uxds['psi'].plot.polygons(projection=projection, backend=backend)
+
+            uxds['psi'].plot.points(projection=projection, backend=backend)
+
+            uxds['psi'].plot.rasterize(method='polygon', projection=projection, backend=backend)
+
+        uxds['psi'].plot.rasterize(method='point', projection=projection)
+
+        # projections are not supported by trimesh and level-of-detail rasterization
+        with self.assertRaises(ValueError):
+            uxds['psi'].plot.rasterize(method='trimesh', projection=projection)
+
+        with self.assertRaises(ValueError):
+            uxds['psi'].plot.rasterize(method='point', lod=True, projection=projection)
+
+    def test_point_dataframe(self):
+        """Tests the construction of the dataframe of points for in-memory
+        and dask-backed data."""
+        import dask.dataframe as dd
+        import pandas as pd
+        from uxarray.grid.geometry import _get_point_coordinates
+        from uxarray.plot.dataarray_plot import _point_dataframe
+
+        uxds = ux.open_dataset(gridfile_ne30, datafile_ne30)
+        point_coordinates = _get_point_coordinates(uxds.uxgrid, "face")
+        assert _get_point_coordinates(uxds.uxgrid, "face") is point_coordinates
+
+        point_df = _point_dataframe(point_coordinates, uxds['psi'].data)
+        assert isinstance(point_df, pd.DataFrame)
+        np.testing.assert_array_equal(point_df['var'].values, uxds['psi'].values)
+
+        assert _point_dataframe(point_coordinates, uxds['psi'].data, npartitions=2).npartitions == 2
+
+        # partitions are aligned with the chunks of dask-backed data
+        psi = uxds['psi'].chunk({'n_face': 1000})
+        point_ddf = _point_dataframe(point_coordinates, psi.data)
+        assert isinstance(point_ddf, dd.DataFrame)
+        assert point_ddf.npartitions == len(psi.data.chunks[0])
+        np.testing.assert_array_equal(point_ddf.compute()[['lon', 'lat', 'var']].values, point_df.values)
+
+        psi.plot.rasterize(method='point')
+
     def test_node_centered_data(self):
         """Tests execution of plotting methods on node-centered data."""
 
@@ -82,6 +157,8 @@ class TestPlot(TestCase):
 
             uxds['v1'][0][0].nodal_average().plot.polygons(backend=backend)
 
+            uxds['v1'][0][0].plot.rasterize(method='trimesh', backend=backend)
+
 
     def test_clabel(self):
         """Tests the execution of passing in a custom clabel."""
@@ -93,6 +170,32 @@ class TestPlot(TestCase):
         raster_with_clabel = uxds['v1'][0][0].plot.rasterize(method='point', clabel='Foo')
 
 
+    def test_render_frames(self):
+        """Tests rendering each time step to an image, in the calling
+        process and across a process pool."""
+        uxds = ux.open_dataset(gridfile_ne30, datafile_ne30)
+        uxda = ux.UxDataArray(np.stack([uxds['psi'].values, -uxds['psi'].values]),
+                              dims=['time', 'n_face'], uxgrid=uxds.uxgrid, name='psi')
+
+        frames = uxda.plot.render_frames(width=90, height=45)
+        assert len(frames) == 2
+        assert frames[0].shape == (45, 90, 4)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = uxda.plot.render_frames(filename=os.path.join(tmpdir, 'frame_{:02d}.png'),
+                                                width=90, height=45, processes=2)
+            assert sorted(os.listdir(tmpdir)) == ['frame_00.png', 'frame_01.png']
+            assert filenames[1] == os.path.join(tmpdir, 'frame_01.png')
+
+        # colormaps are accepted by name or as a colormap
+        import matplotlib
+        viridis_frames = uxda.plot.render_frames(width=90, height=45, cmap='viridis')
+        nt.assert_array_equal(uxda.plot.render_frames(width=90, height=45, cmap=matplotlib.colormaps['viridis'])[0],
+                              viridis_frames[0])
+
+        with self.assertRaises(ValueError):
+            uxda.plot.render_frames(width=90, height=45, cmap='not_a_colormap')
+
 
 class TestXarrayMethods(TestCase):
 
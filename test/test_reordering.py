@@ -0,0 +1,108 @@
+import os
+from unittest import TestCase
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as nt
+
+import uxarray as ux
+from uxarray.grid.reordering import _sfc_keys_from_cells
+
+current_path = Path(os.path.dirname(os.path.realpath(__file__)))
+
+gridfile_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+dsfile_vortex_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30_vortex.nc"
+gridfile_mpas = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+
+
+def _source_indices(indices, conn):
+    """Maps the entries of a reordered connectivity back to the source
+    grid, keeping fill values."""
+    source_conn = conn.copy()
+    valid = conn != ux.INT_FILL_VALUE
+    source_conn[valid] = indices[conn[valid]]
+    return source_conn
+
+
+class TestSpaceFillingCurves(TestCase):
+
+    def test_hilbert_adjacency(self):
+        """Consecutive cells along a Hilbert curve are adjacent."""
+        for n_dims, bits in [(2, 4), (3, 3)]:
+            cells = np.stack(np.meshgrid(*[np.arange(2**bits)] * n_dims),
+                             axis=-1).reshape(-1, n_dims).astype(np.int64)
+
+            keys = _sfc_keys_from_cells(cells, True, bits)
+            ordered_cells = cells[np.argsort(keys)]
+
+            # every cell has a unique key
+            assert np.unique(keys).size == cells.shape[0]
+            nt.assert_array_equal(np.abs(np.diff(ordered_cells, axis=0)).sum(axis=1), 1)
+
+    def test_morton_keys(self):
+        """Morton keys interleave the bits of each coordinate."""
+        cells = np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0], [1, 0, 0], [1, 1, 1]],
+                         dtype=np.int64)
+
+        keys = _sfc_keys_from_cells(cells, False, 2)
+
+        nt.assert_array_equal(keys, [0, 1, 2, 4, 7])
+
+
+class TestReorder(TestCase):
+
+    def test_reorder_grid(self):
+        """Connectivity of a reordered grid refers to the same elements."""
+        for method in ["hilbert", "morton"]:
+            uxgrid = ux.open_grid(gridfile_mpas)
+
+            reordered_grid, indices = uxgrid.reorder(method, return_indices=True)
+
+            for dim in ["n_node", "n_edge", "n_face"]:
+                nt.assert_array_equal(np.sort(indices[dim]), np.arange(uxgrid._ds.sizes[dim]))
+
+            # nodes of each face, which may be fill values
+            face_nodes = reordered_grid.face_node_connectivity.values
+            nt.assert_array_equal(
+                uxgrid.face_node_connectivity.values[indices["n_face"]],
+                _source_indices(indices["n_node"], face_nodes))
+
+            # edges of each face, which may be fill values
+            face_edges = reordered_grid.face_edge_connectivity.values
+            nt.assert_array_equal(
+                uxgrid.face_edge_connectivity.values[indices["n_face"]],
+                _source_indices(indices["n_edge"], face_edges))
+
+            # faces of each edge, which may be fill values
+            edge_faces = reordered_grid.edge_face_connectivity.values
+            nt.assert_array_equal(
+                uxgrid.edge_face_connectivity.values[indices["n_edge"]],
+                _source_indices(indices["n_face"], edge_faces))
+
+            nt.assert_array_equal(uxgrid.face_lon.values[indices["n_face"]],
+                                  reordered_grid.face_lon.values)
+
+            assert reordered_grid.validate()
+
+    def test_reorder_dataset(self):
+        """Data variables are reordered alongside their grid."""
+        uxds = ux.open_dataset(gridfile_ne30, dsfile_vortex_ne30)
+
+        reordered_uxds = uxds.reorder()
+        _, indices = uxds.uxgrid.reorder(return_indices=True)
+
+        nt.assert_array_equal(reordered_uxds["psi"].values,
+                              uxds["psi"].values[indices["n_face"]])
+        assert reordered_uxds.uxgrid is reordered_uxds["psi"].uxgrid
+
+        reordered_uxda = uxds["psi"].reorder()
+        nt.assert_array_equal(reordered_uxda.values, reordered_uxds["psi"].values)
+
+        nt.assert_almost_equal(reordered_uxda.integrate().values,
+                               uxds["psi"].integrate().values)
+
+    def test_reorder_invalid_method(self):
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        with self.assertRaises(ValueError):
+            uxgrid.reorder(method="peano")
@@ -1,6 +1,8 @@
 import uxarray as ux
 import os
 
+import numpy as np
+
 import pytest
 
 from pathlib import Path
@@ -34,6 +36,22 @@ def test_grid_face_isel():
             grid_subset = grid.isel(n_face=face_indices)
 
 
+def test_grid_lazy_face_isel():
+    """Subsets of a lazily read grid keep the edges of each face."""
+    grid_path = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+
+    for lazy in [False, True]:
+        grid_subset = ux.open_grid(grid_path, lazy=lazy).isel(n_face=np.arange(20))
+
+        face_nodes = grid_subset.face_node_connectivity.values
+        face_edges = grid_subset.face_edge_connectivity.values
+        edge_nodes = grid_subset.edge_node_connectivity.values
+
+        for face_idx in range(grid_subset.n_face):
+            face_edge_indices = face_edges[face_idx][face_edges[face_idx] != ux.INT_FILL_VALUE]
+            assert np.isin(edge_nodes[face_edge_indices], face_nodes[face_idx]).all()
+
+
 def test_grid_node_isel():
     for grid_path in GRID_PATHS:
         grid = ux.open_grid(grid_path)
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import numpy.testing as nt
+
+from unittest import TestCase
+from pathlib import Path
+
+import uxarray as ux
+from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
+
+current_path = Path(os.path.dirname(os.path.realpath(__file__)))
+
+gridfile_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+gridfile_mpas = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+dsfile_var2_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30_var2.nc"
+
+
+class TestZarr(TestCase):
+
+    def test_round_trip(self):
+        """Writes a populated grid to a zarr store and checks that the stored
+        variables are read back unchanged."""
+        uxgrid = ux.open_grid(gridfile_ne30)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = os.path.join(tmp_dir, "outCSne30.zarr")
+            uxgrid.to_zarr(store, populate=True)
+
+            uxgrid_zarr = ux.open_grid(store)
+
+            for var_name in [
+                    "node_lon", "node_lat", "face_lon", "face_lat",
+                    "face_node_connectivity", "edge_node_connectivity",
+                    "face_edge_connectivity", "edge_face_connectivity",
+                    "node_face_connectivity", "face_areas"
+            ]:
+                assert var_name in uxgrid_zarr._ds
+                nt.assert_array_equal(uxgrid_zarr[var_name].values,
+                                      uxgrid[var_name].values)
+
+            assert uxgrid_zarr.face_node_connectivity.dtype == INT_DTYPE
+            assert uxgrid_zarr.face_node_connectivity._FillValue == INT_FILL_VALUE
+
+    def test_chunks(self):
+        """Tests that grid dimensions are chunked as requested."""
+        import zarr
+
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = os.path.join(tmp_dir, "mpas.zarr")
+            uxgrid.to_zarr(store, chunks={"n_face": 100})
+
+            zarr_group = zarr.open_group(store, mode="r")
+            assert zarr_group["face_node_connectivity"].chunks == (
+                100, uxgrid.n_max_face_nodes)
+            assert zarr_group["node_lon"].chunks == (uxgrid.n_node, )
+
+            uxgrid_zarr = ux.open_grid(store)
+            assert uxgrid_zarr.n_edge == uxgrid.n_edge
+            nt.assert_array_equal(uxgrid_zarr.edge_node_connectivity.values,
+                                  uxgrid.edge_node_connectivity.values)
+
+    def test_open_dataset(self):
+        """Opens a data file paired with a grid stored in a zarr store."""
+        uxgrid = ux.open_grid(gridfile_ne30)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = os.path.join(tmp_dir, "outCSne30.zarr")
+            uxgrid.to_zarr(store)
+
+            uxds = ux.open_dataset(store, dsfile_var2_ne30)
+
+            assert uxds.uxgrid.n_face == uxgrid.n_face
@@ -1,4 +1,9 @@
-DESCRIPTOR_NAMES = ["face_areas", "edge_face_distances", "edge_node_distances"]
+DESCRIPTOR_NAMES = [
+    "face_areas",
+    "edge_face_distances",
+    "edge_node_distances",
+    "edge_latitude_extremes",
+]
 
 
 FACE_AREAS_DIMS = ["n_face"]
@@ -16,3 +21,10 @@ EDGE_NODE_DISTANCES_ATTRS = {
     "cf_role": "edge_node_distances",
     "long_name": "Distances between the nodes that make up " "each edge.",
 }
+
+EDGE_LATITUDE_EXTREMES_DIMS = ["n_edge", "two"]
+EDGE_LATITUDE_EXTREMES_ATTRS = {
+    "cf_role": "edge_latitude_extremes",
+    "long_name": "Minimum and maximum latitude in radians along "
+    "each edge, treated as a great circle arc",
+}
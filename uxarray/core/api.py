@@ -1,6 +1,7 @@
 """UXarray dataset module."""
 
 import os
+import weakref
 import numpy as np
 import xarray as xr
 
@@ -9,9 +10,21 @@ from typing import Any, Dict, Optional, Union
 from uxarray.grid import Grid
 from uxarray.core.dataset import UxDataset
 from uxarray.core.utils import _map_dims_to_ugrid
+from uxarray.io._zarr import _is_zarr, _read_zarr
 
 from warnings import warn
 
+# grids opened alongside data files with ``share_grid=True``, keyed by their fingerprint, so that datasets on the same
+# grid share a single instance and its cached data structures (i.e. trees, areas, GeoDataFrames) for as long as any
+# of them is alive
+_GRID_REGISTRY = weakref.WeakValueDictionary()
+
+
+def _register_grid(uxgrid: Grid) -> Grid:
+    """Returns the registered grid equal to ``uxgrid``, registering it if no
+    such grid exists."""
+    return _GRID_REGISTRY.setdefault(uxgrid.fingerprint, uxgrid)
+
 
 def open_grid(
     grid_filename_or_obj: Union[
@@ -19,6 +32,8 @@ def open_grid(
     ],
     latlon: Optional[bool] = False,
     use_dual: Optional[bool] = False,
+    lazy: Optional[bool] = False,
+    node_tolerance: Optional[float] = None,
     **kwargs: Dict[str, Any],
 ) -> Grid:
     """Constructs and returns an ``uxarray.Grid`` object from a grid topology
@@ -30,7 +45,8 @@ def open_grid(
     grid_filename_or_obj : string, xarray.Dataset, ndarray, list, tuple, dict, required
         String or Path object as a path to a netCDF file or an OpenDAP URL that
         stores the unstructured grid topology/definition. It is read similar to
-        ``filename_or_obj`` in ``xarray.open_dataset``. Otherwise, either
+        ``filename_or_obj`` in ``xarray.open_dataset``. A path to or mapping of a
+        Zarr store written with ``Grid.to_zarr`` is opened lazily. Otherwise, either
         ``xr.DataArray``, ``np.ndarray``, ``list``, or ``tuple`` as a vertices
         object to define the grid.
 
@@ -40,6 +56,14 @@ def open_grid(
     use_dual: bool, optional
         Specify whether to use the primal (use_dual=False) or dual (use_dual=True) mesh if the file type is mpas
 
+    lazy: bool, optional
+        Specify whether to defer the conversion of connectivity and descriptor variables until they are first accessed
+        if the file type is mpas. Only the coordinates and ``face_node_connectivity`` are converted up front
+
+    node_tolerance: float, optional
+        Maximum difference in each coordinate for two corners to be merged into a single node when constructing the
+        grid from face vertices or if the file type is scrip. Only exactly matching corners are merged if not provided
+
     **kwargs : Dict[str, Any]
         Additional arguments passed on to ``xarray.open_dataset``. Refer to the
         [xarray
@@ -70,7 +94,18 @@ def open_grid(
 
     if isinstance(grid_filename_or_obj, xr.Dataset):
         # construct a grid from a dataset file
-        uxgrid = Grid.from_dataset(grid_filename_or_obj, use_dual=use_dual)
+        uxgrid = Grid.from_dataset(
+            grid_filename_or_obj,
+            use_dual=use_dual,
+            lazy=lazy,
+            node_tolerance=node_tolerance,
+        )
+
+    elif _is_zarr(grid_filename_or_obj):
+        # construct a grid from a zarr store, only reading variables when accessed
+        grid_ds = _read_zarr(grid_filename_or_obj, **kwargs)
+
+        uxgrid = Grid.from_dataset(grid_ds, use_dual=use_dual, lazy=lazy)
 
     elif isinstance(grid_filename_or_obj, dict):
         # unpack the dictionary and construct a grid from topology
@@ -78,14 +113,18 @@ def open_grid(
 
     elif isinstance(grid_filename_or_obj, (list, tuple, np.ndarray, xr.DataArray)):
         # construct Grid from face vertices
-        uxgrid = Grid.from_face_vertices(grid_filename_or_obj, latlon=latlon)
+        uxgrid = Grid.from_face_vertices(
+            grid_filename_or_obj, latlon=latlon, node_tolerance=node_tolerance
+        )
 
     # attempt to use Xarray directly for remaining input types
     else:
         try:
             grid_ds = xr.open_dataset(grid_filename_or_obj, **kwargs)
 
-            uxgrid = Grid.from_dataset(grid_ds, use_dual=use_dual)
+            uxgrid = Grid.from_dataset(
+                grid_ds, use_dual=use_dual, lazy=lazy, node_tolerance=node_tolerance
+            )
         except ValueError:
             raise ValueError("Inputted grid_filename_or_obj not supported.")
 
@@ -100,6 +139,7 @@ def open_dataset(
     latlon: Optional[bool] = False,
     use_dual: Optional[bool] = False,
     grid_kwargs: Optional[Dict[str, Any]] = {},
+    share_grid: Optional[bool] = False,
     **kwargs: Dict[str, Any],
 ) -> UxDataset:
     """Wraps ``xarray.open_dataset()`` and creates a ``uxarray.UxDataset``
@@ -131,6 +171,12 @@ def open_dataset(
         docs](https://xarray.pydata.org/en/stable/generated/xarray.open_dataset.html)
         for accepted keyword arguments.
 
+    share_grid : bool, default=False
+        Whether to share a single ``Grid`` instance, along with its cached data structures, with every other
+        dataset opened with ``share_grid=True`` on an equal grid (see ``Grid.fingerprint``). Any in-place change to
+        a shared grid, such as ``Grid.compute_face_centroids`` or the construction of cached connectivity, areas and
+        trees, is visible to every dataset that shares it
+
     **kwargs : Dict[str, Any]
         Additional arguments passed on to ``xarray.open_dataset``. Refer to the
         [xarray
@@ -165,6 +211,9 @@ def open_dataset(
         grid_filename_or_obj, latlon=latlon, use_dual=use_dual, **grid_kwargs
     )
 
+    if share_grid:
+        uxgrid = _register_grid(uxgrid)
+
     # UxDataset
     ds = xr.open_dataset(filename_or_obj, **kwargs)  # type: ignore
 
@@ -184,6 +233,7 @@ def open_mfdataset(
     latlon: Optional[bool] = False,
     use_dual: Optional[bool] = False,
     grid_kwargs: Optional[Dict[str, Any]] = {},
+    share_grid: Optional[bool] = False,
     **kwargs: Dict[str, Any],
 ) -> UxDataset:
     """Wraps ``xarray.open_mfdataset()`` and creates a ``uxarray.UxDataset``
@@ -214,6 +264,12 @@ def open_mfdataset(
         docs](https://xarray.pydata.org/en/stable/generated/xarray.open_dataset.html)
         for accepted keyword arguments.
 
+    share_grid : bool, default=False
+        Whether to share a single ``Grid`` instance, along with its cached data structures, with every other
+        dataset opened with ``share_grid=True`` on an equal grid (see ``Grid.fingerprint``). Any in-place change to
+        a shared grid, such as ``Grid.compute_face_centroids`` or the construction of cached connectivity, areas and
+        trees, is visible to every dataset that shares it
+
     **kwargs : Dict[str, Any]
         Additional arguments passed on to ``xarray.open_mfdataset``. Refer to the
         [xarray
@@ -254,6 +310,9 @@ def open_mfdataset(
         grid_filename_or_obj, latlon=latlon, use_dual=use_dual, **grid_kwargs
     )
 
+    if share_grid:
+        uxgrid = _register_grid(uxgrid)
+
     # UxDataset
     ds = xr.open_mfdataset(paths, **kwargs)  # type: ignore
 
@@ -6,6 +6,7 @@ import numpy as np
 from typing import TYPE_CHECKING, Optional, Union, Hashable
 
 from uxarray.grid import Grid
+from uxarray.constants import INT_FILL_VALUE
 import uxarray.core.dataset
 
 if TYPE_CHECKING:
@@ -124,7 +125,9 @@ class UxDataArray(xr.DataArray):
     def uxgrid(self, ugrid_obj):
         self._uxgrid = ugrid_obj
 
-    def to_geodataframe(self, override=False, cache=True, exclude_antimeridian=False):
+    def to_geodataframe(
+        self, override=False, cache=True, exclude_antimeridian=False, projection=None
+    ):
         """Constructs a ``spatialpandas.GeoDataFrame`` with a "geometry"
         column, containing a collection of Shapely Polygons or MultiPolygons
         representing the geometry of the unstructured grid, and a data column
@@ -137,6 +140,8 @@ class UxDataArray(xr.DataArray):
             Flag to indicate if the computed ``GeoDataFrame`` stored under the ``uxgrid`` accessor should be cached
         exclude_antimeridian: bool, Optional
             Selects whether to exclude any face that contains an edge that crosses the antimeridian
+        projection: cartopy.crs.Projection, Optional
+            Projection to transform the polygons to
 
         Returns
         -------
@@ -156,6 +161,7 @@ class UxDataArray(xr.DataArray):
                 override=override,
                 cache=cache,
                 exclude_antimeridian=exclude_antimeridian,
+                projection=projection,
             )
 
             if exclude_antimeridian:
@@ -245,6 +251,78 @@ class UxDataArray(xr.DataArray):
                 f"({self.uxgrid.n_face}."
             )
 
+    def to_raster(
+        self,
+        width: Optional[int] = 1000,
+        height: Optional[int] = 500,
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        projection=None,
+    ):
+        """Rasterizes a face-centered data variable onto a canvas by indexing
+        it with the face that covers each pixel, which is computed once for
+        each canvas and projection and cached on the ``uxgrid`` (see
+        ``Grid.to_raster_lookup``).
+
+        Every slice along the other dimensions (i.e. time) is rasterized at once.
+
+        Parameters
+        ----------
+        width, height : int
+            Size of the canvas in pixels
+        x_range, y_range : tuple, optional
+            Extent of the canvas, defaulting to the whole globe in degrees, or the limits of ``projection``
+        projection : cartopy.crs.Projection, optional
+            Projection that the faces are transformed to before rasterizing
+
+        Returns
+        -------
+        raster : xr.DataArray
+            Rasterized data with the face dimension replaced by "y" and "x", with the first row at the top of the
+            canvas and NaN for pixels not covered by any face
+        """
+        from uxarray.grid.geometry import _raster_extent
+
+        if not self._face_centered():
+            raise ValueError(
+                f"Data Variable {self.name} must be mapped to the faces of the grid to be rasterized."
+            )
+
+        x_range, y_range = _raster_extent(x_range, y_range, projection)
+        raster_lookup = self.uxgrid.to_raster_lookup(
+            width, height, x_range, y_range, projection
+        )
+
+        data = self.transpose(..., "n_face")
+        covered = raster_lookup != INT_FILL_VALUE
+        raster = np.where(
+            covered,
+            data.values[..., np.where(covered, raster_lookup, 0)],
+            np.nan,
+        )
+
+        # coordinates of the center of each pixel
+        dx = (x_range[1] - x_range[0]) / raster_lookup.shape[1]
+        dy = (y_range[1] - y_range[0]) / raster_lookup.shape[0]
+        x = x_range[0] + (np.arange(raster_lookup.shape[1]) + 0.5) * dx
+        y = y_range[1] - (np.arange(raster_lookup.shape[0]) + 0.5) * dy
+
+        return xr.DataArray(
+            raster,
+            dims=data.dims[:-1] + ("y", "x"),
+            coords={
+                **{
+                    name: coord
+                    for name, coord in data.coords.items()
+                    if "n_face" not in coord.dims
+                },
+                "x": x,
+                "y": y,
+            },
+            name=self.name,
+            attrs=self.attrs,
+        )
+
     def to_dataset(
         self,
         dim: Hashable = None,
@@ -389,6 +467,82 @@ class UxDataArray(xr.DataArray):
 
         return uxda
 
+    def zonal_mean(self, lat=(-90, 90, 10)) -> UxDataArray:
+        """Computes the Zonal Mean of a face-centered data variable, which is
+        the average of the data along lines of constant latitude, weighted by
+        the length of each line covered by each face.
+
+        The weights of all faces at each latitude are computed once for each
+        grid and set of latitudes as a sparse matrix, so that computing the
+        zonal mean of data with any number of leading dimensions is a single
+        sparse matrix product, applied to each chunk of dask-backed data.
+
+        Parameters
+        ----------
+        lat : tuple or array-like, default=(-90, 90, 10)
+            Latitudes in degrees to compute the zonal mean at, either as a (start, end, step) tuple, where the end is
+            included, or as an array of latitudes
+
+        Returns
+        -------
+        uxda : UxDataArray
+            UxDataArray containing the zonal mean, with the face dimension replaced by a ``latitudes`` dimension.
+            Latitudes that are not covered by the grid are filled with NaN.
+
+        Examples
+        --------
+        >>> import uxarray as ux
+        >>> uxds = ux.open_dataset("grid.ug", "centroid_pressure_data_ug")
+
+        # Compute the zonal mean every 10 degrees
+        >>> zonal_mean = uxds['psi'].zonal_mean()
+
+        # Compute the zonal mean at specific latitudes
+        >>> zonal_mean = uxds['psi'].zonal_mean(lat=[-45.0, 0.0, 45.0])
+        """
+        if not self._face_centered():
+            raise ValueError(
+                f"Zonal mean is only supported for face-centered data variables, with a final dimension "
+                f"of size {self.uxgrid.n_face}."
+            )
+
+        if isinstance(lat, tuple) and len(lat) == 3:
+            start, end, step = lat
+            latitudes = np.arange(start, end + step, step, dtype=np.float64)
+            latitudes = latitudes[latitudes <= end]
+        else:
+            latitudes = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+
+        weights = self.uxgrid._get_zonal_weights(latitudes)
+
+        # latitudes that no face covers do not have a mean
+        uncovered = np.asarray(weights.sum(axis=1)).ravel() == 0
+
+        def _zonal_mean(data):
+            flat = data.reshape(-1, data.shape[-1])
+            mean = np.asarray((weights @ flat.T).T, dtype=np.float64)
+            mean[:, uncovered] = np.nan
+            return mean.reshape(data.shape[:-1] + (latitudes.size,))
+
+        zonal_mean = xr.apply_ufunc(
+            _zonal_mean,
+            xr.DataArray(self),
+            input_core_dims=[["n_face"]],
+            output_core_dims=[["latitudes"]],
+            dask="parallelized",
+            output_dtypes=[np.float64],
+            dask_gufunc_kwargs={
+                "output_sizes": {"latitudes": latitudes.size},
+                "allow_rechunk": True,
+            },
+        )
+
+        return UxDataArray(
+            zonal_mean.assign_coords(latitudes=latitudes),
+            uxgrid=self.uxgrid,
+            name=f"{self.name}_zonal_mean" if self.name is not None else None,
+        )
+
     def nodal_average(self):
         """Computes the Nodal Average of a Data Variable, which is the mean of
         the nodes that surround each face.
@@ -639,6 +793,36 @@ class UxDataArray(xr.DataArray):
             # original xarray implementation for non-grid dimensions
             return super().isel(*args, **kwargs)
 
+    def reorder(self, method: Optional[str] = "hilbert"):
+        """Reorders the data variable alongside its grid, with the nodes,
+        edges and faces of the grid sorted along a space-filling curve (see
+        ``Grid.reorder``), improving the memory locality of operations that
+        gather data from neighboring elements.
+
+        Parameters
+        ----------
+        method : str, default="hilbert"
+            Space-filling curve to order the elements with, either "hilbert" or "morton"
+
+        Returns
+        -------
+        uxda : UxDataArray
+            UxDataArray with its grid dimensions reordered, attached to the reordered grid
+
+        Example
+        -------
+        >>> uxda = uxds['psi'].reorder()
+        """
+        reordered_grid, indices = self.uxgrid.reorder(method, return_indices=True)
+
+        reordered = self.isel(
+            ignore_grid=True,
+            **{dim: idx for dim, idx in indices.items() if dim in self.dims},
+        )
+        reordered.uxgrid = reordered_grid
+
+        return reordered
+
     def _slice_from_grid(self, sliced_grid):
         """Slices a  ``UxDataArray`` from a sliced ``Grid``, using cached
         indices to correctly slice the data variable."""
@@ -1,9 +1,10 @@
 import numpy as np
+from numba import njit
 
 # from uxarray.grid.coordinates import node_xyz_to_lonlat_rad, normalize_in_place
 
 from uxarray.grid.coordinates import _xyz_to_lonlat_rad, _normalize_xyz
-from uxarray.constants import ERROR_TOLERANCE
+from uxarray.constants import ERROR_TOLERANCE, ENABLE_JIT_CACHE
 
 
 def _to_list(obj):
@@ -169,6 +170,90 @@ def point_within_gca(pt, gca_cart, is_directed=False):
             )
 
 
+@njit(cache=ENABLE_JIT_CACHE)
+def _point_within_minor_gca(px, py, pz, v0, v1):
+    """Compiled check of whether a point lies on the undirected Great Circle
+    Arc (the side less than 180 degrees) between the Cartesian coordinates
+    ``v0`` and ``v1``.
+
+    Unlike (``point_within_gca``), the check is performed using the signs of
+    the triple products of the point with each end point of the arc, which
+    does not require a conversion to longitude and latitude or special
+    handling of arcs crossing the anti-meridian or a pole. Arcs spanning
+    exactly 180 degrees are ambiguous and never contain the point.
+    """
+    nx = v0[1] * v1[2] - v0[2] * v1[1]
+    ny = v0[2] * v1[0] - v0[0] * v1[2]
+    nz = v0[0] * v1[1] - v0[1] * v1[0]
+
+    # the point must lie on the plane of the arc
+    if abs(nx * px + ny * py + nz * pz) > ERROR_TOLERANCE:
+        return False
+
+    n_norm = np.sqrt(nx * nx + ny * ny + nz * nz)
+    if n_norm <= ERROR_TOLERANCE:
+        if v0[0] * v1[0] + v0[1] * v1[1] + v0[2] * v1[2] < 0:
+            # end points are antipodal, the arc has infinitely many planes
+            return False
+        # degenerate arc, the point must coincide with its end points
+        return (
+            abs(px - v0[0]) <= ERROR_TOLERANCE
+            and abs(py - v0[1]) <= ERROR_TOLERANCE
+            and abs(pz - v0[2]) <= ERROR_TOLERANCE
+        )
+
+    # (v0 x p) . n and (p x v1) . n are both non-negative only between v0 and v1
+    from_v0 = (
+        (v0[1] * pz - v0[2] * py) * nx
+        + (v0[2] * px - v0[0] * pz) * ny
+        + (v0[0] * py - v0[1] * px) * nz
+    )
+    to_v1 = (
+        (py * v1[2] - pz * v1[1]) * nx
+        + (pz * v1[0] - px * v1[2]) * ny
+        + (px * v1[1] - py * v1[0]) * nz
+    )
+
+    return from_v0 >= -ERROR_TOLERANCE * n_norm and to_v1 >= -ERROR_TOLERANCE * n_norm
+
+
+def point_within_gca_batch(pts, gca_cart):
+    """Check whether each point lies on each undirected Great Circle Arc (GCA)
+    in a single compiled call.
+
+    Batched equivalent of (``point_within_gca``) with ``is_directed=False``,
+    where the GCA is always assumed to be the side less than 180 degrees.
+
+    Parameters
+    ----------
+    pts : np.ndarray
+        Cartesian coordinates of the points, with shape ``(n, 3)``
+    gca_cart : np.ndarray
+        Cartesian coordinates of the end points of each GCA, with shape ``(m, 2, 3)``
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array with shape ``(n, m)`` indicating whether each point lies on each GCA
+    """
+    pts = np.ascontiguousarray(pts, dtype=np.float64).reshape(-1, 3)
+    gca_cart = np.ascontiguousarray(gca_cart, dtype=np.float64).reshape(-1, 2, 3)
+
+    return _point_within_gca_batch(pts, gca_cart)
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _point_within_gca_batch(pts, gca_cart):
+    """Compiled kernel for (``point_within_gca_batch``)."""
+    within = np.zeros((pts.shape[0], gca_cart.shape[0]), dtype=np.bool_)
+    for i in range(pts.shape[0]):
+        for j in range(gca_cart.shape[0]):
+            within[i, j] = _point_within_minor_gca(
+                pts[i, 0], pts[i, 1], pts[i, 2], gca_cart[j, 0], gca_cart[j, 1]
+            )
+    return within
+
+
 def in_between(p, q, r) -> bool:
     """Determines whether the number q is between p and r.
 
@@ -306,3 +391,95 @@ def extreme_gca_latitude(gca_cart, extreme_type):
         )
     else:
         return max(lat_n1, lat_n2) if extreme_type == "max" else min(lat_n1, lat_n2)
+
+
+def extreme_gca_latitude_batch(gca_cart, extreme_type):
+    """Calculate the maximum or minimum latitude of each great circle arc in a
+    single compiled call.
+
+    Batched equivalent of (``extreme_gca_latitude``).
+
+    Parameters
+    ----------
+    gca_cart : numpy.ndarray
+        Cartesian coordinates of the end points of each great circle arc, with shape ``(n, 2, 3)``
+
+    extreme_type : str
+        The type of extreme latitude to calculate. Must be either 'max' or 'min'.
+
+    Returns
+    -------
+    numpy.ndarray
+        The maximum or minimum latitude of each great circle arc in radians, with shape ``(n, )``
+
+    Raises
+    ------
+    ValueError
+        If `extreme_type` is not 'max' or 'min'.
+    """
+    extreme_type = extreme_type.lower()
+
+    if extreme_type not in ("max", "min"):
+        raise ValueError("extreme_type must be either 'max' or 'min'")
+
+    gca_cart = np.ascontiguousarray(gca_cart, dtype=np.float64).reshape(-1, 2, 3)
+
+    extremes = _extreme_gca_latitudes(gca_cart)
+
+    return extremes[:, 1] if extreme_type == "max" else extremes[:, 0]
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _lat_rad(x, y, z):
+    """Compiled equivalent of the latitude returned by
+    (``_xyz_to_lonlat_rad``) for a single point."""
+    norm = np.sqrt(x * x + y * y + z * z)
+    z = z / norm
+
+    if abs(z) > 1.0 - ERROR_TOLERANCE:
+        return np.sign(z) * np.pi / 2
+    return np.arcsin(z)
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _extreme_gca_latitudes(gca_cart):
+    """Computes the minimum and maximum latitude in radians of each great
+    circle arc, with shape ``(n, 2)``."""
+    extremes = np.empty((gca_cart.shape[0], 2), dtype=np.float64)
+
+    for i in range(gca_cart.shape[0]):
+        n1 = gca_cart[i, 0]
+        n2 = gca_cart[i, 1]
+
+        lat_min = _lat_rad(n1[0], n1[1], n1[2])
+        lat_max = lat_min
+        lat_n2 = _lat_rad(n2[0], n2[1], n2[2])
+        lat_min = min(lat_min, lat_n2)
+        lat_max = max(lat_max, lat_n2)
+
+        dot_n1_n2 = n1[0] * n2[0] + n1[1] * n2[1] + n1[2] * n2[2]
+        denom = (n1[2] + n2[2]) * (dot_n1_n2 - 1.0)
+
+        if denom != 0.0:
+            d_a_max = (n1[2] * dot_n1_n2 - n2[2]) / denom
+
+            # matches np.isclose(d_a_max, [0, 1], atol=ERROR_TOLERANCE), including its relative tolerance
+            if (
+                abs(d_a_max) <= ERROR_TOLERANCE
+                or abs(d_a_max - 1.0) <= ERROR_TOLERANCE + 1e-5
+            ):
+                d_a_max = min(max(d_a_max, 0.0), 1.0)
+
+            if 0 < d_a_max < 1:
+                # latitude of the point along the arc where the extreme occurs
+                node3 = (1 - d_a_max) * n1 + d_a_max * n2
+                norm = np.sqrt(np.sum(node3 * node3))
+                d_lat_rad = np.arcsin(min(max(node3[2] / norm, -1.0), 1.0))
+
+                lat_min = min(lat_min, d_lat_rad)
+                lat_max = max(lat_max, d_lat_rad)
+
+        extremes[i, 0] = lat_min
+        extremes[i, 1] = lat_max
+
+    return extremes
@@ -1,9 +1,7 @@
 import xarray as xr
 import numpy as np
 
-import warnings
-
-from uxarray.constants import ERROR_TOLERANCE
+from uxarray.constants import ERROR_TOLERANCE, ENABLE_JIT_CACHE
 from uxarray.conventions import ugrid
 
 from typing import Union
@@ -163,49 +161,54 @@ def _populate_node_xyz(grid) -> None:
     )
 
 
-def _populate_face_centroids(grid, repopulate=False):
-    """Finds the centroids of faces using cartesian averaging based off the
-    vertices. The centroid is defined as the average of the x, y, z
-    coordinates, normalized. This cannot be guaranteed to work on concave
-    polygons.
+def _populate_face_centroids(grid, repopulate=False, method="cartesian average"):
+    """Finds the centroids of faces and populates both their Cartesian
+    (``face_x``, ``face_y``, ``face_z``) and spherical (``face_lon``,
+    ``face_lat``) coordinates in a single pass, deriving one from the other
+    if only one of them is stored.
 
     Parameters
     ----------
     repopulate : bool, optional
         Bool used to turn on/off repopulating the face coordinates of the centroids
+    method : str, default="cartesian average"
+        Method used to compute the centroids, either "cartesian average", the normalized average of the x, y, z
+        coordinates of the nodes of each face, which cannot be guaranteed to work on concave polygons, or
+        "spherical", the area-weighted centroid of each face on the sphere
     """
-    warnings.warn("This cannot be guaranteed to work correctly on concave polygons")
-
-    node_x = grid.node_x.values
-    node_y = grid.node_y.values
-    node_z = grid.node_z.values
-    face_nodes = grid.face_node_connectivity.values
-    n_nodes_per_face = grid.n_nodes_per_face.values
-
-    if "face_lon" not in grid._ds or repopulate:
-        # Construct the centroids if there are none stored
-        if "face_x" not in grid._ds:
-            centroid_x, centroid_y, centroid_z = _construct_face_centroids(
-                node_x, node_y, node_z, face_nodes, n_nodes_per_face
-            )
-
-        else:
-            # If there are cartesian centroids already use those instead
-            centroid_x, centroid_y, centroid_z = grid.face_x, grid.face_y, grid.face_z
-
-        # Convert from xyz to latlon TODO
-        centroid_lon, centroid_lat = _xyz_to_lonlat_deg(
-            centroid_x, centroid_y, centroid_z, normalize=False
+    has_xyz = "face_x" in grid._ds and not repopulate
+    has_latlon = "face_lon" in grid._ds and not repopulate
+
+    if has_xyz and has_latlon:
+        return
+
+    if has_xyz:
+        # If there are cartesian centroids already use those instead
+        centroid_x, centroid_y, centroid_z = (
+            grid.face_x.values,
+            grid.face_y.values,
+            grid.face_z.values,
         )
-    else:
+    elif has_latlon:
         # Convert to xyz if there are latlon centroids already stored
-        centroid_lon, centroid_lat = grid.face_lon.values, grid.face_lat.values
         centroid_x, centroid_y, centroid_z = _lonlat_rad_to_xyz(
-            centroid_lon, centroid_lat
+            np.deg2rad(grid.face_lon.values), np.deg2rad(grid.face_lat.values)
+        )
+    else:
+        centroid_x, centroid_y, centroid_z = _construct_face_centroids(
+            grid.node_x.values,
+            grid.node_y.values,
+            grid.node_z.values,
+            grid.face_node_connectivity.values,
+            grid.n_nodes_per_face.values,
+            method=method,
+        )
+
+    if not has_latlon:
+        centroid_lon, centroid_lat = _xyz_to_lonlat_deg(
+            centroid_x, centroid_y, centroid_z, normalize=False
         )
 
-    # Populate the centroids
-    if "face_lon" not in grid._ds or repopulate:
         grid._ds["face_lon"] = xr.DataArray(
             centroid_lon, dims=[ugrid.FACE_DIM], attrs=ugrid.FACE_LON_ATTRS
         )
@@ -213,7 +216,7 @@ def _populate_face_centroids(grid, repopulate=False):
             centroid_lat, dims=[ugrid.FACE_DIM], attrs=ugrid.FACE_LAT_ATTRS
         )
 
-    if "face_x" not in grid._ds or repopulate:
+    if not has_xyz:
         grid._ds["face_x"] = xr.DataArray(
             centroid_x, dims=[ugrid.FACE_DIM], attrs=ugrid.FACE_X_ATTRS
         )
@@ -227,23 +230,124 @@ def _populate_face_centroids(grid, repopulate=False):
         )
 
 
-def _construct_face_centroids(node_x, node_y, node_z, face_nodes, n_nodes_per_face):
-    """Constructs the xyz centroid coordinate for each face using Cartesian
-    Averaging."""
-
-    centroid_x = np.zeros((face_nodes.shape[0]), dtype=np.float64)
-    centroid_y = np.zeros((face_nodes.shape[0]), dtype=np.float64)
-    centroid_z = np.zeros((face_nodes.shape[0]), dtype=np.float64)
+def _construct_face_centroids(
+    node_x, node_y, node_z, face_nodes, n_nodes_per_face, method="cartesian average"
+):
+    """Constructs the xyz centroid coordinate for each face using either
+    Cartesian Averaging ("cartesian average") or their area-weighted
+    centroid on the sphere ("spherical")."""
+    node_x = np.asarray(node_x, dtype=np.float64)
+    node_y = np.asarray(node_y, dtype=np.float64)
+    node_z = np.asarray(node_z, dtype=np.float64)
 
-    for face_idx, n_max_nodes in enumerate(n_nodes_per_face):
-        # Compute Cartesian Average
-        centroid_x[face_idx] = np.mean(node_x[face_nodes[face_idx, 0:n_max_nodes]])
-        centroid_y[face_idx] = np.mean(node_y[face_nodes[face_idx, 0:n_max_nodes]])
-        centroid_z[face_idx] = np.mean(node_z[face_nodes[face_idx, 0:n_max_nodes]])
+    if method == "cartesian average":
+        centroid_x, centroid_y, centroid_z = _face_centroids_cartesian_average(
+            node_x, node_y, node_z, face_nodes, n_nodes_per_face
+        )
+    elif method == "spherical":
+        centroid_x, centroid_y, centroid_z = _face_centroids_spherical(
+            *_normalize_xyz(node_x, node_y, node_z), face_nodes, n_nodes_per_face
+        )
+    else:
+        raise ValueError(
+            f"Invalid centroid method: {method}. Expected one of "
+            f"'cartesian average' or 'spherical'"
+        )
 
     return _normalize_xyz(centroid_x, centroid_y, centroid_z)
 
 
+@njit(cache=ENABLE_JIT_CACHE)
+def _face_centroids_cartesian_average(
+    node_x, node_y, node_z, face_nodes, n_nodes_per_face
+):
+    """Average of the xyz coordinates of the nodes of each face, reading only
+    the first ``n_nodes_per_face`` entries of each padded row of
+    ``face_nodes``."""
+    n_face = face_nodes.shape[0]
+
+    centroid_x = np.zeros(n_face, dtype=np.float64)
+    centroid_y = np.zeros(n_face, dtype=np.float64)
+    centroid_z = np.zeros(n_face, dtype=np.float64)
+
+    for face_idx in range(n_face):
+        n_nodes = n_nodes_per_face[face_idx]
+        for i in range(n_nodes):
+            node = face_nodes[face_idx, i]
+            centroid_x[face_idx] += node_x[node]
+            centroid_y[face_idx] += node_y[node]
+            centroid_z[face_idx] += node_z[node]
+        centroid_x[face_idx] /= n_nodes
+        centroid_y[face_idx] /= n_nodes
+        centroid_z[face_idx] /= n_nodes
+
+    return centroid_x, centroid_y, centroid_z
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _face_centroids_spherical(node_x, node_y, node_z, face_nodes, n_nodes_per_face):
+    """Area-weighted centroid of each face on the unit sphere, with edges as
+    great circle arcs between the (normalized) nodes.
+
+    The integral of the position over a spherical polygon is half the sum of
+    the unit normal of each edge weighted by the angle it spans, which is
+    oriented using the Cartesian average of the nodes so that it does not
+    depend on the winding order of the face. Faces with a vanishing area fall
+    back to the Cartesian average.
+    """
+    n_face = face_nodes.shape[0]
+
+    centroid_x = np.zeros(n_face, dtype=np.float64)
+    centroid_y = np.zeros(n_face, dtype=np.float64)
+    centroid_z = np.zeros(n_face, dtype=np.float64)
+
+    for face_idx in range(n_face):
+        n_nodes = n_nodes_per_face[face_idx]
+
+        mean_x, mean_y, mean_z = 0.0, 0.0, 0.0
+        sum_x, sum_y, sum_z = 0.0, 0.0, 0.0
+
+        last = face_nodes[face_idx, n_nodes - 1]
+        ax, ay, az = node_x[last], node_y[last], node_z[last]
+        for i in range(n_nodes):
+            node = face_nodes[face_idx, i]
+            bx, by, bz = node_x[node], node_y[node], node_z[node]
+
+            mean_x += bx
+            mean_y += by
+            mean_z += bz
+
+            cross_x = ay * bz - az * by
+            cross_y = az * bx - ax * bz
+            cross_z = ax * by - ay * bx
+            sin_angle = np.sqrt(cross_x**2 + cross_y**2 + cross_z**2)
+
+            # repeated nodes do not span an edge
+            if sin_angle != 0.0:
+                scale = np.arctan2(sin_angle, ax * bx + ay * by + az * bz) / sin_angle
+                sum_x += scale * cross_x
+                sum_y += scale * cross_y
+                sum_z += scale * cross_z
+
+            ax, ay, az = bx, by, bz
+
+        orientation = sum_x * mean_x + sum_y * mean_y + sum_z * mean_z
+        if abs(orientation) <= ERROR_TOLERANCE * ERROR_TOLERANCE:
+            centroid_x[face_idx] = mean_x
+            centroid_y[face_idx] = mean_y
+            centroid_z[face_idx] = mean_z
+        elif orientation < 0:
+            centroid_x[face_idx] = -sum_x
+            centroid_y[face_idx] = -sum_y
+            centroid_z[face_idx] = -sum_z
+        else:
+            centroid_x[face_idx] = sum_x
+            centroid_y[face_idx] = sum_y
+            centroid_z[face_idx] = sum_z
+
+    return centroid_x, centroid_y, centroid_z
+
+
 def _populate_edge_centroids(grid, repopulate=False):
     """Finds the centroids using cartesian averaging of the edges based off the
     vertices. The centroid is defined as the average of the x, y, z
@@ -1,11 +1,20 @@
 import numpy as np
-from uxarray.constants import INT_DTYPE, ERROR_TOLERANCE, INT_FILL_VALUE
+from uxarray.constants import (
+    INT_DTYPE,
+    ERROR_TOLERANCE,
+    INT_FILL_VALUE,
+    ENABLE_JIT_CACHE,
+)
 from uxarray.grid.intersections import gca_gca_intersection
-from uxarray.grid.arcs import extreme_gca_latitude, point_within_gca
+from uxarray.grid.arcs import (
+    point_within_gca,
+    _extreme_gca_latitudes,
+)
 from uxarray.grid.utils import (
     _get_cartesian_face_edge_nodes,
     _get_lonlat_rad_face_edge_nodes,
 )
+import sys
 import warnings
 import pandas as pd
 import xarray as xr
@@ -19,6 +28,9 @@ GDF_POLYGON_THRESHOLD = 100000
 
 REFERENCE_POINT_EQUATOR = np.array([1.0, 0.0, 0.0])
 
+# maximum number of shells that a single face is split into across the antimeridian
+MAX_ANTIMERIDIAN_SPLITS = 3
+
 
 # General Helpers for Polygon Viz
 # ----------------------------------------------------------------------------------------------------------------------
@@ -74,29 +86,589 @@ def _build_polygon_shells(
     return polygon_shells
 
 
-def _grid_to_polygon_geodataframe(grid, exclude_antimeridian):
-    """Converts the faces of a ``Grid`` into a ``spatialpandas.GeoDataFrame``
-    with a geometry column of polygons."""
+def _get_polygon_shells(grid):
+    """Returns the closed polygon shells of each face of a grid, which are
+    constructed once and stored in ``Grid._geometry_cache``."""
+    if "polygon_shells" not in grid._geometry_cache:
+        grid._geometry_cache["polygon_shells"] = _build_polygon_shells(
+            grid.node_lon.values,
+            grid.node_lat.values,
+            grid.face_node_connectivity.values,
+            grid.n_face,
+            grid.n_max_face_nodes,
+            grid.n_nodes_per_face.values,
+        )
+    return grid._geometry_cache["polygon_shells"]
+
+
+def _get_corrected_polygon_shells(grid):
+    """Returns the polygon shells of a grid with antimeridian polygons split
+    and the original face of each shell, which are constructed once and
+    stored in ``Grid._geometry_cache``."""
+    if "corrected_polygon_shells" not in grid._geometry_cache:
+        (
+            grid._geometry_cache["corrected_polygon_shells"],
+            grid._geometry_cache["corrected_to_original_faces"],
+        ) = _build_corrected_polygon_shells(
+            _get_polygon_shells(grid), grid.antimeridian_face_indices
+        )
+    return (
+        grid._geometry_cache["corrected_polygon_shells"],
+        grid._geometry_cache["corrected_to_original_faces"],
+    )
 
-    polygon_shells = _build_polygon_shells(
-        grid.node_lon.values,
-        grid.node_lat.values,
-        grid.face_node_connectivity.values,
-        grid.n_face,
-        grid.n_max_face_nodes,
-        grid.n_nodes_per_face.values,
+
+def _project_points(lon, lat, projection):
+    """Transforms longitudes and latitudes in degrees to the coordinates of a
+    cartopy projection, returning an array with the last dimension holding
+    the projected x and y coordinates."""
+    from cartopy import crs as ccrs
+
+    return projection.transform_points(
+        ccrs.PlateCarree(),
+        np.asarray(lon, dtype=np.float64),
+        np.asarray(lat, dtype=np.float64),
+    )[..., :2]
+
+
+def _build_projected_polygon_shells(polygon_shells, projection):
+    """Splits closed polygon shells at the seam of a cartopy projection, the
+    antipode of its central longitude, and transforms them to the
+    coordinates of the projection.
+
+    Shells are shifted so that the seam lies on the antimeridian before they are split, and shifted back before they
+    are projected, so that split shells end on either side of the seam. Shells with a vertex outside the projection
+    domain are dropped.
+
+    Parameters
+    ----------
+    polygon_shells : np.ndarray
+        Closed polygon shells of each face, as returned by ``_build_polygon_shells``
+    projection : cartopy.crs.Projection
+        Projection to transform the shells to
+
+    Returns
+    -------
+    projected_shells : np.ndarray
+        Projected shells, with the shells that cross the seam split
+    shell_faces : np.ndarray
+        Original face of each projected shell
+    seam_face_indices : np.ndarray
+        Index of each face that crosses the seam of the projection
+    """
+    # the central longitude of a ``PlateCarree`` projection is stored as its prime meridian
+    central_longitude = float(projection.proj4_params.get("lon_0", 0.0)) + float(
+        projection.proj4_params.get("pm", 0.0)
     )
 
-    antimeridian_face_indices = _build_antimeridian_face_indices(
-        polygon_shells[:, :, 0]
+    if central_longitude != 0.0:
+        polygon_shells = polygon_shells.copy()
+        shifted_lon = (
+            polygon_shells[..., 0] - central_longitude + 180.0
+        ) % 360.0 - 180.0
+
+        # vertices on the seam are placed on the side of the nearest vertex of their shell that is not on the seam
+        on_seam = np.abs(shifted_lon) == 180.0
+        off_seam_lon = np.where(on_seam, 0.0, shifted_lon)
+        side = np.take_along_axis(
+            off_seam_lon, np.abs(off_seam_lon).argmax(axis=1)[:, None], axis=1
+        )
+        polygon_shells[..., 0] = np.where(
+            on_seam, np.copysign(180.0, side), shifted_lon
+        )
+
+    seam_face_indices = _build_antimeridian_face_indices(polygon_shells[:, :, 0])
+    corrected_polygon_shells, corrected_to_original_faces = (
+        _build_corrected_polygon_shells(polygon_shells, seam_face_indices)
+    )
+
+    projected_shells = _project_points(
+        corrected_polygon_shells[..., 0].astype(np.float64) + central_longitude,
+        corrected_polygon_shells[..., 1],
+        projection,
+    )
+
+    # vertices on the seam are projected to either side of it, so they are placed on the side of their shell
+    on_seam = np.abs(corrected_polygon_shells[..., 0]) == 180.0
+    projected_shells[on_seam, 0] = np.copysign(
+        projected_shells[on_seam, 0], corrected_polygon_shells[on_seam, 0]
+    )
+
+    inside = np.isfinite(projected_shells).all(axis=(1, 2))
+    return (
+        projected_shells[inside],
+        corrected_to_original_faces[inside],
+        seam_face_indices,
+    )
+
+
+def _get_projected_coordinates(grid, element, projection):
+    """Returns the coordinates of the nodes, faces or edges of a grid in a
+    cartopy projection, which are transformed once for each projection and
+    stored in ``Grid._geometry_cache``.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    element : str
+        Grid element to project, one of "node", "face" or "edge"
+    projection : cartopy.crs.Projection
+        Projection to transform the coordinates to
+
+    Returns
+    -------
+    projected_coordinates : np.ndarray
+        Projected x and y coordinates of each element, shape ``(n_element, 2)``
+    """
+    if element not in ("node", "face", "edge"):
+        raise ValueError(
+            f"Invalid element: {element}. Expected one of 'node', 'face' or 'edge'"
+        )
+
+    cache_key = ("projected_coordinates", element, projection.proj4_init)
+    if cache_key not in grid._geometry_cache:
+        grid._geometry_cache[cache_key] = _project_points(
+            getattr(grid, f"{element}_lon").values,
+            getattr(grid, f"{element}_lat").values,
+            projection,
+        )
+    return grid._geometry_cache[cache_key]
+
+
+def _get_point_coordinates(grid, element, projection=None):
+    """Returns a ``pandas.DataFrame`` with the ``lon`` and ``lat`` columns of
+    the nodes, faces or edges of a grid, optionally in a cartopy projection,
+    which is constructed once and stored in ``Grid._geometry_cache``.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    element : str
+        Grid element, one of "node", "face" or "edge"
+    projection : cartopy.crs.Projection, optional
+        Projection to transform the coordinates to
+
+    Returns
+    -------
+    point_coordinates : pandas.DataFrame
+        Coordinates of each element, shape ``(n_element, 2)``
+    """
+    if projection is not None:
+        cache_key = ("point_coordinates", element, projection.proj4_init)
+    else:
+        cache_key = ("point_coordinates", element, None)
+
+    if cache_key not in grid._geometry_cache:
+        if projection is not None:
+            lon, lat = _get_projected_coordinates(grid, element, projection).T
+        elif element in ("node", "face", "edge"):
+            lon = getattr(grid, f"{element}_lon").values
+            lat = getattr(grid, f"{element}_lat").values
+        else:
+            raise ValueError(
+                f"Invalid element: {element}. Expected one of 'node', 'face' or 'edge'"
+            )
+        grid._geometry_cache[cache_key] = pd.DataFrame(
+            {
+                "lon": np.ascontiguousarray(lon, dtype=np.float64),
+                "lat": np.ascontiguousarray(lat, dtype=np.float64),
+            }
+        )
+    return grid._geometry_cache[cache_key]
+
+
+def _get_projected_polygon_shells(grid, projection):
+    """Returns the polygon shells of a grid, split at the seam of a cartopy
+    projection and in its coordinates, the original face of each shell and
+    the faces that cross the seam, as returned by
+    ``_build_projected_polygon_shells``, which are transformed once for each
+    projection and stored in ``Grid._geometry_cache``."""
+    shells_key = ("projected_polygon_shells", projection.proj4_init)
+    faces_key = ("projected_polygon_shell_faces", projection.proj4_init)
+    seam_key = ("projected_seam_face_indices", projection.proj4_init)
+
+    if shells_key not in grid._geometry_cache:
+        (
+            grid._geometry_cache[shells_key],
+            grid._geometry_cache[faces_key],
+            grid._geometry_cache[seam_key],
+        ) = _build_projected_polygon_shells(_get_polygon_shells(grid), projection)
+
+    return (
+        grid._geometry_cache[shells_key],
+        grid._geometry_cache[faces_key],
+        grid._geometry_cache[seam_key],
+    )
+
+
+def _get_trimesh(grid):
+    """Returns the fan triangulation of the faces of a grid, as returned by
+    ``_build_trimesh``, which is constructed once and stored in
+    ``Grid._geometry_cache``."""
+    if "trimesh_triangles" not in grid._geometry_cache:
+        (
+            grid._geometry_cache["trimesh_triangles"],
+            grid._geometry_cache["trimesh_triangle_faces"],
+            grid._geometry_cache["trimesh_vertices"],
+            grid._geometry_cache["trimesh_vertex_nodes"],
+        ) = _build_trimesh(
+            grid.node_lon.values,
+            grid.node_lat.values,
+            grid.face_node_connectivity.values,
+            grid.n_nodes_per_face.values,
+        )
+    return (
+        grid._geometry_cache["trimesh_triangles"],
+        grid._geometry_cache["trimesh_triangle_faces"],
+        grid._geometry_cache["trimesh_vertices"],
+        grid._geometry_cache["trimesh_vertex_nodes"],
+    )
+
+
+def _build_trimesh(node_lon, node_lat, face_node_connectivity, n_nodes_per_face):
+    """Triangulates each face as a fan of triangles from its first node.
+
+    Faces that encircle a pole are instead split into a quadrilateral between each of their edges and the pole, and
+    triangles with a vertex on a pole are extended along the pole, since its longitude is undefined. Triangles that
+    cross the antimeridian are split into two copies, one with its vertices shifted east and the other
+    with its vertices shifted west of the antimeridian, which are each clipped to [-180, 180] degrees of longitude when
+    rasterized.
+
+    The fan only covers a face exactly if the face is convex, so the triangles of a non-convex face may overlap each
+    other and extend outside of the face.
+
+    Parameters
+    ----------
+    node_lon, node_lat : np.ndarray
+        Longitude and latitude of each node in degrees
+    face_node_connectivity : np.ndarray
+        Nodes of each face
+    n_nodes_per_face : np.ndarray
+        Number of nodes of each face
+
+    Returns
+    -------
+    triangles : np.ndarray
+        Vertices of each triangle, shape ``(n_triangle, 3)``
+    triangle_faces : np.ndarray
+        Face that each triangle belongs to, shape ``(n_triangle, )``
+    vertices : np.ndarray
+        Longitude and latitude of each vertex, with the nodes of the grid followed by the shifted vertices of the
+        triangles that cross the antimeridian, shape ``(n_vertex, 2)``
+    vertex_nodes : np.ndarray
+        Node of the grid that each vertex corresponds to, shape ``(n_vertex, )``
+    """
+    n_face = face_node_connectivity.shape[0]
+    n_node = node_lon.shape[0]
+
+    # faces with n nodes are split into n - 2 triangles
+    n_triangles_per_face = np.maximum(n_nodes_per_face - 2, 0)
+    triangle_faces = np.repeat(np.arange(n_face, dtype=INT_DTYPE), n_triangles_per_face)
+    first_triangle = np.cumsum(n_triangles_per_face) - n_triangles_per_face
+    local_index = (
+        np.arange(triangle_faces.size, dtype=INT_DTYPE)
+        - first_triangle[triangle_faces]
+        + 1
     )
 
+    triangles = np.stack(
+        [
+            face_node_connectivity[triangle_faces, 0],
+            face_node_connectivity[triangle_faces, local_index],
+            face_node_connectivity[triangle_faces, local_index + 1],
+        ],
+        axis=-1,
+    ).astype(INT_DTYPE)
+
+    vertices = np.column_stack([node_lon, node_lat]).astype(np.float64)
+    vertex_nodes = np.arange(n_node, dtype=INT_DTYPE)
+
+    # faces that encircle a pole are triangulated as a band of quadrilaterals between each edge and the pole,
+    # instead of a fan
+    closed_face_nodes = _pad_closed_face_nodes(
+        face_node_connectivity,
+        n_face,
+        face_node_connectivity.shape[1],
+        n_nodes_per_face,
+    )
+    edge_lon_deltas = (
+        np.diff(vertices[closed_face_nodes, 0], axis=1) + 180
+    ) % 360 - 180
+
+    # faces with a node on a pole already reach it, and the longitude of that node is arbitrary
+    has_pole_node = np.any(
+        np.abs(vertices[closed_face_nodes, 1]) >= 90.0 - ERROR_TOLERANCE, axis=1
+    )
+    pole_faces = np.flatnonzero(
+        (np.abs(edge_lon_deltas.sum(axis=1)) > 180) & ~has_pole_node
+    )
+
+    if pole_faces.size > 0:
+        start_nodes = closed_face_nodes[pole_faces, :-1]
+        end_nodes = closed_face_nodes[pole_faces, 1:]
+        is_edge = start_nodes != end_nodes
+        edge_faces = np.broadcast_to(pole_faces[:, None], is_edge.shape)[is_edge]
+        a, b = start_nodes[is_edge], end_nodes[is_edge]
+
+        pole_lat = np.where(
+            np.bincount(
+                np.searchsorted(pole_faces, edge_faces),
+                weights=vertices[a, 1],
+                minlength=pole_faces.size,
+            )
+            > 0,
+            90.0,
+            -90.0,
+        )[np.searchsorted(pole_faces, edge_faces)]
+
+        n_vertex = vertices.shape[0]
+        pole_a = n_vertex + np.arange(a.size, dtype=INT_DTYPE)
+        pole_b = pole_a + a.size
+
+        vertices = np.concatenate(
+            [
+                vertices,
+                np.column_stack([vertices[a, 0], pole_lat]),
+                np.column_stack([vertices[b, 0], pole_lat]),
+            ]
+        )
+        vertex_nodes = np.concatenate([vertex_nodes, a, b])
+
+        keep = ~np.isin(triangle_faces, pole_faces)
+        triangles = np.concatenate(
+            [
+                triangles[keep],
+                np.column_stack([a, b, pole_b]),
+                np.column_stack([a, pole_b, pole_a]),
+            ]
+        )
+        triangle_faces = np.concatenate([triangle_faces[keep], edge_faces, edge_faces])
+
+    # a pole is a line of constant latitude, so triangles with a pole vertex are extended into a quadrilateral
+    # along the pole, between the longitudes of the other two vertices
+    is_pole_vertex = np.abs(vertices[:, 1]) >= 90.0 - ERROR_TOLERANCE
+    is_pole_vertex[n_node:] = False
+    triangle_poles = is_pole_vertex[triangles]
+    pole_triangles = np.flatnonzero(triangle_poles.sum(axis=1) == 1)
+
+    if pole_triangles.size > 0:
+        # rotate the vertices of each triangle to start at its pole vertex
+        first = np.argmax(triangle_poles[pole_triangles], axis=1)
+        pole, a, b = np.take_along_axis(
+            triangles[pole_triangles], (first[:, None] + np.arange(3)) % 3, axis=1
+        ).T
+
+        n_vertex = vertices.shape[0]
+        pole_a = n_vertex + np.arange(pole_triangles.size, dtype=INT_DTYPE)
+        pole_b = pole_a + pole_triangles.size
+
+        vertices = np.concatenate(
+            [
+                vertices,
+                np.column_stack([vertices[a, 0], vertices[pole, 1]]),
+                np.column_stack([vertices[b, 0], vertices[pole, 1]]),
+            ]
+        )
+        vertex_nodes = np.concatenate([vertex_nodes, pole, pole])
+
+        triangles[pole_triangles] = np.column_stack([pole_a, a, b])
+        triangles = np.concatenate([triangles, np.column_stack([pole_a, b, pole_b])])
+        triangle_faces = np.concatenate(
+            [triangle_faces, triangle_faces[pole_triangles]]
+        )
+
+    triangle_lon = vertices[triangles, 0]
+    crossing = np.flatnonzero(triangle_lon.max(axis=1) - triangle_lon.min(axis=1) > 180)
+
+    if crossing.size > 0:
+        crossing_vertices = triangles[crossing].ravel()
+        crossing_lon = vertices[crossing_vertices, 0]
+        crossing_lat = vertices[crossing_vertices, 1]
+
+        east_lon = np.where(crossing_lon < 0, crossing_lon + 360, crossing_lon)
+        west_lon = np.where(crossing_lon > 0, crossing_lon - 360, crossing_lon)
+
+        # each copy of a crossing triangle has its own vertices
+        n_vertex = vertices.shape[0]
+        east_vertices = n_vertex + np.arange(crossing_vertices.size, dtype=INT_DTYPE)
+        west_vertices = east_vertices + crossing_vertices.size
+
+        vertices = np.concatenate(
+            [
+                vertices,
+                np.column_stack([east_lon, crossing_lat]),
+                np.column_stack([west_lon, crossing_lat]),
+            ]
+        )
+        crossing_nodes = vertex_nodes[crossing_vertices]
+        vertex_nodes = np.concatenate([vertex_nodes, crossing_nodes, crossing_nodes])
+
+        triangles[crossing] = east_vertices.reshape(-1, 3)
+        triangles = np.concatenate([triangles, west_vertices.reshape(-1, 3)])
+        triangle_faces = np.concatenate([triangle_faces, triangle_faces[crossing]])
+
+    return triangles, triangle_faces, vertices, vertex_nodes
+
+
+def _raster_extent(x_range=None, y_range=None, projection=None):
+    """Returns the extent of a raster, defaulting to the whole globe in
+    either degrees or the coordinates of ``projection``."""
+    if x_range is None:
+        x_range = (-180.0, 180.0) if projection is None else projection.x_limits
+    if y_range is None:
+        y_range = (-90.0, 90.0) if projection is None else projection.y_limits
+    return (float(x_range[0]), float(x_range[1])), (
+        float(y_range[0]),
+        float(y_range[1]),
+    )
+
+
+def _get_raster_lookup(
+    grid, width, height, x_range=None, y_range=None, projection=None
+):
+    """Returns the face that covers each pixel of a raster, as returned by
+    ``_build_raster_lookup``, which is constructed once for each canvas and
+    projection and stored in ``Grid._geometry_cache``."""
+    x_range, y_range = _raster_extent(x_range, y_range, projection)
+
+    cache_key = (
+        "raster_lookup",
+        int(width),
+        int(height),
+        x_range,
+        y_range,
+        None if projection is None else projection.proj4_init,
+    )
+
+    if cache_key not in grid._geometry_cache:
+        if projection is None:
+            polygon_shells, shell_faces = _get_corrected_polygon_shells(grid)
+        else:
+            polygon_shells, shell_faces, _ = _get_projected_polygon_shells(
+                grid, projection
+            )
+        grid._geometry_cache[cache_key] = _build_raster_lookup(
+            polygon_shells,
+            shell_faces,
+            grid.n_face,
+            int(width),
+            int(height),
+            x_range,
+            y_range,
+        )
+    return grid._geometry_cache[cache_key]
+
+
+def _build_raster_lookup(
+    polygon_shells,
+    shell_faces,
+    n_face,
+    width,
+    height,
+    x_range,
+    y_range,
+):
+    """Rasterizes the index of each face onto a canvas, so that any face-
+    centered data variable can be rasterized onto the same canvas by indexing
+    it with the result.
+
+    Parameters
+    ----------
+    polygon_shells : np.ndarray
+        Polygon shells with antimeridian polygons split, as returned by ``_build_corrected_polygon_shells``, either
+        in degrees or projected
+    shell_faces : np.ndarray
+        Original face of each shell
+    n_face : int
+        Number of faces
+    width, height : int
+        Size of the canvas in pixels
+    x_range, y_range : tuple
+        Extent of the canvas, in the coordinates of the polygon shells
+
+    Returns
+    -------
+    raster_lookup : np.ndarray
+        Face that covers each pixel, with the first row at the top of the canvas and ``INT_FILL_VALUE`` for pixels
+        not covered by any face, shape ``(height, width)``
+    """
+    # import optional dependencies
+    import datashader as ds
+
+    gdf = _build_geodataframe_with_antimeridian(polygon_shells, shell_faces, n_face)
+    gdf["face_index"] = np.arange(n_face, dtype=INT_DTYPE)
+
+    cvs = ds.Canvas(
+        plot_width=width, plot_height=height, x_range=x_range, y_range=y_range
+    )
+    aggregated = cvs.polygons(gdf, geometry="geometry", agg=ds.max("face_index"))
+
+    # datashader aggregates with the first row at the bottom of the canvas
+    face_index = aggregated.values[::-1]
+
+    return np.where(np.isnan(face_index), INT_FILL_VALUE, face_index).astype(INT_DTYPE)
+
+
+def _geometry_cache_nbytes(grid):
+    """Returns the memory used by each entry of ``Grid._geometry_cache`` in
+    bytes."""
+    return {
+        key: _geometry_cache_entry_nbytes(value)
+        for key, value in grid._geometry_cache.items()
+    }
+
+
+def _geometry_cache_entry_nbytes(value):
+    """Returns the memory used by a single entry of ``Grid._geometry_cache``
+    in bytes, summing the members of tuples and lists."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (tuple, list)):
+        return sum(_geometry_cache_entry_nbytes(member) for member in value)
+
+    # matplotlib is only checked if it is already imported, since a collection can only be cached after it is
+    collections = sys.modules.get("matplotlib.collections")
+    if collections is not None and isinstance(value, collections.Collection):
+        # matplotlib collections store the vertices of each path
+        return sum(path.vertices.nbytes for path in value.get_paths())
+
+    return sys.getsizeof(value)
+
+
+def _grid_to_polygon_geodataframe(grid, exclude_antimeridian, projection=None):
+    """Converts the faces of a ``Grid`` into a ``spatialpandas.GeoDataFrame``
+    with a geometry column of polygons, in the coordinates of ``projection``
+    if provided."""
+
+    polygon_shells = _get_polygon_shells(grid)
+
+    antimeridian_face_indices = grid.antimeridian_face_indices
+
     if grid.n_face > GDF_POLYGON_THRESHOLD:
         warnings.warn(
-            "Converting to a GeoDataFrame with over 1,000,000 faces may take some time."
+            "Converting to a GeoDataFrame with over 1,000,000 faces may take some time. "
+            "Consider constructing it in partitions with ``npartitions``."
+        )
+
+    if projection is not None:
+        # build from the shells split at the seam of the projection, transformed once for each projection
+        projected_shells, shell_faces, seam_face_indices = (
+            _get_projected_polygon_shells(grid, projection)
+        )
+
+        return _build_projected_geodataframe(
+            projected_shells,
+            shell_faces,
+            grid.n_face,
+            seam_face_indices,
+            exclude_antimeridian,
         )
 
-    if len(grid.antimeridian_face_indices) == 0:
+    if len(antimeridian_face_indices) == 0:
         # if no faces cross antimeridian, no need to correct
         exclude_antimeridian = True
 
@@ -108,24 +680,174 @@ def _grid_to_polygon_geodataframe(grid, exclude_antimeridian):
     else:
         # build with antimeridian faces
         gdf = _build_geodataframe_with_antimeridian(
-            polygon_shells, antimeridian_face_indices
+            *_get_corrected_polygon_shells(grid), grid.n_face
         )
 
     return gdf
 
 
+def _grid_to_dask_geodataframe(
+    grid, exclude_antimeridian, npartitions, projection=None
+):
+    """Converts the faces of a ``Grid`` into a ``dask.dataframe.DataFrame``
+    with ``npartitions`` partitions of contiguous faces, each a
+    ``spatialpandas.GeoDataFrame`` that is constructed independently with
+    ``_build_geodataframe_partition`` when it is computed, so that the shells
+    of only a single partition are held in memory at once."""
+    import dask
+    import dask.dataframe as dd
+
+    if npartitions < 1:
+        raise ValueError(
+            f"Invalid npartitions: {npartitions}. Expected a positive number of partitions."
+        )
+
+    # each partition contains at least one face
+    npartitions = min(npartitions, grid.n_face)
+
+    node_lon = dask.delayed(grid.node_lon.values)
+    node_lat = dask.delayed(grid.node_lat.values)
+    face_node_connectivity = grid.face_node_connectivity.values
+    n_nodes_per_face = grid.n_nodes_per_face.values
+
+    face_bounds = np.linspace(0, grid.n_face, npartitions + 1).astype(INT_DTYPE)
+
+    partitions = [
+        dask.delayed(_build_geodataframe_partition)(
+            node_lon,
+            node_lat,
+            face_node_connectivity[start:stop],
+            n_nodes_per_face[start:stop],
+            start,
+            exclude_antimeridian,
+            projection,
+        )
+        for start, stop in zip(face_bounds[:-1], face_bounds[1:])
+    ]
+
+    # an empty partition with the columns and geometry type of every partition
+    meta = _build_geodataframe_partition(
+        grid.node_lon.values,
+        grid.node_lat.values,
+        face_node_connectivity[:0],
+        n_nodes_per_face[:0],
+        0,
+        exclude_antimeridian,
+        projection,
+    )
+
+    # partitions are indexed by the face indices that they contain
+    divisions = tuple(face_bounds[:-1].tolist()) + (grid.n_face - 1,)
+
+    return dd.from_delayed(partitions, meta=meta, divisions=divisions)
+
+
+def _build_geodataframe_partition(
+    node_lon,
+    node_lat,
+    face_node_connectivity,
+    n_nodes_per_face,
+    face_start,
+    exclude_antimeridian,
+    projection=None,
+):
+    """Builds a ``spatialpandas.GeoDataFrame`` of a contiguous range of faces
+    starting at ``face_start``, indexed by their face indices.
+
+    Faces are stored as polygons if ``exclude_antimeridian`` is set, and otherwise as multipolygons, so that the
+    geometry type does not depend on whether the partition contains a face that crosses the antimeridian.
+    """
+    n_face, n_max_face_nodes = face_node_connectivity.shape
+
+    polygon_shells = _build_polygon_shells(
+        node_lon,
+        node_lat,
+        face_node_connectivity,
+        n_face,
+        n_max_face_nodes,
+        n_nodes_per_face,
+    )
+    face_indices = face_start + np.arange(n_face, dtype=INT_DTYPE)
+
+    if projection is not None:
+        # faces are split, and excluded, at the seam of the projection instead of the antimeridian
+        projected_shells, shell_faces, antimeridian_face_indices = (
+            _build_projected_polygon_shells(polygon_shells, projection)
+        )
+
+        gdf = _build_projected_geodataframe(
+            projected_shells,
+            shell_faces,
+            n_face,
+            antimeridian_face_indices,
+            exclude_antimeridian,
+        )
+    else:
+        antimeridian_face_indices = _build_antimeridian_face_indices(
+            polygon_shells[:, :, 0]
+        )
+        if exclude_antimeridian:
+            gdf = _build_geodataframe_without_antimeridian(
+                polygon_shells, antimeridian_face_indices
+            )
+        else:
+            gdf = _build_geodataframe_with_antimeridian(
+                *_build_corrected_polygon_shells(
+                    polygon_shells, antimeridian_face_indices
+                ),
+                n_face,
+            )
+
+    if exclude_antimeridian:
+        face_indices = np.delete(face_indices, antimeridian_face_indices)
+    gdf.index = face_indices
+
+    return gdf
+
+
+def _build_projected_geodataframe(
+    projected_shells,
+    shell_faces,
+    n_face,
+    antimeridian_face_indices,
+    exclude_antimeridian,
+):
+    """Builds a ``spatialpandas.GeoDataFrame`` from projected shells and the
+    face of each shell, optionally dropping the faces that cross the
+    antimeridian and renumbering the remaining faces."""
+    n_rows = n_face
+
+    if exclude_antimeridian:
+        kept_faces = np.setdiff1d(np.arange(n_face), antimeridian_face_indices)
+        keep = np.isin(shell_faces, kept_faces)
+        projected_shells = projected_shells[keep]
+        shell_faces = np.searchsorted(kept_faces, shell_faces[keep])
+        n_rows = kept_faces.size
+
+    return _build_geodataframe_with_antimeridian(projected_shells, shell_faces, n_rows)
+
+
 # Helpers (NO ANTIMERIDIAN)
 # ----------------------------------------------------------------------------------------------------------------------
 def _build_geodataframe_without_antimeridian(polygon_shells, antimeridian_face_indices):
     """Builds a ``spatialpandas.GeoDataFrame`` excluding any faces that cross
     the antimeridian."""
+    import pyarrow as pa
     from spatialpandas.geometry import PolygonArray
     from spatialpandas import GeoDataFrame
 
     shells_without_antimeridian = np.delete(
         polygon_shells, antimeridian_face_indices, axis=0
     )
-    geometry = PolygonArray.from_exterior_coords(shells_without_antimeridian)
+
+    # each face is a polygon with a single ring
+    coords, ring_offsets = _trim_closed_shells(shells_without_antimeridian)
+    rings = pa.ListArray.from_arrays(pa.array(ring_offsets), pa.array(coords))
+    polygons = pa.ListArray.from_arrays(
+        pa.array(np.arange(ring_offsets.size, dtype=np.int32)), rings
+    )
+
+    geometry = PolygonArray(polygons)
 
     gdf = GeoDataFrame({"geometry": geometry})
 
@@ -134,42 +856,65 @@ def _build_geodataframe_without_antimeridian(polygon_shells, antimeridian_face_i
 
 # Helpers (ANTIMERIDIAN)
 # ----------------------------------------------------------------------------------------------------------------------
-def _build_geodataframe_with_antimeridian(polygon_shells, antimeridian_face_indices):
+def _build_geodataframe_with_antimeridian(
+    corrected_polygon_shells, corrected_to_original_faces, n_face
+):
     """Builds a ``spatialpandas.GeoDataFrame`` including any faces that cross
-    the antimeridian."""
+    the antimeridian, which are split into multiple polygons as returned by
+    ``_build_corrected_polygon_shells``."""
     # import optional dependencies
+    import pyarrow as pa
     from spatialpandas.geometry import MultiPolygonArray
     from spatialpandas import GeoDataFrame
 
-    polygons = _build_corrected_shapely_polygons(
-        polygon_shells, antimeridian_face_indices
+    # each face is a multipolygon made up of its corrected shells, each a polygon with a single ring
+    shell_offsets = np.searchsorted(corrected_to_original_faces, np.arange(n_face + 1))
+    coords, ring_offsets = _trim_closed_shells(corrected_polygon_shells)
+    rings = pa.ListArray.from_arrays(pa.array(ring_offsets), pa.array(coords))
+    polygons = pa.ListArray.from_arrays(
+        pa.array(np.arange(ring_offsets.size, dtype=np.int32)), rings
+    )
+    multipolygons = pa.ListArray.from_arrays(
+        pa.array(shell_offsets.astype(np.int32)), polygons
     )
 
-    geometry = MultiPolygonArray(polygons)
+    geometry = MultiPolygonArray(multipolygons)
 
     gdf = GeoDataFrame({"geometry": geometry})
 
     return gdf
 
 
-def _build_corrected_shapely_polygons(polygon_shells, antimeridian_face_indices):
-    import antimeridian
-    from shapely import polygons as Polygons
+def _trim_closed_shells(shells):
+    """Trims closed shells that are padded with their first vertex to a
+    common number of vertices, keeping the distinct vertices of each shell
+    followed by a single closing vertex.
+
+    Parameters
+    ----------
+    shells : np.ndarray
+        Closed shells, shape ``(n_shell, n_vertices, 2)``
 
-    # list of shapely Polygons representing each face in our grid
-    polygons = Polygons(polygon_shells)
+    Returns
+    -------
+    coords : np.ndarray
+        Interleaved x and y coordinates of the vertices of every trimmed shell
+    ring_offsets : np.ndarray
+        Offset of the coordinates of each shell in ``coords``, shape ``(n_shell + 1, )``
+    """
+    n_shells, n_vertices, _ = shells.shape
 
-    # obtain each antimeridian polygon
-    antimeridian_polygons = polygons[antimeridian_face_indices]
+    # the padding, including the closing vertex, repeats the first vertex at the end of each shell
+    is_first_vertex = (shells == shells[:, :1]).all(axis=2)
+    n_trailing = np.cumprod(is_first_vertex[:, ::-1], axis=1).sum(axis=1)
+    n_shell_vertices = np.minimum(n_vertices - n_trailing + 1, n_vertices)
 
-    # correct each antimeridian polygon
-    corrected_polygons = [antimeridian.fix_polygon(P) for P in antimeridian_polygons]
+    coords = shells[np.arange(n_vertices) < n_shell_vertices[:, None]].ravel()
 
-    # insert correct polygon back into original array
-    for i in reversed(antimeridian_face_indices):
-        polygons[i] = corrected_polygons.pop()
+    ring_offsets = np.zeros(n_shells + 1, dtype=np.int32)
+    np.cumsum(2 * n_shell_vertices, out=ring_offsets[1:])
 
-    return polygons
+    return coords, ring_offsets
 
 
 def _build_antimeridian_face_indices(shells_x):
@@ -192,14 +937,7 @@ def _build_antimeridian_face_indices(shells_x):
 
 def _populate_antimeridian_face_indices(grid):
     """Populates ``Grid.antimeridian_face_indices``"""
-    polygon_shells = _build_polygon_shells(
-        grid.node_lon.values,
-        grid.node_lat.values,
-        grid.face_node_connectivity.values,
-        grid.n_face,
-        grid.n_max_face_nodes,
-        grid.n_nodes_per_face.values,
-    )
+    polygon_shells = _get_polygon_shells(grid)
 
     antimeridian_face_indices = _build_antimeridian_face_indices(
         polygon_shells[:, :, 0]
@@ -208,67 +946,279 @@ def _populate_antimeridian_face_indices(grid):
     return antimeridian_face_indices
 
 
-def _build_corrected_polygon_shells(polygon_shells):
+def _build_corrected_polygon_shells(polygon_shells, antimeridian_face_indices=None):
     """Constructs ``corrected_polygon_shells`` and
-    ``Grid.original_to_corrected), representing the polygon shells, with
+    ``corrected_to_original_faces``, representing the polygon shells, with
     antimeridian polygons split.
 
-     Parameters
+    Only the shells of faces that cross the antimeridian are split, with the split shells placed in the position of
+    their original face.
+
+    Parameters
     ----------
-    grid : uxarray.Grid
-        Grid Object
+    polygon_shells : np.ndarray
+        Closed polygon shells of each face, as returned by ``_build_polygon_shells``
+    antimeridian_face_indices : np.ndarray, optional
+        Index of each face that crosses the antimeridian, computed from the shells if not provided
 
     Returns
     -------
     corrected_polygon_shells : np.ndarray
-        Array containing polygon shells, with antimeridian polygons split
-    _corrected_shells_to_original_faces : np.ndarray
+        Array containing polygon shells, with antimeridian polygons split, each padded with its first vertex
+    corrected_to_original_faces : np.ndarray
         Original indices used to map the corrected polygon shells to their entries in face nodes
     """
+    if antimeridian_face_indices is None:
+        antimeridian_face_indices = _build_antimeridian_face_indices(
+            polygon_shells[:, :, 0]
+        )
+    antimeridian_face_indices = np.asarray(antimeridian_face_indices, dtype=INT_DTYPE)
 
-    # import optional dependencies
-    import antimeridian
-    from shapely import Polygon
+    n_face, n_vertices, _ = polygon_shells.shape
+
+    split_shells, n_split_vertices, n_splits = _split_antimeridian_shells(
+        polygon_shells, antimeridian_face_indices
+    )
 
-    # list of shapely Polygons representing each Face in our grid
-    polygons = [Polygon(shell) for shell in polygon_shells]
+    # each face is represented by one shell, unless it is split across the antimeridian
+    n_shells_per_face = np.ones(n_face, dtype=INT_DTYPE)
+    n_shells_per_face[antimeridian_face_indices] = n_splits
+    corrected_to_original_faces = np.repeat(
+        np.arange(n_face, dtype=INT_DTYPE), n_shells_per_face
+    )
 
-    # List of Polygons (non-split) and MultiPolygons (split across antimeridian)
-    corrected_polygons = [
-        antimeridian.fix_polygon(P, fix_winding=False) for P in polygons
-    ]
+    is_split = np.zeros(n_face, dtype=np.bool_)
+    is_split[antimeridian_face_indices] = True
+    split_mask = is_split[corrected_to_original_faces]
 
-    _corrected_shells_to_original_faces = []
-    corrected_polygon_shells = []
-
-    for i, polygon in enumerate(corrected_polygons):
-        # Convert MultiPolygons into individual Polygon Vertices
-        if polygon.geom_type == "MultiPolygon":
-            for individual_polygon in polygon.geoms:
-                corrected_polygon_shells.append(
-                    np.array(
-                        [
-                            individual_polygon.exterior.coords.xy[0],
-                            individual_polygon.exterior.coords.xy[1],
-                        ]
-                    ).T
-                )
-                _corrected_shells_to_original_faces.append(i)
+    # shells are padded with their first vertex to a common number of vertices
+    n_corrected_vertices = max(
+        n_vertices, n_split_vertices.max() + 1 if n_split_vertices.size else 0
+    )
+    corrected_polygon_shells = np.empty(
+        (corrected_to_original_faces.size, n_corrected_vertices, 2),
+        dtype=polygon_shells.dtype,
+    )
 
-        # Convert Shapely Polygon into Polygon Vertices
-        else:
-            corrected_polygon_shells.append(
-                np.array(
-                    [polygon.exterior.coords.xy[0], polygon.exterior.coords.xy[1]]
-                ).T
+    unsplit_shells = polygon_shells[corrected_to_original_faces[~split_mask]]
+    corrected_polygon_shells[~split_mask, :n_vertices] = unsplit_shells
+    corrected_polygon_shells[~split_mask, n_vertices:] = unsplit_shells[:, :1]
+
+    n_split_shell_vertices = split_shells.shape[1]
+    corrected_polygon_shells[split_mask, :n_split_shell_vertices] = split_shells
+    corrected_polygon_shells[split_mask, n_split_shell_vertices:] = split_shells[:, :1]
+
+    return corrected_polygon_shells, corrected_to_original_faces
+
+
+def _split_antimeridian_shells(polygon_shells, antimeridian_face_indices):
+    """Splits the shells of the faces that cross the antimeridian into shells
+    that lie within [-180, 180] degrees of longitude.
+
+    Parameters
+    ----------
+    polygon_shells : np.ndarray
+        Closed polygon shells of each face, shape ``(n_face, n_vertices, 2)``
+    antimeridian_face_indices : np.ndarray
+        Index of each face that crosses the antimeridian
+
+    Returns
+    -------
+    split_shells : np.ndarray
+        Split shells of each face in ``antimeridian_face_indices``, in order, each closed and padded with its first
+        vertex
+    n_split_vertices : np.ndarray
+        Number of distinct vertices of each split shell
+    n_splits : np.ndarray
+        Number of split shells of each face in ``antimeridian_face_indices``
+    """
+    shells, n_split_vertices, n_splits = _split_antimeridian_shells_numba(
+        polygon_shells.astype(np.float64), antimeridian_face_indices
+    )
+
+    valid = n_split_vertices > 0
+    shells, n_split_vertices = shells[valid], n_split_vertices[valid]
+
+    n_shell_vertices = n_split_vertices.max() + 1 if n_split_vertices.size else 1
+
+    return (
+        shells[:, :n_shell_vertices].astype(polygon_shells.dtype),
+        n_split_vertices,
+        n_splits,
+    )
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _split_antimeridian_shells_numba(polygon_shells, antimeridian_face_indices):
+    """Splits each antimeridian shell by unwrapping its longitudes to be
+    continuous, closing it along the pole if it encircles one, and clipping
+    it against each 360 degree wide strip of longitudes that it overlaps."""
+    n_vertices = polygon_shells.shape[1]
+
+    # upper bound on the number of vertices of a shell after unwrapping and clipping
+    max_vertices = 4 * (2 * n_vertices + 3)
+
+    n_am_faces = antimeridian_face_indices.shape[0]
+    shells = np.zeros((n_am_faces * MAX_ANTIMERIDIAN_SPLITS, max_vertices + 1, 2))
+    n_split_vertices = np.zeros(n_am_faces * MAX_ANTIMERIDIAN_SPLITS, dtype=INT_DTYPE)
+    n_splits = np.zeros(n_am_faces, dtype=INT_DTYPE)
+
+    lon = np.empty(n_vertices)
+    lat = np.empty(n_vertices)
+    ring_x = np.empty(max_vertices)
+    ring_y = np.empty(max_vertices)
+    clip_x = np.empty(max_vertices)
+    clip_y = np.empty(max_vertices)
+    out_x = np.empty(max_vertices)
+    out_y = np.empty(max_vertices)
+
+    for i in range(n_am_faces):
+        shell = polygon_shells[antimeridian_face_indices[i]]
+
+        # distinct consecutive vertices, without the closing vertex and padding
+        n_lonlat = 0
+        for j in range(n_vertices):
+            if n_lonlat > 0 and (
+                shell[j, 0] == lon[n_lonlat - 1] and shell[j, 1] == lat[n_lonlat - 1]
+            ):
+                continue
+            lon[n_lonlat] = shell[j, 0]
+            lat[n_lonlat] = shell[j, 1]
+            n_lonlat += 1
+        while (
+            n_lonlat > 1 and lon[n_lonlat - 1] == lon[0] and lat[n_lonlat - 1] == lat[0]
+        ):
+            n_lonlat -= 1
+
+        # unwrapping starts from a vertex that is not on a pole, where the longitude is undefined
+        start = -1
+        lat_sum = 0.0
+        for j in range(n_lonlat):
+            lat_sum += lat[j]
+            if start < 0 and abs(lat[j]) < 90.0 - ERROR_TOLERANCE:
+                start = j
+        if start < 0 or n_lonlat < 3:
+            continue
+
+        n_ring = 0
+        prev_lon = lon[start]
+        prev_x = lon[start]
+        for j in range(n_lonlat):
+            idx = (start + j) % n_lonlat
+
+            if abs(lat[idx]) >= 90.0 - ERROR_TOLERANCE:
+                # a pole vertex is stretched along the pole, between the longitudes of its neighbors
+                next_idx = (idx + 1) % n_lonlat
+                while abs(lat[next_idx]) >= 90.0 - ERROR_TOLERANCE:
+                    next_idx = (next_idx + 1) % n_lonlat
+                ring_x[n_ring] = prev_x
+                ring_y[n_ring] = lat[idx]
+                ring_x[n_ring + 1] = prev_x + _wrap_longitude(lon[next_idx] - prev_lon)
+                ring_y[n_ring + 1] = lat[idx]
+                n_ring += 2
+                continue
+
+            prev_x += _wrap_longitude(lon[idx] - prev_lon)
+            prev_lon = lon[idx]
+            ring_x[n_ring] = prev_x
+            ring_y[n_ring] = lat[idx]
+            n_ring += 1
+
+        # a shell that winds around a pole is closed along it
+        winding = prev_x + _wrap_longitude(lon[start] - prev_lon) - ring_x[0]
+        if abs(winding) > 180.0:
+            pole_lat = 90.0 if lat_sum > 0 else -90.0
+            ring_x[n_ring] = ring_x[0] + winding
+            ring_y[n_ring] = ring_y[0]
+            ring_x[n_ring + 1] = ring_x[0] + winding
+            ring_y[n_ring + 1] = pole_lat
+            ring_x[n_ring + 2] = ring_x[0]
+            ring_y[n_ring + 2] = pole_lat
+            n_ring += 3
+
+        first_strip = int(np.floor((ring_x[:n_ring].min() + 180.0) / 360.0))
+        last_strip = int(np.floor((ring_x[:n_ring].max() + 180.0) / 360.0))
+
+        for strip in range(first_strip, last_strip + 1):
+            if n_splits[i] == MAX_ANTIMERIDIAN_SPLITS:
+                break
+
+            offset = 360.0 * strip
+            n_clip = _clip_ring(
+                ring_x, ring_y, n_ring, offset - 180.0, True, clip_x, clip_y
             )
-            _corrected_shells_to_original_faces.append(i)
+            n_out = _clip_ring(
+                clip_x, clip_y, n_clip, offset + 180.0, False, out_x, out_y
+            )
+
+            # remove repeated vertices introduced by clipping at a vertex
+            n_distinct = 0
+            for j in range(n_out):
+                if n_distinct > 0 and (
+                    out_x[j] == out_x[n_distinct - 1]
+                    and out_y[j] == out_y[n_distinct - 1]
+                ):
+                    continue
+                out_x[n_distinct] = out_x[j]
+                out_y[n_distinct] = out_y[j]
+                n_distinct += 1
+            while (
+                n_distinct > 1
+                and out_x[n_distinct - 1] == out_x[0]
+                and out_y[n_distinct - 1] == out_y[0]
+            ):
+                n_distinct -= 1
+
+            # discard empty or degenerate pieces, such as a vertex touching the antimeridian
+            if n_distinct < 3:
+                continue
+            area = 0.0
+            for j in range(n_distinct):
+                k = (j + 1) % n_distinct
+                area += out_x[j] * out_y[k] - out_x[k] * out_y[j]
+            if abs(area) <= ERROR_TOLERANCE:
+                continue
+
+            shell_idx = i * MAX_ANTIMERIDIAN_SPLITS + n_splits[i]
+            for j in range(max_vertices + 1):
+                k = j if j < n_distinct else 0
+                shells[shell_idx, j, 0] = out_x[k] - offset
+                shells[shell_idx, j, 1] = out_y[k]
+            n_split_vertices[shell_idx] = n_distinct
+            n_splits[i] += 1
+
+    return shells, n_split_vertices, n_splits
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _wrap_longitude(delta):
+    """Wraps a difference in longitude into [-180, 180) degrees."""
+    return (delta + 180.0) % 360.0 - 180.0
 
-    # original_to_corrected = np.array(
-    #     _corrected_shells_to_original_faces, dtype=INT_DTYPE
-    # )
 
-    return corrected_polygon_shells, _corrected_shells_to_original_faces
+@njit(cache=ENABLE_JIT_CACHE)
+def _clip_ring(x, y, n, bound, keep_greater, out_x, out_y):
+    """Clips a ring against the half plane of longitudes greater (or less)
+    than ``bound`` (Sutherland-Hodgman), returning its number of
+    vertices."""
+    n_out = 0
+    for j in range(n):
+        k = (j + 1) % n
+        inside_j = x[j] >= bound if keep_greater else x[j] <= bound
+        inside_k = x[k] >= bound if keep_greater else x[k] <= bound
+
+        if inside_j:
+            out_x[n_out] = x[j]
+            out_y[n_out] = y[j]
+            n_out += 1
+
+        if inside_j != inside_k:
+            t = (bound - x[j]) / (x[k] - x[j])
+            out_x[n_out] = bound
+            out_y[n_out] = y[j] + t * (y[k] - y[j])
+            n_out += 1
+
+    return n_out
 
 
 def _grid_to_matplotlib_polycollection(grid):
@@ -277,55 +1227,95 @@ def _grid_to_matplotlib_polycollection(grid):
     # import optional dependencies
     from matplotlib.collections import PolyCollection
 
-    polygon_shells = _build_polygon_shells(
-        grid.node_lon.values,
-        grid.node_lat.values,
-        grid.face_node_connectivity.values,
-        grid.n_face,
-        grid.n_max_face_nodes,
-        grid.n_nodes_per_face.values,
+    corrected_polygon_shells, corrected_to_original_faces = (
+        _get_corrected_polygon_shells(grid)
     )
 
-    (
-        corrected_polygon_shells,
-        corrected_to_original_faces,
-    ) = _build_corrected_polygon_shells(polygon_shells)
-
     return PolyCollection(corrected_polygon_shells), corrected_to_original_faces
 
 
 def _grid_to_matplotlib_linecollection(grid):
-    """Constructs and returns a ``matplotlib.collections.LineCollection``"""
+    """Constructs and returns a ``matplotlib.collections.LineCollection``
+    with a single line segment for each edge, split at the antimeridian."""
 
     # import optional dependencies
     from matplotlib.collections import LineCollection
 
-    polygon_shells = _build_polygon_shells(
-        grid.node_lon.values,
-        grid.node_lat.values,
-        grid.face_node_connectivity.values,
-        grid.n_face,
-        grid.n_max_face_nodes,
-        grid.n_nodes_per_face.values,
-    )
+    edge_segments, _ = _get_edge_segments(grid)
 
-    # obtain corrected shapely polygons
-    polygons = _build_corrected_shapely_polygons(
-        polygon_shells, grid.antimeridian_face_indices
+    # need transform? consider adding it later if needed
+    return LineCollection(edge_segments)
+
+
+def _get_edge_segments(grid):
+    """Returns the line segments of the edges of a grid, as returned by
+    ``_build_edge_segments``, which are constructed once and stored in
+    ``Grid._geometry_cache``."""
+    if "edge_segments" not in grid._geometry_cache:
+        (
+            grid._geometry_cache["edge_segments"],
+            grid._geometry_cache["antimeridian_edge_indices"],
+        ) = _build_edge_segments(
+            grid.node_lon.values,
+            grid.node_lat.values,
+            grid.edge_node_connectivity.values,
+        )
+    return (
+        grid._geometry_cache["edge_segments"],
+        grid._geometry_cache["antimeridian_edge_indices"],
     )
 
-    # Convert polygons into lines
-    lines = []
-    for pol in polygons:
-        boundary = pol.boundary
-        if boundary.geom_type == "MultiLineString":
-            for line in list(boundary.geoms):
-                lines.append(np.array(line.coords))
-        else:
-            lines.append(np.array(boundary.coords))
 
-    # need transform? consider adding it later if needed
-    return LineCollection(lines)
+def _build_edge_segments(node_lon, node_lat, edge_node_connectivity):
+    """Constructs a line segment for each edge directly from the edge node
+    connectivity, so that each edge is drawn once, splitting the edges that
+    cross the antimeridian into two segments that end on it.
+
+    Parameters
+    ----------
+    node_lon, node_lat : np.ndarray
+        Longitude and latitude of each node in degrees
+    edge_node_connectivity : np.ndarray
+        Indices of the two nodes of each edge, shape ``(n_edge, 2)``
+
+    Returns
+    -------
+    edge_segments : np.ndarray
+        Line segments in degrees, shape ``(n_edge + n_antimeridian_edge, 2, 2)``, where the segment ``i`` of the first
+        ``n_edge`` segments is the edge ``i``, or its part on the side of its first node if it crosses the
+        antimeridian, followed by the part on the side of the second node of each antimeridian edge
+    antimeridian_edge_indices : np.ndarray
+        Index of each edge that crosses the antimeridian
+    """
+    lon = node_lon[edge_node_connectivity].astype(np.float64)
+    lat = node_lat[edge_node_connectivity].astype(np.float64)
+
+    # the longitude of a pole node is undefined, so an edge to a pole lies along the meridian of its other node
+    on_pole = np.abs(lat) >= 90.0 - ERROR_TOLERANCE
+    lon = np.where(on_pole, lon[:, ::-1], lon)
+
+    delta = lon[:, 1] - lon[:, 0]
+    antimeridian_edge_indices = np.flatnonzero(np.abs(delta) > 180.0).astype(INT_DTYPE)
+
+    edge_segments = np.empty((lon.shape[0] + antimeridian_edge_indices.size, 2, 2))
+    edge_segments[: lon.shape[0], :, 0] = lon
+    edge_segments[: lon.shape[0], :, 1] = lat
+
+    # intersect the antimeridian edges with the antimeridian after unwrapping their second node
+    am_lon, am_lat = lon[antimeridian_edge_indices], lat[antimeridian_edge_indices]
+    direction = np.sign(delta[antimeridian_edge_indices])
+    boundary = -180.0 * direction
+    t = (boundary - am_lon[:, 0]) / (am_lon[:, 1] - 360.0 * direction - am_lon[:, 0])
+    boundary_lat = am_lat[:, 0] + t * (am_lat[:, 1] - am_lat[:, 0])
+
+    edge_segments[antimeridian_edge_indices, 1, 0] = boundary
+    edge_segments[antimeridian_edge_indices, 1, 1] = boundary_lat
+    edge_segments[lon.shape[0] :, 0, 0] = -boundary
+    edge_segments[lon.shape[0] :, 0, 1] = boundary_lat
+    edge_segments[lon.shape[0] :, 1, 0] = am_lon[:, 1]
+    edge_segments[lon.shape[0] :, 1, 1] = am_lat[:, 1]
+
+    return edge_segments, antimeridian_edge_indices
 
 
 def _pole_point_inside_polygon(pole, face_edge_cart):
@@ -601,11 +1591,37 @@ def _insert_pt_in_latlonbox(old_box, new_pt, is_lon_periodic=True):
     return latlon_box
 
 
+def _populate_edge_latitude_extremes(grid):
+    """Populates the minimum and maximum latitude along each edge of a grid
+    (``edge_latitude_extremes``), computed for all edges in a single compiled
+    call."""
+    from uxarray.conventions.descriptors import (
+        EDGE_LATITUDE_EXTREMES_DIMS,
+        EDGE_LATITUDE_EXTREMES_ATTRS,
+    )
+
+    edge_nodes = grid.edge_node_connectivity.values
+    node_xyz = np.stack(
+        [grid.node_x.values, grid.node_y.values, grid.node_z.values], axis=-1
+    )
+
+    edge_latitude_extremes = _extreme_gca_latitudes(
+        np.ascontiguousarray(node_xyz[edge_nodes], dtype=np.float64)
+    )
+
+    grid._ds["edge_latitude_extremes"] = xr.DataArray(
+        data=edge_latitude_extremes,
+        dims=EDGE_LATITUDE_EXTREMES_DIMS,
+        attrs=EDGE_LATITUDE_EXTREMES_ATTRS,
+    )
+
+
 def _populate_face_latlon_bound(
     face_edges_cartesian,
     face_edges_lonlat_rad,
     is_latlonface: bool = False,
     is_GCA_list=None,
+    face_edges_lat_extremes=None,
 ):
     """Populates the bounding box for each face in the grid by evaluating the
     geographical bounds based on the Cartesian and latitudinal/longitudinal
@@ -636,6 +1652,10 @@ def _populate_face_latlon_bound(
         edge is a GCA or a constant latitudinal/longitudinal line is based on `is_latlonface`.
         Default is `None`.
 
+    face_edges_lat_extremes : np.ndarray, shape (n_edges, 2), optional
+        The minimum and maximum latitude in radians of each edge of the face when treated as a GCA
+        (i.e. ``Grid.edge_latitude_extremes``). Computed from `face_edges_cartesian` if `None`.
+
     Returns
     -------
     face_latlon_array : np.ndarray, shape (2, 2)
@@ -668,6 +1688,11 @@ def _populate_face_latlon_bound(
                                                         is_latlonface=True)
     """
 
+    if face_edges_lat_extremes is None:
+        face_edges_lat_extremes = _extreme_gca_latitudes(
+            np.ascontiguousarray(face_edges_cartesian, dtype=np.float64)
+        )
+
     # Check if face_edges contains pole points
     has_north_pole = _pole_point_inside_polygon("North", face_edges_cartesian)
     has_south_pole = _pole_point_inside_polygon("South", face_edges_cartesian)
@@ -728,10 +1753,7 @@ def _populate_face_latlon_bound(
 
             # Determine extreme latitudes for GCA edges
             lat_max, lat_min = (
-                (
-                    extreme_gca_latitude(np.array([n1_cart, n2_cart]), "max"),
-                    extreme_gca_latitude(np.array([n1_cart, n2_cart]), "min"),
-                )
+                (face_edges_lat_extremes[i][1], face_edges_lat_extremes[i][0])
                 if is_GCA
                 else (node1_lat_rad, node1_lat_rad)
             )
@@ -783,10 +1805,7 @@ def _populate_face_latlon_bound(
             )
 
             lat_max, lat_min = (
-                (
-                    extreme_gca_latitude(np.array([n1_cart, n2_cart]), "max"),
-                    extreme_gca_latitude(np.array([n1_cart, n2_cart]), "min"),
-                )
+                (face_edges_lat_extremes[i][1], face_edges_lat_extremes[i][0])
                 if is_GCA
                 else (node1_lat_rad, node1_lat_rad)
             )
@@ -815,6 +1834,57 @@ def _populate_face_latlon_bound(
     return face_latlon_array
 
 
+def _face_edges_follow_nodes(
+    face_node_connectivity, face_edge_connectivity, edge_node_connectivity
+):
+    """Identifies the faces whose edges each connect a node of the face and
+    the node that follows it, in the order of its nodes.
+
+    Parameters
+    ----------
+    face_node_connectivity : np.ndarray
+        Nodes of each face, shape ``(n_face, n_max_face_nodes)``
+    face_edge_connectivity : np.ndarray
+        Edges of each face, shape ``(n_face, n_max_face_edges)``
+    edge_node_connectivity : np.ndarray
+        Nodes of each edge, shape ``(n_edge, 2)``
+
+    Returns
+    -------
+    edges_follow_nodes : np.ndarray
+        Boolean mask of the faces whose edges follow their nodes, shape ``(n_face, )``
+    """
+    n_face = face_node_connectivity.shape[0]
+    if face_edge_connectivity.shape != face_node_connectivity.shape:
+        return np.zeros(n_face, dtype=np.bool_)
+
+    valid_nodes = face_node_connectivity != INT_FILL_VALUE
+    valid_edges = face_edge_connectivity != INT_FILL_VALUE
+    n_nodes_per_face = valid_nodes.sum(axis=1)
+
+    # the node following each node, closing each face
+    next_index = (
+        np.arange(1, face_node_connectivity.shape[1] + 1)[None, :]
+        % np.maximum(n_nodes_per_face, 1)[:, None]
+    )
+    next_nodes = np.take_along_axis(face_node_connectivity, next_index, axis=1)
+
+    edge_nodes = edge_node_connectivity[
+        np.where(valid_edges, face_edge_connectivity, 0)
+    ]
+    connects_nodes = (
+        (edge_nodes[..., 0] == face_node_connectivity)
+        & (edge_nodes[..., 1] == next_nodes)
+    ) | (
+        (edge_nodes[..., 1] == face_node_connectivity)
+        & (edge_nodes[..., 0] == next_nodes)
+    )
+
+    return np.all(
+        np.where(valid_nodes, valid_edges & connects_nodes, ~valid_edges), axis=1
+    )
+
+
 def _populate_bounds(
     grid, is_latlonface: bool = False, is_face_GCA_list=None, return_array=False
 ):
@@ -881,22 +1951,47 @@ def _populate_bounds(
     intervals_tuple_list = []
     intervals_name_list = []
 
-    for face_idx, face_nodes in enumerate(grid.face_node_connectivity):
+    face_node_connectivity = grid.face_node_connectivity.values
+    face_edge_connectivity = grid.face_edge_connectivity.values
+    edge_node_connectivity = grid.edge_node_connectivity.values
+    edge_latitude_extremes = grid.edge_latitude_extremes.values
+    node_x = grid.node_x.values
+    node_y = grid.node_y.values
+    node_z = grid.node_z.values
+    node_lon = grid.node_lon.values
+    node_lat = grid.node_lat.values
+
+    # the cached extremes are only used for faces whose edges connect their consecutive nodes in order, since the
+    # edges of a face may be stored in a different order in connectivity read from a source file
+    edges_follow_nodes = _face_edges_follow_nodes(
+        face_node_connectivity, face_edge_connectivity, edge_node_connectivity
+    )
+
+    for face_idx in range(grid.n_face):
+        face_edges = face_edge_connectivity[face_idx]
+
+        if edges_follow_nodes[face_idx]:
+            face_edges_lat_extremes = edge_latitude_extremes[
+                face_edges[face_edges != INT_FILL_VALUE]
+            ]
+        else:
+            face_edges_lat_extremes = None
+
         face_edges_cartesian = _get_cartesian_face_edge_nodes(
-            grid.face_node_connectivity.values[face_idx],
-            grid.face_edge_connectivity.values[face_idx],
-            grid.edge_node_connectivity.values,
-            grid.node_x.values,
-            grid.node_y.values,
-            grid.node_z.values,
+            face_node_connectivity[face_idx],
+            face_edges,
+            edge_node_connectivity,
+            node_x,
+            node_y,
+            node_z,
         )
 
         face_edges_lonlat_rad = _get_lonlat_rad_face_edge_nodes(
-            grid.face_node_connectivity.values[face_idx],
-            grid.face_edge_connectivity.values[face_idx],
-            grid.edge_node_connectivity.values,
-            grid.node_lon.values,
-            grid.node_lat.values,
+            face_node_connectivity[face_idx],
+            face_edges,
+            edge_node_connectivity,
+            node_lon,
+            node_lat,
         )
 
         is_GCA_list = (
@@ -908,6 +2003,7 @@ def _populate_bounds(
             face_edges_lonlat_rad,
             is_latlonface=is_latlonface,
             is_GCA_list=is_GCA_list,
+            face_edges_lat_extremes=face_edges_lat_extremes,
         )
 
         assert temp_latlon_array[face_idx][0][0] != temp_latlon_array[face_idx][0][1]
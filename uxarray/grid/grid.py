@@ -11,7 +11,7 @@ from typing import (
 
 # reader and writer imports
 from uxarray.io._exodus import _read_exodus, _encode_exodus
-from uxarray.io._mpas import _read_mpas
+from uxarray.io._mpas import _read_mpas, _deferred_parsers
 from uxarray.io._ugrid import (
     _read_ugrid,
     _encode_ugrid,
@@ -21,9 +21,11 @@ from uxarray.io._scrip import _read_scrip, _encode_scrip
 from uxarray.io._esmf import _read_esmf
 from uxarray.io._vertices import _read_face_vertices
 from uxarray.io._topology import _read_topology
+from uxarray.io._zarr import _encode_zarr
 
 from uxarray.io.utils import _parse_grid_type
 from uxarray.grid.area import get_all_face_area_from_coords
+from uxarray.grid.integrate import _get_zonal_weights
 from uxarray.grid.coordinates import (
     _populate_face_centroids,
     _populate_edge_centroids,
@@ -44,7 +46,12 @@ from uxarray.grid.geometry import (
     _grid_to_polygon_geodataframe,
     _grid_to_matplotlib_polycollection,
     _grid_to_matplotlib_linecollection,
+    _grid_to_dask_geodataframe,
+    _get_corrected_polygon_shells,
+    _get_raster_lookup,
+    _geometry_cache_nbytes,
     _populate_bounds,
+    _populate_edge_latitude_extremes,
 )
 
 from uxarray.grid.neighbors import (
@@ -58,11 +65,8 @@ from uxarray.plot.accessor import GridPlotAccessor
 
 from uxarray.subset import GridSubsetAccessor
 
-from uxarray.grid.validation import (
-    _check_connectivity,
-    _check_duplicate_nodes,
-    _check_area,
-)
+from uxarray.grid.validation import _validation_report
+from uxarray.grid.utils import _grid_fingerprint
 
 
 from xarray.core.utils import UncachedAccessor
@@ -146,17 +150,26 @@ class Grid:
         # initialize attributes
         self._antimeridian_face_indices = None
 
-        # initialize cached data structures (visualization)
-        self._gdf = None
-        self._gdf_exclude_am = None
-        self._poly_collection = None
-        self._line_collection = None
+        # initialize cached data structures (visualization), with the polygon shells of each face and their split
+        # geometry shared by every geometry export (GeoDataFrame, PolyCollection, LineCollection)
+        self._geometry_cache = {}
         self._raster_data_id = None
 
         # initialize cached data structures (nearest neighbor operations)
         self._ball_tree = None
         self._kd_tree = None
 
+        # initialize cached data structures (zonal averages), keyed by latitudes
+        self._zonal_weights = {}
+
+        # parsers for source grid variables that are converted on first access
+        self._deferred_parsers = {}
+
+        # content hash of the grid, computed on first access from the variables of the source grid, excluding any
+        # variable that is constructed from them later
+        self._fingerprint = None
+        self._source_var_names = set(self._ds.variables)
+
         # set desired longitude range to [-180, 180]
         _set_desired_longitude_range(self._ds)
 
@@ -168,7 +181,12 @@ class Grid:
 
     @classmethod
     def from_dataset(
-        cls, dataset: xr.Dataset, use_dual: Optional[bool] = False, **kwargs
+        cls,
+        dataset: xr.Dataset,
+        use_dual: Optional[bool] = False,
+        lazy: Optional[bool] = False,
+        node_tolerance: Optional[float] = None,
+        **kwargs,
     ):
         """Constructs a ``Grid`` object from an ``xarray.Dataset``.
 
@@ -178,10 +196,19 @@ class Grid:
             ``xarray.Dataset`` containing unstructured grid coordinates and connectivity variables
         use_dual : bool, default=False
             When reading in MPAS formatted datasets, indicates whether to use the Dual Mesh
+        lazy : bool, default=False
+            When reading in MPAS formatted datasets, indicates whether to defer the conversion of connectivity and
+            descriptor variables (other than ``face_node_connectivity``) until they are first accessed
+        node_tolerance : float, optional
+            When reading in SCRIP formatted datasets, the maximum difference in degrees between the longitude and
+            latitude of two corners for them to be merged into a single node. Only exactly matching corners are merged
+            if not provided
         """
         if not isinstance(dataset, xr.Dataset):
             raise ValueError("Input must be an xarray.Dataset")
 
+        deferred_parsers = {}
+
         # determine grid/mesh specification
 
         if "source_grid_spec" not in kwargs:
@@ -191,11 +218,17 @@ class Grid:
             if source_grid_spec == "Exodus":
                 grid_ds, source_dims_dict = _read_exodus(dataset)
             elif source_grid_spec == "Scrip":
-                grid_ds, source_dims_dict = _read_scrip(dataset)
+                grid_ds, source_dims_dict = _read_scrip(
+                    dataset, tolerance=node_tolerance
+                )
             elif source_grid_spec == "UGRID":
                 grid_ds, source_dims_dict = _read_ugrid(dataset)
             elif source_grid_spec == "MPAS":
-                grid_ds, source_dims_dict = _read_mpas(dataset, use_dual=use_dual)
+                grid_ds, source_dims_dict = _read_mpas(
+                    dataset, use_dual=use_dual, lazy=lazy
+                )
+                if lazy:
+                    deferred_parsers = _deferred_parsers(dataset, use_dual=use_dual)
             elif source_grid_spec == "ESMF":
                 grid_ds, source_dims_dict = _read_esmf(dataset)
             elif source_grid_spec == "Shapefile":
@@ -208,7 +241,11 @@ class Grid:
             grid_ds = dataset
             source_dims_dict = {}
 
-        return cls(grid_ds, source_grid_spec, source_dims_dict)
+        grid = cls(grid_ds, source_grid_spec, source_dims_dict)
+        grid._deferred_parsers = deferred_parsers
+        grid._source_var_names.update(deferred_parsers)
+
+        return grid
 
     @classmethod
     def from_topology(
@@ -270,6 +307,7 @@ class Grid:
         cls,
         face_vertices: Union[list, tuple, np.ndarray],
         latlon: Optional[bool] = True,
+        node_tolerance: Optional[float] = None,
     ):
         """Constructs a ``Grid`` object from user-defined face vertices.
 
@@ -279,6 +317,9 @@ class Grid:
             array-like input containing the face vertices to construct the grid from
         latlon : bool, default=True
             Indicates whether the inputted vertices are in lat/lon, with units in degrees
+        node_tolerance : float, optional
+            Maximum difference in each coordinate for two vertices to be merged into a single node. Only exactly
+            matching vertices are merged if not provided
         """
         if not isinstance(face_vertices, (list, tuple, np.ndarray)):
             raise ValueError("Input must be either a list, tuple, or np.ndarray")
@@ -286,10 +327,12 @@ class Grid:
         face_vertices = np.asarray(face_vertices)
 
         if face_vertices.ndim == 3:
-            grid_ds = _read_face_vertices(face_vertices, latlon)
+            grid_ds = _read_face_vertices(face_vertices, latlon, node_tolerance)
 
         elif face_vertices.ndim == 2:
-            grid_ds = _read_face_vertices(np.array([face_vertices]), latlon)
+            grid_ds = _read_face_vertices(
+                np.array([face_vertices]), latlon, node_tolerance
+            )
 
         else:
             raise RuntimeError(
@@ -300,31 +343,45 @@ class Grid:
 
         return cls(grid_ds, source_grid_spec="Face Vertices")
 
-    def validate(self):
+    def validate(self, report: Optional[bool] = False):
         """Validate a grid object check for common errors, such as:
 
             - Duplicate nodes
-            - Connectivity
+            - Connectivity (dangling nodes, edges shared by more than two faces and inconsistently oriented faces)
             - Face areas (non zero)
+
+        Parameters
+        ----------
+        report : bool, default=False
+            If true, returns a dictionary with the elements that failed each check instead of raising an error,
+            see ``uxarray.grid.validation._validation_report``
+
+        Returns
+        -------
+        bool or dict
+            True if the grid is valid, or the validation report if ``report`` is true
+
         Raises
         ------
         RuntimeError
-            If unsupported grid type provided
+            If the validation of the grid fails and ``report`` is false
         """
-        # If the mesh file is loaded correctly, we have the underlying file format as UGRID
-        # Test if the file is a valid ugrid file format or not
-        print("Validating the mesh...")
+        validation_report = _validation_report(self)
 
-        # call the check_connectivity and check_duplicate_nodes functions from validation.py
-        checkDN = _check_duplicate_nodes(self)
-        check_C = _check_connectivity(self)
-        check_A = _check_area(self)
+        if report:
+            return validation_report
 
-        if checkDN and check_C and check_A:
-            print("Mesh validation successful.")
+        if validation_report["valid"]:
             return True
-        else:
-            raise RuntimeError("Mesh validation failed.")
+
+        failed_checks = [
+            f"{name} ({validation_report[name].shape[0]})"
+            for name in validation_report
+            if name != "valid" and validation_report[name].shape[0] > 0
+        ]
+        raise RuntimeError(
+            f"Mesh validation failed. Failed checks: {', '.join(failed_checks)}"
+        )
 
     def __repr__(self):
         """Constructs a string representation of the contents of a ``Grid``."""
@@ -398,6 +455,8 @@ class Grid:
         """Two grids are equal if they have matching grid topology variables,
         coordinates, and dims all of which are equal.
 
+        Grids are compared using their ``fingerprint``, which is computed once per grid.
+
         Parameters
         ----------
         other : uxarray.Grid
@@ -411,18 +470,10 @@ class Grid:
         if not isinstance(other, Grid):
             return False
 
-        if self.source_grid_spec != other.source_grid_spec:
-            return False
-
-        if not (
-            self.node_lon.equals(other.node_lon) or self.node_lat.equals(other.node_lat)
-        ):
-            return False
-
-        if not self.face_node_connectivity.equals(other.face_node_connectivity):
-            return False
+        if self is other:
+            return True
 
-        return True
+        return self.fingerprint == other.fingerprint
 
     def __ne__(self, other) -> bool:
         """Two grids are not equal if they have differing grid topology
@@ -439,6 +490,22 @@ class Grid:
         """
         return not self.__eq__(other)
 
+    def _parse_deferred(self, *names):
+        """Parses any of the given variables whose conversion from the source
+        grid was deferred (i.e. ``ux.open_grid(..., lazy=True)``), storing
+        them in the internal (``Grid._ds``). Parses all deferred variables if
+        no names are given."""
+        if not self._deferred_parsers:
+            return
+
+        if not names:
+            names = list(self._deferred_parsers)
+
+        for name in names:
+            parser = self._deferred_parsers.pop(name, None)
+            if parser is not None:
+                parser(self._ds)
+
     @property
     def dims(self) -> set:
         """Names of all unstructured grid dimensions."""
@@ -484,6 +551,24 @@ class Grid:
         """Dictionary of parsed attributes from the source grid."""
         return self._ds.attrs
 
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the source grid specification and of every
+        connectivity and coordinate variable of the grid, along with their
+        dimensions, which is computed on first access.
+
+        Only the variables read from the source grid are hashed, so constructing other variables from them (i.e.
+        ``edge_node_connectivity``) does not change the fingerprint, and any deferred variable is parsed first. Two
+        grids with the same fingerprint are equal, which is used to share a single ``Grid`` instance (and its cached
+        data structures) across datasets opened with ``share_grid=True``.
+        """
+        if self._fingerprint is None:
+            self._parse_deferred()
+            self._fingerprint = _grid_fingerprint(
+                self._ds, self.source_grid_spec, var_names=self._source_var_names
+            )
+        return self._fingerprint
+
     @property
     def n_node(self) -> int:
         """Total number of nodes."""
@@ -492,6 +577,7 @@ class Grid:
     @property
     def n_edge(self) -> int:
         """Total number of edges."""
+        self._parse_deferred("edge_node_connectivity")
         if "edge_node_connectivity" not in self._ds:
             _populate_edge_node_connectivity(self)
 
@@ -737,6 +823,7 @@ class Grid:
 
         Nodes are in arbitrary order.
         """
+        self._parse_deferred("edge_node_connectivity")
         if "edge_node_connectivity" not in self._ds:
             _populate_edge_node_connectivity(self)
 
@@ -757,6 +844,7 @@ class Grid:
 
         Dimensions: ``(n_face, n_max_face_edges)``
         """
+        self._parse_deferred("face_edge_connectivity")
         if "face_edge_connectivity" not in self._ds:
             _populate_face_edge_connectivity(self)
 
@@ -804,6 +892,7 @@ class Grid:
 
         Dimensions ``(n_edge, two)``
         """
+        self._parse_deferred("edge_face_connectivity")
         if "edge_face_connectivity" not in self._ds:
             _populate_edge_face_connectivity(self)
 
@@ -815,6 +904,7 @@ class Grid:
 
         Dimensions ``(n_node, n_max_node_faces)``
         """
+        self._parse_deferred("node_face_connectivity")
         if "node_face_connectivity" not in self._ds:
             _populate_node_face_connectivity(self)
 
@@ -826,6 +916,7 @@ class Grid:
 
         Dimensions ``(n_edge, )``
         """
+        self._parse_deferred("edge_node_distances")
         if "edge_node_distances" not in self._ds:
             _populate_edge_node_distances(self)
         return self._ds["edge_node_distances"]
@@ -836,10 +927,22 @@ class Grid:
 
         Dimensions ``(n_edge, )``
         """
+        self._parse_deferred("edge_face_distances")
         if "edge_face_distances" not in self._ds:
             _populate_edge_face_distances(self)
         return self._ds["edge_face_distances"]
 
+    @property
+    def edge_latitude_extremes(self) -> xr.DataArray:
+        """Minimum and maximum latitude in radians along each edge, treated as
+        a great circle arc.
+
+        Dimensions ``(n_edge, two)``
+        """
+        if "edge_latitude_extremes" not in self._ds:
+            _populate_edge_latitude_extremes(self)
+        return self._ds["edge_latitude_extremes"]
+
     @property
     def antimeridian_face_indices(self) -> np.ndarray:
         """Index of each face that crosses the antimeridian."""
@@ -977,11 +1080,16 @@ class Grid:
     def copy(self):
         """Returns a deep copy of this grid."""
 
-        return Grid(
+        grid = Grid(
             self._ds,
             source_grid_spec=self.source_grid_spec,
             source_dims_dict=self._source_dims_dict,
         )
+        grid._deferred_parsers = self._deferred_parsers.copy()
+        grid._fingerprint = self._fingerprint
+        grid._source_var_names = self._source_var_names.copy()
+
+        return grid
 
     def encode_as(self, grid_type: str) -> xr.Dataset:
         """Encodes the grid as a new `xarray.Dataset` per grid format supplied
@@ -1009,6 +1117,7 @@ class Grid:
         )
 
         if grid_type == "UGRID":
+            self._parse_deferred()
             out_ds = _encode_ugrid(self._ds)
 
         elif grid_type == "Exodus":
@@ -1049,6 +1158,37 @@ class Grid:
 
         return np.sum(face_areas)
 
+    def compute_face_centroids(self, method: Optional[str] = "cartesian average"):
+        """Computes the centroid of each face and stores it as the face
+        coordinates (``face_x``, ``face_y``, ``face_z``, ``face_lon`` and
+        ``face_lat``), replacing any existing ones.
+
+        Parameters
+        ----------
+        method : str, default="cartesian average"
+            Method used to compute the centroids, either "cartesian average", the normalized average of the
+            Cartesian coordinates of the nodes of each face, or "spherical", the area-weighted centroid of each face
+            on the sphere with its edges as great circle arcs
+
+        Examples
+        --------
+        Open a Uxarray grid file
+
+        >>> grid = ux.open_grid("/home/jain/uxarray/test/meshfiles/ugrid/outCSne30/outCSne30.ug")
+
+        >>> grid.compute_face_centroids(method="spherical")
+
+        Notes
+        -----
+        The centroids are updated in place, so they are visible to every dataset that shares this grid (see the
+        ``share_grid`` argument of ``uxarray.open_dataset``).
+        """
+        _populate_face_centroids(self, repopulate=True, method=method)
+        _set_desired_longitude_range(self._ds)
+
+        # the face coordinates are part of the fingerprint
+        self._fingerprint = None
+
     def compute_face_areas(
         self,
         quadrature_rule: Optional[str] = "triangular",
@@ -1133,6 +1273,29 @@ class Grid:
 
         return self._face_areas, self._face_jacobian
 
+    def _get_zonal_weights(self, latitudes):
+        """Returns the sparse matrix of zonal weights (``n_lat``, ``n_face``)
+        of the grid at a set of latitudes in degrees, which is only computed
+        once for each set of latitudes.
+
+        Parameters
+        ----------
+        latitudes : np.ndarray
+            Latitudes in degrees. Shape: (n_lat,)
+
+        Returns
+        -------
+        weights : scipy.sparse.csr_matrix
+            Weight of each face at each latitude
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        key = latitudes.tobytes()
+
+        if key not in self._zonal_weights:
+            self._zonal_weights[key] = _get_zonal_weights(self, latitudes)
+
+        return self._zonal_weights[key]
+
     def to_xarray(self, grid_format: Optional[str] = "ugrid"):
         """Returns a xarray Dataset representation in a specific grid format
         from the Grid object.
@@ -1150,6 +1313,7 @@ class Grid:
         """
 
         if grid_format == "ugrid":
+            self._parse_deferred()
             out_ds = _encode_ugrid(self._ds)
 
         elif grid_format == "exodus":
@@ -1170,11 +1334,63 @@ class Grid:
 
         return out_ds
 
+    def to_zarr(
+        self,
+        store,
+        mode: Optional[str] = "w-",
+        chunks: Optional[dict] = None,
+        populate: Optional[bool] = False,
+        **kwargs,
+    ):
+        """Writes the grid to a Zarr store in the UGRID conventions, including
+        any connectivity, coordinate and descriptor variables (i.e.
+        ``face_areas``) that have been constructed.
+
+        Each variable is chunked along the grid dimensions (``n_node``,
+        ``n_edge``, ``n_face``) and compressed using the default compressor of
+        Zarr, allowing the grid to be opened lazily with ``ux.open_grid`` and
+        partially read by multiple workers.
+
+        Parameters
+        ----------
+        store : str, os.PathLike or MutableMapping
+            Path to or mapping of the Zarr store to write to
+        mode : str, default="w-"
+            Persistence mode passed on to ``xarray.Dataset.to_zarr``, with "w-" failing if the store exists
+        chunks : dict, optional
+            Mapping of dimension names to chunk sizes, defaults to chunks of ``2**18`` elements along each grid
+            dimension
+        populate : bool, default=False
+            Flag to construct the edge and face connectivity, face centers and face areas before writing
+        **kwargs :
+            Additional arguments passed on to ``xarray.Dataset.to_zarr``
+
+        Usage
+        -----
+        >>> uxgrid.to_zarr("grid.zarr", populate=True)
+        >>> uxgrid = ux.open_grid("grid.zarr")
+        """
+        self._parse_deferred()
+
+        if populate:
+            _ = self.edge_node_connectivity
+            _ = self.face_edge_connectivity
+            _ = self.edge_face_connectivity
+            _ = self.node_face_connectivity
+            _ = self.face_lon
+            _ = self.face_areas
+
+        out_ds, encoding = _encode_zarr(self._ds, chunks)
+
+        return out_ds.to_zarr(store, mode=mode, encoding=encoding, **kwargs)
+
     def to_geodataframe(
         self,
         override: Optional[bool] = False,
         cache: Optional[bool] = True,
         exclude_antimeridian: Optional[bool] = False,
+        projection=None,
+        npartitions: Optional[int] = None,
     ):
         """Constructs a ``spatialpandas.GeoDataFrame`` with a "geometry"
         column, containing a collection of Shapely Polygons or MultiPolygons
@@ -1189,6 +1405,15 @@ class Grid:
             Flag to indicate if the computed ``GeoDataFrame`` should be cached
         exclude_antimeridian: bool
             Selects whether to exclude any face that contains an edge that crosses the antimeridian
+        projection: cartopy.crs.Projection, optional
+            Projection to transform the polygons to, with the transformed polygons cached separately for each
+            projection. Polygons are split, and excluded with ``exclude_antimeridian``, at the seam of the projection
+            opposite its central longitude, and polygons with a vertex outside the projection domain are left empty.
+        npartitions: int, optional
+            If provided, the ``GeoDataFrame`` is constructed lazily as a ``dask.dataframe.DataFrame`` with this many
+            partitions of contiguous faces, indexed by face, which are each built independently when computed to bound
+            the peak memory of large grids, capped at one partition for each face. Partitioned ``GeoDataFrame``
+            objects are not cached.
 
         Returns
         -------
@@ -1196,25 +1421,34 @@ class Grid:
             The output `GeoDataFrame` with a filled out "geometry" collumn
         """
 
-        if self._gdf is not None:
-            # determine if we need to recompute a cached GeoDataFrame based on antimeridian
-            if self._gdf_exclude_am != exclude_antimeridian:
-                # cached gdf should match the exclude_antimeridian_flag
-                override = True
+        if npartitions is not None:
+            return _grid_to_dask_geodataframe(
+                self,
+                exclude_antimeridian=exclude_antimeridian,
+                npartitions=npartitions,
+                projection=projection,
+            )
+
+        if exclude_antimeridian:
+            cache_key = "geodataframe_exclude_antimeridian"
+        else:
+            cache_key = "geodataframe"
+
+        if projection is not None:
+            cache_key = (cache_key, projection.proj4_init)
 
         # use cached geodataframe
-        if self._gdf is not None and not override:
-            return self._gdf
+        if cache_key in self._geometry_cache and not override:
+            return self._geometry_cache[cache_key]
 
         # construct a geodataframe with the faces stored as polygons as the geometry
         gdf = _grid_to_polygon_geodataframe(
-            self, exclude_antimeridian=exclude_antimeridian
+            self, exclude_antimeridian=exclude_antimeridian, projection=projection
         )
 
         # cache computed geodataframe
         if cache:
-            self._gdf = gdf
-            self._gdf_exclude_am = exclude_antimeridian
+            self._geometry_cache[cache_key] = gdf
 
         return gdf
 
@@ -1239,13 +1473,15 @@ class Grid:
         -------
         polycollection : matplotlib.collections.PolyCollection
             The output `PolyCollection` containing faces represented as polygons
-        corrected_to_original_faces: list
+        corrected_to_original_faces: np.ndarray
             Original indices used to map the corrected polygon shells to their entries in face nodes
         """
 
         # use cached polycollection
-        if self._poly_collection is not None and not override:
-            return self._poly_collection
+        if "poly_collection" in self._geometry_cache and not override:
+            poly_collection = self._geometry_cache["poly_collection"]
+            _, corrected_to_original_faces = _get_corrected_polygon_shells(self)
+            return poly_collection, corrected_to_original_faces
 
         (
             poly_collection,
@@ -1254,7 +1490,7 @@ class Grid:
 
         # cache computed polycollection
         if cache:
-            self._poly_collection = poly_collection
+            self._geometry_cache["poly_collection"] = poly_collection
 
         return poly_collection, corrected_to_original_faces
 
@@ -1262,8 +1498,8 @@ class Grid:
         self, override: Optional[bool] = False, cache: Optional[bool] = True
     ):
         """Constructs a ``matplotlib.collections.LineCollection`` object with
-        line segments representing the geometry of the unstructured grid,
-        corrected near the antimeridian.
+        a line segment for each edge of the unstructured grid, split at the
+        antimeridian.
 
         Parameters
         ----------
@@ -1275,21 +1511,157 @@ class Grid:
         Returns
         -------
         line_collection : matplotlib.collections.LineCollection
-            The output `LineCollection` containing faces represented as polygons
+            The output `LineCollection` containing each edge represented as a line segment
         """
 
         # use cached line collection
-        if self._line_collection is not None and not override:
-            return self._line_collection
+        if "line_collection" in self._geometry_cache and not override:
+            return self._geometry_cache["line_collection"]
 
         line_collection = _grid_to_matplotlib_linecollection(self)
 
         # cache computed line collection
         if cache:
-            self._line_collection = line_collection
+            self._geometry_cache["line_collection"] = line_collection
 
         return line_collection
 
+    def to_raster_lookup(
+        self,
+        width: Optional[int] = 1000,
+        height: Optional[int] = 500,
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        projection=None,
+    ):
+        """Constructs an image that stores the index of the face covering each
+        pixel of a canvas, so that repeated rasters of face-centered data on
+        the same canvas reduce to indexing the data with it (see
+        ``UxDataArray.to_raster``).
+
+        The lookup is computed once for each canvas size, extent and projection and cached on the grid.
+
+        Parameters
+        ----------
+        width, height : int
+            Size of the canvas in pixels
+        x_range, y_range : tuple, optional
+            Extent of the canvas, defaulting to the whole globe in degrees, or the limits of ``projection``
+        projection : cartopy.crs.Projection, optional
+            Projection that the faces are transformed to before rasterizing
+
+        Returns
+        -------
+        raster_lookup : np.ndarray
+            Face that covers each pixel, with the first row at the top of the canvas and ``INT_FILL_VALUE`` for pixels
+            not covered by any face, shape ``(height, width)``
+        """
+        return _get_raster_lookup(self, width, height, x_range, y_range, projection)
+
+    @property
+    def geometry_cache_nbytes(self) -> dict:
+        """Memory in bytes used by each cached geometry entry, such as the
+        polygon shells of each face, their split geometry and the exported
+        ``GeoDataFrame``, ``PolyCollection`` and ``LineCollection``.
+
+        Entries are constructed on first use by any of ``Grid.to_geodataframe``, ``Grid.to_polycollection`` or
+        ``Grid.to_linecollection`` and shared between them.
+        """
+        return _geometry_cache_nbytes(self)
+
+    def clear_geometry_cache(self):
+        """Clears the cached polygon shells, split geometry and exported
+        geometries of the grid, which are reconstructed on their next use."""
+        self._geometry_cache.clear()
+
+    def reorder(self, method: Optional[str] = "hilbert", return_indices=False):
+        """Reorders the nodes, edges and faces of the grid along a space-
+        filling curve through their Cartesian centroids, so that elements that
+        are close on the sphere are also close in memory, and returns a new
+        grid.
+
+        Every connectivity variable is updated to point to the new index of each element. The returned indices can
+        be used to reorder data variables alongside the grid (see ``UxDataArray.reorder`` and
+        ``UxDataset.reorder``).
+
+        Parameters
+        ----------
+        method : str, default="hilbert"
+            Space-filling curve to order the elements with, either "hilbert" or "morton"
+        return_indices : bool, default=False
+            Whether to also return the permutation of each grid dimension
+
+        Returns
+        -------
+        reordered_grid : uxarray.Grid
+            Grid with its elements reordered
+        indices : dict
+            Permutation of each grid dimension (``n_node``, ``n_edge``, ``n_face``), where element ``i`` of the
+            reordered grid is element ``indices[dim][i]`` of this grid. Only returned if ``return_indices`` is true
+
+        Example
+        -------
+        >>> grid = ux.open_grid(grid_path)
+        >>> reordered_grid, indices = grid.reorder(return_indices=True)
+        """
+        from .reordering import _get_reordering_indices, _reorder_grid
+
+        indices = _get_reordering_indices(self, method)
+        reordered_grid = _reorder_grid(self, indices)
+
+        if return_indices:
+            return reordered_grid, indices
+        return reordered_grid
+
+    def partition(
+        self,
+        n_partitions: int,
+        halo_width: Optional[int] = 1,
+        method: Optional[str] = "hilbert",
+    ):
+        """Decomposes the grid into balanced, compact subgrids that can be
+        processed in parallel.
+
+        Faces are ordered along a space-filling curve through their Cartesian centroids and split into
+        ``n_partitions`` contiguous chunks of (almost) equal size. The subgrid of each partition contains its owned
+        faces, followed by ``halo_width`` layers of halo (ghost) faces that share an edge with them, so that stencil
+        operators (i.e. ``UxDataArray.gradient``) evaluated on the owned elements of each subgrid match the values
+        computed on the whole grid.
+
+        Parameters
+        ----------
+        n_partitions : int
+            Number of partitions
+        halo_width : int, default=1
+            Number of layers of halo faces around the owned faces of each partition
+        method : str, default="hilbert"
+            Space-filling curve used to assign faces to partitions, either "hilbert" or "morton"
+
+        Returns
+        -------
+        partitions : list of dict
+            Dictionary for each partition with the following entries
+
+            - ``"grid"``: subgrid containing the owned and halo faces of the partition
+            - ``"face_indices"``, ``"edge_indices"``, ``"node_indices"``: index of each face, edge and node of
+              the subgrid in this grid
+            - ``"owned_faces"``, ``"owned_edges"``, ``"owned_nodes"``: local indices of the faces, edges and nodes
+              of the subgrid owned by the partition, with each element of this grid owned by exactly one partition
+            - ``"halo_faces"``: local indices of the halo faces of the subgrid
+
+        Example
+        -------
+        >>> grid = ux.open_grid(grid_path)
+        >>> grad = np.empty(grid.n_edge)
+        >>> for part in grid.partition(4):
+        ...     local_uxda = ux.UxDataArray(uxda.values[part["face_indices"]], uxgrid=part["grid"], dims=["n_face"])
+        ...     local_grad = local_uxda.gradient().values
+        ...     grad[part["edge_indices"][part["owned_edges"]]] = local_grad[part["owned_edges"]]
+        """
+        from .partition import _partition_grid
+
+        return _partition_grid(self, n_partitions, halo_width, method)
+
     def isel(self, **dim_kwargs):
         """Indexes an unstructured grid along a given dimension (``n_node``,
         ``n_edge``, or ``n_face``) and returns a new grid.
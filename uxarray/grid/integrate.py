@@ -1,8 +1,19 @@
 import numpy as np
-from uxarray.constants import ERROR_TOLERANCE, INT_FILL_VALUE
-from uxarray.grid.intersections import gca_constLat_intersection
+from uxarray.constants import (
+    ERROR_TOLERANCE,
+    INT_DTYPE,
+    INT_FILL_VALUE,
+    ENABLE_JIT_CACHE,
+)
+from uxarray.grid.intersections import (
+    gca_constLat_intersection,
+    gca_constLat_intersection_batch,
+)
 from uxarray.grid.coordinates import _xyz_to_lonlat_rad
 import pandas as pd
+from scipy import sparse
+
+from numba import njit
 
 DUMMY_EDGE_VALUE = [INT_FILL_VALUE, INT_FILL_VALUE, INT_FILL_VALUE]
 
@@ -322,33 +333,470 @@ def _process_overlapped_intervals(intervals_df):
     >>> print(overlap_contributions)
     >>> print(total_length)
     """
-    events = []
-    for idx, row in intervals_df.iterrows():
-        events.append((row["start"], "start", row["face_index"]))
-        events.append((row["end"], "end", row["face_index"]))
+    face_indices = intervals_df["face_index"].to_numpy()
 
-    events.sort()  # Sort by position and then by start/end
+    faces, contributions, total_length = _process_overlapped_intervals_batch(
+        intervals_df["start"].to_numpy(),
+        intervals_df["end"].to_numpy(),
+        face_indices.astype(INT_DTYPE),
+    )
 
-    active_faces = set()
-    last_position = None
-    total_length = 0.0
     overlap_contributions = {}
+    for face_idx, contribution in zip(faces[0], contributions[0]):
+        overlap_contributions[face_idx] = (
+            overlap_contributions.get(face_idx, 0.0) + contribution
+        )
 
-    for position, event_type, face_idx in events:
-        if last_position is not None and active_faces:
-            segment_length = position - last_position
-            segment_weight = segment_length / len(active_faces) if active_faces else 0
-            for active_face in active_faces:
-                overlap_contributions[active_face] = (
-                    overlap_contributions.get(active_face, 0) + segment_weight
-                )
-            total_length += segment_length
+    return overlap_contributions, total_length[0]
+
+
+def _process_overlapped_intervals_batch(
+    starts, ends, face_indices, group_indices=None, n_groups=None
+):
+    """Process the overlapped intervals of one or more groups of intervals
+    (i.e. the intervals at each latitude) in a single compiled sweep line,
+    with each position covered by multiple faces split evenly between them.
+
+    Parameters
+    ----------
+    starts, ends : np.ndarray
+        Start and end of each interval. Shape: (n_intervals,)
+    face_indices : np.ndarray
+        Face index of each interval, with faces that have multiple intervals only counted once where they overlap.
+        Shape: (n_intervals,)
+    group_indices : np.ndarray, optional
+        Group of each interval, with all intervals belonging to a single group if not provided.
+        Shape: (n_intervals,)
+    n_groups : int, optional
+        Number of groups, defaults to one more than the largest group index
+
+    Returns
+    -------
+    faces : list of np.ndarray
+        Face index of each contribution in each group, with faces that have multiple disjoint intervals appearing
+        once per interval
+    contributions : list of np.ndarray
+        Contribution of each face in each group to the total length
+    total_length : np.ndarray
+        The total length of all intervals of each group considering their overlaps. Shape: (n_groups,)
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    face_indices = np.asarray(face_indices, dtype=INT_DTYPE)
+
+    if group_indices is None:
+        group_indices = np.zeros(starts.size, dtype=INT_DTYPE)
+    else:
+        group_indices = np.asarray(group_indices, dtype=INT_DTYPE)
+
+    if n_groups is None:
+        n_groups = group_indices.max() + 1 if group_indices.size else 1
+
+    # events sorted by group, then position, with the start of intervals before their end at the same position
+    positions = np.concatenate([starts, ends])
+    is_end = np.repeat(np.array([False, True]), starts.size)
+    event_groups = np.concatenate([group_indices, group_indices])
+    order = np.lexsort((is_end, positions, event_groups))
+
+    event_faces, event_contributions, event_groups_out, total_length = (
+        _sweep_sorted_events(
+            positions[order],
+            is_end[order],
+            np.concatenate([face_indices, face_indices])[order],
+            event_groups[order],
+            n_groups,
+            face_indices.max() + 1 if face_indices.size else 0,
+        )
+    )
+
+    # split the contributions by group, which are already sorted
+    split_indices = np.searchsorted(event_groups_out, np.arange(1, n_groups))
+    faces = np.split(event_faces, split_indices)
+    contributions = np.split(event_contributions, split_indices)
+
+    return faces, contributions, total_length
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _sweep_sorted_events(positions, is_end, faces, groups, n_groups, n_faces):
+    """Compiled sweep line over sorted interval events (used by
+    ``_process_overlapped_intervals_batch``).
+
+    Instead of updating the contribution of every active face at every
+    event, the integral of ``1 / n_active`` along each group is accumulated,
+    and the contribution of a face is the difference of that integral
+    between the positions where it becomes active and inactive.
+    """
+    n_events = positions.size
+
+    out_faces = np.empty(n_events // 2, dtype=faces.dtype)
+    out_contributions = np.empty(n_events // 2, dtype=np.float64)
+    out_groups = np.empty(n_events // 2, dtype=groups.dtype)
+    n_out = 0
+
+    total_length = np.zeros(n_groups, dtype=np.float64)
+
+    # number of open intervals of each face, and the integral when it became active
+    open_intervals = np.zeros(n_faces, dtype=np.int64)
+    integral_at_start = np.zeros(n_faces, dtype=np.float64)
+
+    n_active = 0
+    integral = 0.0
+    for event_idx in range(n_events):
+        group = groups[event_idx]
+        position = positions[event_idx]
+
+        if event_idx == 0 or groups[event_idx - 1] != group:
+            # all intervals of the previous group are closed
+            integral = 0.0
+        elif n_active > 0:
+            segment_length = position - positions[event_idx - 1]
+            integral += segment_length / n_active
+            total_length[group] += segment_length
+
+        face = faces[event_idx]
+        if not is_end[event_idx]:
+            if open_intervals[face] == 0:
+                integral_at_start[face] = integral
+                n_active += 1
+            open_intervals[face] += 1
+        else:
+            open_intervals[face] -= 1
+            if open_intervals[face] == 0:
+                out_faces[n_out] = face
+                out_contributions[n_out] = integral - integral_at_start[face]
+                out_groups[n_out] = group
+                n_out += 1
+                n_active -= 1
+
+    return (
+        out_faces[:n_out],
+        out_contributions[:n_out],
+        out_groups[:n_out],
+        total_length,
+    )
 
-        if event_type == "start":
-            active_faces.add(face_idx)
-        elif event_type == "end":
-            active_faces.remove(face_idx)
 
-        last_position = position
+def _face_latitude_bounds(grid):
+    """Computes the minimum and maximum latitude in radians of each face of a
+    grid from the cached latitude extremes of its edges
+    (``Grid.edge_latitude_extremes``), extending the bounds of faces that
+    contain a pole to that pole.
+
+    Returns
+    -------
+    lat_bounds : np.ndarray
+        Minimum and maximum latitude of each face. Shape: (n_face, 2)
+    contains_pole : np.ndarray
+        Boolean mask of the faces that contain a pole. Shape: (n_face,)
+    """
+    face_edges = grid.face_edge_connectivity.values
+    valid_edges = face_edges != INT_FILL_VALUE
+    edge_extremes = grid.edge_latitude_extremes.values[
+        np.where(valid_edges, face_edges, 0)
+    ]
+
+    lat_bounds = np.stack(
+        [
+            np.where(valid_edges, edge_extremes[..., 0], np.inf).min(axis=1),
+            np.where(valid_edges, edge_extremes[..., 1], -np.inf).max(axis=1),
+        ],
+        axis=-1,
+    )
+
+    # a face contains a pole if its nodes wind around it (i.e. the longitude changes by 2 pi along its boundary)
+    face_nodes = grid.face_node_connectivity.values
+    valid_nodes = face_nodes != INT_FILL_VALUE
+    node_lon = np.deg2rad(grid.node_lon.values)[np.where(valid_nodes, face_nodes, 0)]
+
+    # the node following each node, closing each face
+    n_nodes_per_face = valid_nodes.sum(axis=1)
+    next_index = (
+        np.arange(1, face_nodes.shape[1] + 1)[None, :] % n_nodes_per_face[:, None]
+    )
+    next_lon = np.take_along_axis(node_lon, next_index, axis=1)
+
+    # the longitude of nodes on a pole is arbitrary, so edges touching them do not wind around it
+    node_on_pole = (
+        np.abs(grid.node_z.values[np.where(valid_nodes, face_nodes, 0)])
+        >= 1.0 - ERROR_TOLERANCE
+    )
+    next_on_pole = np.take_along_axis(node_on_pole, next_index, axis=1)
+
+    lon_diff = np.mod(next_lon - node_lon + np.pi, 2 * np.pi) - np.pi
+    winding = np.where(valid_nodes & ~node_on_pole & ~next_on_pole, lon_diff, 0.0).sum(
+        axis=1
+    )
+    contains_pole = np.abs(winding) > np.pi
+
+    north = grid.face_z.values >= 0
+    lat_bounds[contains_pole & north, 1] = np.pi / 2
+    lat_bounds[contains_pole & ~north, 0] = -np.pi / 2
+
+    return lat_bounds, contains_pole
+
+
+def _get_zonal_weights(grid, latitudes):
+    """Computes the weight of each face at each constant latitude, which is
+    the fraction of the length of the latitude line that is covered by that
+    face.
+
+    Candidate faces are selected using the latitude bounds of each face, the
+    intersections of their edges with each latitude are computed in a single
+    compiled call, and the overlap of the resulting longitude intervals is
+    resolved using a sweep line.
+
+    Requires the span of each face in longitude to be less than pi, unless it
+    contains a pole. All edges are considered as GCAs, except for edges on the
+    equator, which are treated as constant latitude lines.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    latitudes : np.ndarray
+        Latitudes in degrees. Shape: (n_lat,)
+
+    Returns
+    -------
+    weights : scipy.sparse.csr_matrix
+        Weight of each face at each latitude, with rows that sum to one for latitudes covered by the grid.
+        Shape: (n_lat, n_face)
+    """
+    latitudes_rad = np.deg2rad(np.asarray(latitudes, dtype=np.float64))
 
-    return overlap_contributions, total_length
+    starts, ends, interval_faces, lat_indices = _get_zonal_intervals(grid, latitudes)
+
+    if starts.size == 0:
+        return sparse.csr_matrix((latitudes_rad.size, grid.n_face))
+
+    # resolve the overlaps at all latitudes in a single sweep
+    faces, contributions, total_length = _process_overlapped_intervals_batch(
+        starts, ends, interval_faces, lat_indices, latitudes_rad.size
+    )
+
+    rows = np.repeat(np.arange(latitudes_rad.size), [f.size for f in faces])
+    data = np.concatenate(contributions)
+
+    # latitudes that are only touched by faces (i.e. only have intervals of zero length) are left without weights
+    row_length = total_length[rows]
+    data = np.divide(data, row_length, out=np.zeros_like(data), where=row_length > 0)
+
+    # faces with multiple disjoint intervals at a latitude are summed
+    return sparse.csr_matrix(
+        (data, (rows, np.concatenate(faces))),
+        shape=(latitudes_rad.size, grid.n_face),
+    )
+
+
+def _get_zonal_intervals(grid, latitudes):
+    """Computes the longitude intervals in radians where each face of a grid
+    intersects each constant latitude, batched across all latitudes for
+    ``_process_overlapped_intervals_batch``.
+
+    Candidate faces at each latitude are selected using the latitude bounds of each face (see
+    ``_face_latitude_bounds``), and their intervals computed with ``_get_zonal_intervals_at_constLat``.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    latitudes : np.ndarray
+        Latitudes in degrees. Shape: (n_lat,)
+
+    Returns
+    -------
+    starts, ends : np.ndarray
+        Start and end longitude of each interval, with intervals crossing the prime meridian split in two
+    interval_faces : np.ndarray
+        Index of the face of each interval
+    lat_indices : np.ndarray
+        Index of the latitude of each interval
+    """
+    latitudes_rad = np.deg2rad(np.asarray(latitudes, dtype=np.float64))
+
+    lat_bounds, contains_pole = _face_latitude_bounds(grid)
+
+    face_edges = grid.face_edge_connectivity.values
+    node_xyz = np.stack(
+        [grid.node_x.values, grid.node_y.values, grid.node_z.values], axis=-1
+    )
+    edges_cart = node_xyz[grid.edge_node_connectivity.values]
+
+    all_starts, all_ends, all_faces, all_lat_indices = [], [], [], []
+    for lat_idx, lat in enumerate(latitudes_rad):
+        candidate_faces = np.flatnonzero(
+            (lat_bounds[:, 0] - ERROR_TOLERANCE <= lat)
+            & (lat <= lat_bounds[:, 1] + ERROR_TOLERANCE)
+        )
+        if candidate_faces.size == 0:
+            continue
+
+        starts, ends, interval_faces = _get_zonal_intervals_at_constLat(
+            edges_cart,
+            face_edges[candidate_faces],
+            np.sin(lat),
+            contains_pole[candidate_faces],
+        )
+
+        all_starts.append(starts)
+        all_ends.append(ends)
+        all_faces.append(candidate_faces[interval_faces])
+        all_lat_indices.append(np.full(starts.size, lat_idx, dtype=INT_DTYPE))
+
+    if not all_starts:
+        return (
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=INT_DTYPE),
+            np.empty(0, dtype=INT_DTYPE),
+        )
+
+    return (
+        np.concatenate(all_starts),
+        np.concatenate(all_ends),
+        np.concatenate(all_faces),
+        np.concatenate(all_lat_indices),
+    )
+
+
+def _get_zonal_intervals_at_constLat(
+    edges_cart, candidate_face_edges, latitude_cart, contains_pole
+):
+    """Computes the longitude intervals in radians where each candidate face
+    intersects a constant latitude, using a single batched intersection call
+    for all of their edges.
+
+    Parameters
+    ----------
+    edges_cart : np.ndarray
+        Cartesian coordinates of the nodes of every edge in the grid. Shape: (n_edge, 2, 3)
+    candidate_face_edges : np.ndarray
+        Face edge connectivity of the candidate faces. Shape: (n_candidates, n_max_face_edges)
+    latitude_cart : float
+        The latitude in cartesian, the normalized Z coordinates.
+    contains_pole : np.ndarray
+        Whether each candidate face contains a pole. Shape: (n_candidates,)
+
+    Returns
+    -------
+    starts, ends : np.ndarray
+        Start and end longitude of each interval, with intervals crossing the prime meridian split in two
+    interval_faces : np.ndarray
+        Index of the candidate face of each interval
+    """
+    valid_edges = candidate_face_edges != INT_FILL_VALUE
+    unique_edges, inverse = np.unique(
+        candidate_face_edges[valid_edges], return_inverse=True
+    )
+
+    intersections, found = gca_constLat_intersection_batch(
+        edges_cart[unique_edges], latitude_cart
+    )
+
+    if abs(latitude_cart) <= ERROR_TOLERANCE:
+        # edges on the equator overlap with it, their nodes bound the interval
+        on_equator = np.all(
+            np.abs(edges_cart[unique_edges][:, :, 2]) <= ERROR_TOLERANCE, axis=1
+        )
+        intersections[on_equator] = edges_cart[unique_edges][on_equator]
+        found[on_equator] = True
+
+    n_candidates, n_max_face_edges = candidate_face_edges.shape
+    face_intersections = np.full((n_candidates, n_max_face_edges, 2, 3), np.nan)
+    face_found = np.zeros((n_candidates, n_max_face_edges, 2), dtype=np.bool_)
+    face_intersections[valid_edges] = intersections[inverse]
+    face_found[valid_edges] = found[inverse]
+
+    return _zonal_face_intervals(
+        face_intersections.reshape(n_candidates, -1, 3),
+        face_found.reshape(n_candidates, -1),
+        contains_pole,
+    )
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _zonal_face_intervals(face_intersections, face_found, contains_pole):
+    """Compiled helper for (``_get_zonal_intervals_at_constLat``), converting
+    the intersection points of each face into longitude intervals.
+
+    The interval of a face spans from one intersection point to the next
+    around the latitude line, skipping over the largest gap between them
+    (or the smallest gap for faces that contain a pole). Faces that only
+    touch the latitude at a single point do not have an interval, while faces
+    that contain a pole and whose boundary does not cross the latitude, or
+    faces with a node on a pole at the latitude of that pole, cover it
+    entirely.
+    """
+    n_faces, n_points, _ = face_intersections.shape
+
+    starts = np.empty(2 * n_faces, dtype=np.float64)
+    ends = np.empty(2 * n_faces, dtype=np.float64)
+    interval_faces = np.empty(2 * n_faces, dtype=np.int64)
+    n_intervals = 0
+
+    lons = np.empty(n_points, dtype=np.float64)
+    unique_points = np.empty((n_points, 3), dtype=np.float64)
+
+    for face_idx in range(n_faces):
+        # collect the distinct intersection points of the face
+        n_unique = 0
+        for pt_idx in range(n_points):
+            if not face_found[face_idx, pt_idx]:
+                continue
+            pt = face_intersections[face_idx, pt_idx]
+            duplicate = False
+            for other_idx in range(n_unique):
+                if (
+                    abs(unique_points[other_idx, 0] - pt[0]) <= ERROR_TOLERANCE
+                    and abs(unique_points[other_idx, 1] - pt[1]) <= ERROR_TOLERANCE
+                    and abs(unique_points[other_idx, 2] - pt[2]) <= ERROR_TOLERANCE
+                ):
+                    duplicate = True
+                    break
+            if not duplicate:
+                unique_points[n_unique] = pt
+                lons[n_unique] = np.mod(np.arctan2(pt[1], pt[0]), 2 * np.pi)
+                n_unique += 1
+
+        if n_unique < 2:
+            # faces containing a pole, or touching it at the latitude of the pole, cover the whole latitude
+            if contains_pole[face_idx] or (
+                n_unique == 1 and abs(unique_points[0, 2]) >= 1.0 - ERROR_TOLERANCE
+            ):
+                starts[n_intervals] = 0.0
+                ends[n_intervals] = 2 * np.pi
+                interval_faces[n_intervals] = face_idx
+                n_intervals += 1
+            continue
+
+        face_lons = np.sort(lons[:n_unique])
+
+        # gap following each longitude, with the last one wrapping around the prime meridian
+        gap_idx = n_unique - 1
+        gap = 2 * np.pi - face_lons[n_unique - 1] + face_lons[0]
+        for i in range(n_unique - 1):
+            current_gap = face_lons[i + 1] - face_lons[i]
+            if (current_gap > gap) != contains_pole[face_idx]:
+                gap = current_gap
+                gap_idx = i
+
+        if gap_idx == n_unique - 1:
+            starts[n_intervals] = face_lons[0]
+            ends[n_intervals] = face_lons[n_unique - 1]
+            interval_faces[n_intervals] = face_idx
+            n_intervals += 1
+        else:
+            # the interval crosses the prime meridian, only store non-empty parts
+            if face_lons[gap_idx + 1] < 2 * np.pi:
+                starts[n_intervals] = face_lons[gap_idx + 1]
+                ends[n_intervals] = 2 * np.pi
+                interval_faces[n_intervals] = face_idx
+                n_intervals += 1
+            if face_lons[gap_idx] > 0.0:
+                starts[n_intervals] = 0.0
+                ends[n_intervals] = face_lons[gap_idx]
+                interval_faces[n_intervals] = face_idx
+                n_intervals += 1
+
+    return starts[:n_intervals], ends[:n_intervals], interval_faces[:n_intervals]
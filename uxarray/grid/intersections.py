@@ -1,10 +1,12 @@
 import numpy as np
-from uxarray.constants import ERROR_TOLERANCE
+from uxarray.constants import ERROR_TOLERANCE, ENABLE_JIT_CACHE
 from uxarray.grid.utils import _newton_raphson_solver_for_gca_constLat
-from uxarray.grid.arcs import point_within_gca
+from uxarray.grid.arcs import point_within_gca, _point_within_minor_gca
 import platform
 import warnings
-from uxarray.utils.computing import cross_fma
+from uxarray.utils.computing import cross_fma, _cross_split
+
+from numba import njit
 
 
 def gca_gca_intersection(gca1_cart, gca2_cart, fma_disabled=False):
@@ -199,3 +201,237 @@ def gca_constLat_intersection(
         )
 
     return res if res is not None else np.array([])
+
+
+def gca_gca_intersection_batch(gca1_cart, gca2_cart, fma_disabled=False):
+    """Calculate the intersection point of every Great Circle Arc (GCA) in
+    ``gca1_cart`` with every GCA in ``gca2_cart`` in a single compiled call.
+
+    Batched equivalent of (``gca_gca_intersection``). Intersections are
+    returned in fixed-shape arrays, along with a mask indicating which pairs of
+    arcs intersect, instead of growing the result per pair.
+
+    Parameters
+    ----------
+    gca1_cart : np.ndarray
+        Cartesian coordinates of the end points of the first set of GCAs, with shape ``(n, 2, 3)``
+    gca2_cart : np.ndarray
+        Cartesian coordinates of the end points of the second set of GCAs, with shape ``(m, 2, 3)``
+    fma_disabled : bool, optional (default=False)
+        If True, the cross products are computed naively. Otherwise, they are computed using error-free
+        transformations, equivalent to ``cross_fma``
+
+    Returns
+    -------
+    intersections : np.ndarray
+        Cartesian coordinates of the intersection point of each pair of GCAs, with shape ``(n, m, 3)``, and
+        ``np.nan`` where the GCAs do not intersect
+    valid : np.ndarray
+        Boolean mask with shape ``(n, m)`` indicating which pairs of GCAs intersect
+
+    Raises
+    ------
+    ValueError
+        If the input GCAs are not in the cartesian [x, y, z] format.
+    """
+    gca1_cart = np.ascontiguousarray(gca1_cart, dtype=np.float64)
+    gca2_cart = np.ascontiguousarray(gca2_cart, dtype=np.float64)
+
+    if gca1_cart.shape[1:] != (2, 3) or gca2_cart.shape[1:] != (2, 3):
+        raise ValueError(
+            "The GCAs must be in the cartesian [x, y, z] format with shape (n, 2, 3)"
+        )
+
+    return _gca_gca_intersection_batch(gca1_cart, gca2_cart, fma_disabled)
+
+
+def gca_constLat_intersection_batch(gca_cart, constZ, fma_disabled=False):
+    """Calculate the intersection points of every Great Circle Arc (GCA) in
+    ``gca_cart`` with a constant latitude line in a single compiled call.
+
+    Batched equivalent of (``gca_constLat_intersection``) for undirected GCAs.
+    Each GCA intersects the latitude at most twice, so intersections are
+    returned in fixed-shape arrays, along with a mask indicating which
+    intersections exist.
+
+    Parameters
+    ----------
+    gca_cart : np.ndarray
+        Cartesian coordinates of the end points of each GCA, with shape ``(n, 2, 3)``
+    constZ : float
+        The constant latitude represented in cartesian of the latitude line.
+    fma_disabled : bool, optional (default=False)
+        If True, the cross products are computed naively. Otherwise, they are computed using error-free
+        transformations, equivalent to ``cross_fma``
+
+    Returns
+    -------
+    intersections : np.ndarray
+        Cartesian coordinates of the intersection points of each GCA, with shape ``(n, 2, 3)``, and ``np.nan``
+        where there is no intersection. Intersections of each GCA are stored first.
+    valid : np.ndarray
+        Boolean mask with shape ``(n, 2)`` indicating which intersections exist
+
+    Raises
+    ------
+    ValueError
+        If the input GCAs are not in the cartesian [x, y, z] format.
+    """
+    gca_cart = np.ascontiguousarray(gca_cart, dtype=np.float64)
+
+    if gca_cart.shape[1:] != (2, 3):
+        raise ValueError(
+            "The GCAs must be in the cartesian [x, y, z] format with shape (n, 2, 3)"
+        )
+
+    return _gca_constLat_intersection_batch(gca_cart, float(constZ), fma_disabled)
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _arc_normals(gca_cart, fma_disabled):
+    """Computes the (unnormalized) normal of the plane of each GCA."""
+    normals = np.empty((gca_cart.shape[0], 3), dtype=np.float64)
+    for i in range(gca_cart.shape[0]):
+        u = gca_cart[i, 0]
+        v = gca_cart[i, 1]
+        if fma_disabled:
+            normals[i, 0] = u[1] * v[2] - u[2] * v[1]
+            normals[i, 1] = u[2] * v[0] - u[0] * v[2]
+            normals[i, 2] = u[0] * v[1] - u[1] * v[0]
+        else:
+            normals[i, 0], normals[i, 1], normals[i, 2] = _cross_split(
+                u[0], u[1], u[2], v[0], v[1], v[2]
+            )
+    return normals
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _gca_gca_intersection_batch(gca1_cart, gca2_cart, fma_disabled):
+    """Compiled kernel for (``gca_gca_intersection_batch``)."""
+    n_gca1 = gca1_cart.shape[0]
+    n_gca2 = gca2_cart.shape[0]
+
+    intersections = np.full((n_gca1, n_gca2, 3), np.nan, dtype=np.float64)
+    valid = np.zeros((n_gca1, n_gca2), dtype=np.bool_)
+
+    w_norms = _arc_normals(gca1_cart, fma_disabled)
+    v_norms = _arc_normals(gca2_cart, fma_disabled)
+
+    for i in range(n_gca1):
+        wx, wy, wz = w_norms[i]
+        for j in range(n_gca2):
+            vx, vy, vz = v_norms[j]
+
+            if fma_disabled:
+                cx = wy * vz - wz * vy
+                cy = wz * vx - wx * vz
+                cz = wx * vy - wy * vx
+            else:
+                cx, cy, cz = _cross_split(wx, wy, wz, vx, vy, vz)
+
+            # the two GCAs are parallel
+            if (
+                abs(cx) <= ERROR_TOLERANCE
+                and abs(cy) <= ERROR_TOLERANCE
+                and abs(cz) <= ERROR_TOLERANCE
+            ):
+                continue
+
+            c_norm = np.sqrt(cx * cx + cy * cy + cz * cz)
+            cx /= c_norm
+            cy /= c_norm
+            cz /= c_norm
+
+            # determine which of the two antipodal points is within both GCAs
+            for sign in (1.0, -1.0):
+                px = sign * cx
+                py = sign * cy
+                pz = sign * cz
+                if _point_within_minor_gca(
+                    px, py, pz, gca1_cart[i, 0], gca1_cart[i, 1]
+                ) and _point_within_minor_gca(
+                    px, py, pz, gca2_cart[j, 0], gca2_cart[j, 1]
+                ):
+                    intersections[i, j, 0] = px
+                    intersections[i, j, 1] = py
+                    intersections[i, j, 2] = pz
+                    valid[i, j] = True
+                    break
+
+    return intersections, valid
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _newton_raphson_gca_constLat(x, y, constZ, nx, ny, nz, max_iter=1000):
+    """Compiled equivalent of (``_newton_raphson_solver_for_gca_constLat``)
+    operating on the normal of the plane of the GCA."""
+    for _ in range(max_iter):
+        f_plane = nx * x + ny * y + nz * constZ
+        f_sphere = x * x + y * y + constZ * constZ - 1.0
+
+        det = 2.0 * (nx * y - ny * x)
+        if det == 0.0:
+            # singular Jacobian
+            break
+
+        dx = (2.0 * y * f_plane - ny * f_sphere) / det
+        dy = (nx * f_sphere - 2.0 * x * f_plane) / det
+
+        x -= dx
+        y -= dy
+
+        if max(abs(dx), abs(dy)) <= ERROR_TOLERANCE:
+            break
+
+    return x, y
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _gca_constLat_intersection_batch(gca_cart, constZ, fma_disabled):
+    """Compiled kernel for (``gca_constLat_intersection_batch``)."""
+    n_gca = gca_cart.shape[0]
+
+    intersections = np.full((n_gca, 2, 3), np.nan, dtype=np.float64)
+    valid = np.zeros((n_gca, 2), dtype=np.bool_)
+
+    normals = _arc_normals(gca_cart, fma_disabled)
+
+    for i in range(n_gca):
+        nx, ny, nz = normals[i]
+
+        nxy_sq = nx * nx + ny * ny
+        s_tilde_sq = nxy_sq - (nxy_sq + nz * nz) * constZ * constZ
+        if nxy_sq == 0.0 or s_tilde_sq < 0.0:
+            # the plane of the GCA does not reach the latitude
+            continue
+        s_tilde = np.sqrt(s_tilde_sq)
+
+        n_found = 0
+        for sign in (1.0, -1.0):
+            px = -(constZ * nx * nz + sign * s_tilde * ny) / nxy_sq
+            py = -(constZ * ny * nz - sign * s_tilde * nx) / nxy_sq
+
+            if not _point_within_minor_gca(
+                px, py, constZ, gca_cart[i, 0], gca_cart[i, 1]
+            ):
+                continue
+
+            # the naive normal is used to match the residual of the scalar solver
+            u = gca_cart[i, 0]
+            v = gca_cart[i, 1]
+            px, py = _newton_raphson_gca_constLat(
+                px,
+                py,
+                constZ,
+                u[1] * v[2] - u[2] * v[1],
+                u[2] * v[0] - u[0] * v[2],
+                u[0] * v[1] - u[1] * v[0],
+            )
+
+            intersections[i, n_found, 0] = px
+            intersections[i, n_found, 1] = py
+            intersections[i, n_found, 2] = constZ
+            valid[i, n_found] = True
+            n_found += 1
+
+    return intersections, valid
@@ -0,0 +1,191 @@
+import numpy as np
+
+from uxarray.constants import INT_DTYPE
+from uxarray.grid.coordinates import _xyz_to_lonlat_deg
+from uxarray.grid.reordering import _sfc_order
+
+# number of clusters of each level of detail that are merged into a single cluster of the next coarser level
+LOD_FACTOR = 4
+
+# levels are coarsened until the coarsest level has at most this many clusters
+LOD_MIN_CLUSTERS = 1000
+
+# number of clusters rendered for each pixel of a viewport, so that every pixel is covered by at least one cluster
+LOD_CLUSTERS_PER_PIXEL = 4
+
+
+def _get_lod_pyramid(grid):
+    """Returns the level-of-detail pyramid of the faces of a grid, as
+    returned by ``_build_lod_pyramid``, which is constructed once and stored
+    in ``Grid._geometry_cache``."""
+    if "lod_face_order" not in grid._geometry_cache:
+        (
+            grid._geometry_cache["lod_face_order"],
+            grid._geometry_cache["lod_level_offsets"],
+            grid._geometry_cache["lod_cluster_lon"],
+            grid._geometry_cache["lod_cluster_lat"],
+            grid._geometry_cache["lod_cluster_area"],
+        ) = _build_lod_pyramid(
+            np.column_stack(
+                [grid.face_x.values, grid.face_y.values, grid.face_z.values]
+            ).astype(np.float64),
+            grid.face_areas.values,
+        )
+    return (
+        grid._geometry_cache["lod_face_order"],
+        grid._geometry_cache["lod_level_offsets"],
+        grid._geometry_cache["lod_cluster_lon"],
+        grid._geometry_cache["lod_cluster_lat"],
+        grid._geometry_cache["lod_cluster_area"],
+    )
+
+
+def _build_lod_pyramid(
+    face_xyz, face_areas, factor=LOD_FACTOR, min_clusters=LOD_MIN_CLUSTERS
+):
+    """Builds a pyramid of increasingly coarse clusters of faces, by
+    ordering the faces along a Hilbert curve through their Cartesian centroids
+    and merging every ``factor`` consecutive clusters of each level into a
+    single cluster of the next level.
+
+    Consecutive faces along the curve are close on the sphere, so each cluster covers a compact region, similar to
+    a cell of an octree over the face centroids. The first level contains each face as its own cluster.
+
+    Parameters
+    ----------
+    face_xyz : np.ndarray
+        Cartesian coordinates of the centroid of each face, shape ``(n_face, 3)``
+    face_areas : np.ndarray
+        Area of each face
+    factor : int, default=LOD_FACTOR
+        Number of clusters merged into each cluster of the next level
+    min_clusters : int, default=LOD_MIN_CLUSTERS
+        Levels are added until the coarsest level has at most this many clusters
+
+    Returns
+    -------
+    face_order : np.ndarray
+        Faces ordered along the curve, where the cluster ``i`` of level ``l`` contains the faces
+        ``face_order[i * factor**l:(i + 1) * factor**l]``
+    level_offsets : np.ndarray
+        Offset of the clusters of each level in the cluster arrays, shape ``(n_level + 1, )``
+    cluster_lon, cluster_lat : np.ndarray
+        Area-weighted centroid of each cluster of every level in degrees
+    cluster_area : np.ndarray
+        Area of each cluster of every level
+    """
+    face_order = _sfc_order(face_xyz, "hilbert")
+
+    level_area = face_areas[face_order].astype(np.float64)
+    level_xyz = face_xyz[face_order] * level_area[:, None]
+
+    areas = [level_area]
+    xyz = [level_xyz]
+    while level_area.size > min_clusters:
+        starts = np.arange(0, level_area.size, factor)
+        level_area = np.add.reduceat(level_area, starts)
+        level_xyz = np.add.reduceat(level_xyz, starts, axis=0)
+        areas.append(level_area)
+        xyz.append(level_xyz)
+
+    level_offsets = np.concatenate([[0], np.cumsum([a.size for a in areas])]).astype(
+        INT_DTYPE
+    )
+
+    # the weighted sum of the centroids points towards the centroid of each cluster
+    cluster_xyz = np.concatenate(xyz)
+    cluster_lon, cluster_lat = _xyz_to_lonlat_deg(
+        cluster_xyz[:, 0], cluster_xyz[:, 1], cluster_xyz[:, 2]
+    )
+
+    return (
+        face_order,
+        level_offsets,
+        cluster_lon,
+        cluster_lat,
+        np.concatenate(areas),
+    )
+
+
+def _coarsen_face_values(
+    values, face_order, level_offsets, cluster_area, factor=LOD_FACTOR
+):
+    """Aggregates a face-centered data variable to each cluster of every
+    level of a level-of-detail pyramid as the area-weighted mean of the faces
+    that it contains, ignoring missing (NaN) values.
+
+    Returns
+    -------
+    cluster_values : np.ndarray
+        Value of each cluster of every level, NaN for clusters without any valid face
+    """
+    n_levels = level_offsets.size - 1
+
+    values = np.asarray(values, dtype=np.float64)[face_order]
+    valid = np.isfinite(values)
+    weights = np.where(valid, cluster_area[: level_offsets[1]], 0.0)
+    weighted_sum = np.where(valid, values, 0.0) * weights
+
+    sums = [weighted_sum]
+    total_weights = [weights]
+    for _ in range(1, n_levels):
+        starts = np.arange(0, weighted_sum.size, factor)
+        weighted_sum = np.add.reduceat(weighted_sum, starts)
+        weights = np.add.reduceat(weights, starts)
+        sums.append(weighted_sum)
+        total_weights.append(weights)
+
+    weighted_sum = np.concatenate(sums)
+    weights = np.concatenate(total_weights)
+
+    cluster_values = np.full(weights.size, np.nan)
+    np.divide(weighted_sum, weights, out=cluster_values, where=weights > 0)
+
+    return cluster_values
+
+
+def _select_lod_level(
+    level_offsets, cluster_lon, cluster_lat, x_range, y_range, max_clusters
+):
+    """Selects the finest level of detail with at most ``max_clusters``
+    clusters inside a viewport, starting from the coarsest level so that only
+    the levels up to the selected one are visited.
+
+    Returns
+    -------
+    level : int
+        Selected level, where ``0`` is the level of the individual faces
+    visible : np.ndarray
+        Indices of the clusters of every level inside the viewport, in the cluster arrays
+    """
+    n_levels = level_offsets.size - 1
+
+    level = n_levels - 1
+    visible = _visible_clusters(
+        level_offsets, cluster_lon, cluster_lat, level, x_range, y_range
+    )
+    while level > 0:
+        finer_visible = _visible_clusters(
+            level_offsets, cluster_lon, cluster_lat, level - 1, x_range, y_range
+        )
+        if finer_visible.size > max_clusters:
+            break
+        level, visible = level - 1, finer_visible
+
+    return level, visible
+
+
+def _visible_clusters(level_offsets, cluster_lon, cluster_lat, level, x_range, y_range):
+    """Indices of the clusters of a level with their centroid inside a
+    viewport."""
+    start, stop = level_offsets[level], level_offsets[level + 1]
+    lon = cluster_lon[start:stop]
+    lat = cluster_lat[start:stop]
+
+    inside = (
+        (lon >= x_range[0])
+        & (lon <= x_range[1])
+        & (lat >= y_range[0])
+        & (lat <= y_range[1])
+    )
+    return start + np.flatnonzero(inside)
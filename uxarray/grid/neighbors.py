@@ -5,9 +5,6 @@ import xarray as xr
 
 from numba import njit
 
-from sklearn.neighbors import BallTree as SKBallTree
-from sklearn.neighbors import KDTree as SKKDTree
-
 from typing import Optional, Union
 
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
@@ -81,6 +78,8 @@ class KDTree:
         """Internal``sklearn.neighbors.KDTree`` constructed from corner
         nodes."""
 
+        from sklearn.neighbors import KDTree as SKKDTree
+
         if self._tree_from_nodes is None or self.reconstruct:
             # Sets which values to use for the tree based on the coordinate_system
             if self.coordinate_system == "cartesian":
@@ -115,6 +114,8 @@ class KDTree:
         """Internal``sklearn.neighbors.KDTree`` constructed from face
         centers."""
 
+        from sklearn.neighbors import KDTree as SKKDTree
+
         if self._tree_from_face_centers is None or self.reconstruct:
             # Sets which values to use for the tree based on the coordinate_system
             if self.coordinate_system == "cartesian":
@@ -148,6 +149,9 @@ class KDTree:
     def _build_from_edge_centers(self):
         """Internal``sklearn.neighbors.KDTree`` constructed from edge
         centers."""
+
+        from sklearn.neighbors import KDTree as SKKDTree
+
         if self._tree_from_edge_centers is None or self.reconstruct:
             # Sets which values to use for the tree based on the coordinate_system
             if self.coordinate_system == "cartesian":
@@ -469,6 +473,8 @@ class BallTree:
         """Internal``sklearn.neighbors.BallTree`` constructed from face
         centers."""
 
+        from sklearn.neighbors import BallTree as SKBallTree
+
         if self._tree_from_face_centers is None or self.reconstruct:
             # Sets which values to use for the tree based on the coordinate_system
             if self.coordinate_system == "spherical":
@@ -504,6 +510,8 @@ class BallTree:
         """Internal``sklearn.neighbors.BallTree`` constructed from corner
         nodes."""
 
+        from sklearn.neighbors import BallTree as SKBallTree
+
         if self._tree_from_nodes is None or self.reconstruct:
             # Sets which values to use for the tree based on the coordinate_system
             if self.coordinate_system == "spherical":
@@ -530,6 +538,9 @@ class BallTree:
     def _build_from_edge_centers(self):
         """Internal``sklearn.neighbors.BallTree`` constructed from edge
         centers."""
+
+        from sklearn.neighbors import BallTree as SKBallTree
+
         if self._tree_from_edge_centers is None or self.reconstruct:
             # Sets which values to use for the tree based on the coordinate_system
             if self.coordinate_system == "spherical":
@@ -0,0 +1,185 @@
+import numpy as np
+
+from scipy import sparse
+
+from uxarray.constants import INT_FILL_VALUE, INT_DTYPE
+from uxarray.grid.reordering import _sfc_order
+from uxarray.grid.slice import _slice_face_indices
+
+
+def _partition_faces(grid, n_partitions, method="hilbert"):
+    """Assigns each face of a grid to one of ``n_partitions`` compact
+    partitions by splitting the faces, ordered along a space-filling curve
+    through their Cartesian centroids, into contiguous chunks of (almost)
+    equal size.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    n_partitions : int
+        Number of partitions
+    method : str, default="hilbert"
+        Space-filling curve to order the faces with, either "hilbert" or "morton"
+
+    Returns
+    -------
+    face_partition : np.ndarray
+        Partition that owns each face, shape ``(n_face, )``
+    """
+    if n_partitions < 1 or n_partitions > grid.n_face:
+        raise ValueError(
+            f"Invalid number of partitions: {n_partitions}. Expected a value between 1 and {grid.n_face}"
+        )
+
+    face_xyz = np.column_stack(
+        [grid.face_x.values, grid.face_y.values, grid.face_z.values]
+    ).astype(np.float64)
+
+    face_order = _sfc_order(face_xyz, method)
+
+    face_partition = np.empty(grid.n_face, dtype=INT_DTYPE)
+    for partition_idx, faces in enumerate(np.array_split(face_order, n_partitions)):
+        face_partition[faces] = partition_idx
+
+    return face_partition
+
+
+def _face_adjacency(grid):
+    """Constructs the symmetric adjacency matrix of the faces of a grid, with
+    two faces adjacent if they share an edge.
+
+    The ``edge_face_connectivity`` is used instead of the ``face_face_connectivity``, since the latter may not be
+    constructed for every grid.
+
+    Returns
+    -------
+    adjacency : scipy.sparse.csr_matrix
+        Sparse boolean matrix of shape ``(n_face, n_face)``
+    """
+    edge_faces = grid.edge_face_connectivity.values
+    # either face of an edge may be a fill value in connectivity read from a source file
+    saddle_mask = np.all(edge_faces != INT_FILL_VALUE, axis=1)
+
+    first_faces = edge_faces[saddle_mask, 0]
+    second_faces = edge_faces[saddle_mask, 1]
+
+    adjacency = sparse.coo_matrix(
+        (
+            np.ones(2 * first_faces.size, dtype=np.bool_),
+            (
+                np.concatenate([first_faces, second_faces]),
+                np.concatenate([second_faces, first_faces]),
+            ),
+        ),
+        shape=(grid.n_face, grid.n_face),
+    )
+
+    return adjacency.tocsr()
+
+
+def _partition_grid(grid, n_partitions, halo_width=1, method="hilbert"):
+    """Decomposes a grid into ``n_partitions`` balanced subgrids, each made
+    up of the faces owned by a partition followed by ``halo_width`` layers of
+    halo (ghost) faces that share an edge with them.
+
+    Each node and edge of the source grid is owned by exactly one partition, so that values computed on the owned
+    elements of every partition can be scattered back to the source grid using the local-to-global index maps.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    n_partitions : int
+        Number of partitions
+    halo_width : int, default=1
+        Number of layers of halo faces around the owned faces of each partition
+    method : str, default="hilbert"
+        Space-filling curve used to assign faces to partitions, either "hilbert" or "morton"
+
+    Returns
+    -------
+    partitions : list of dict
+        Dictionary for each partition with the following entries
+
+        - ``"grid"``: subgrid containing the owned and halo faces of the partition
+        - ``"face_indices"``, ``"edge_indices"``, ``"node_indices"``: index of each face, edge and node of the
+          subgrid in the source grid
+        - ``"owned_faces"``, ``"owned_edges"``, ``"owned_nodes"``: local indices of the faces, edges and nodes of
+          the subgrid owned by the partition
+        - ``"halo_faces"``: local indices of the halo faces of the subgrid
+    """
+    if halo_width < 0:
+        raise ValueError(
+            f"Invalid halo width: {halo_width}. Expected a non-negative integer"
+        )
+
+    face_partition = _partition_faces(grid, n_partitions, method)
+
+    # partitions that each face belongs to, either as an owned or as a halo face
+    membership = sparse.csr_matrix(
+        (
+            np.ones(grid.n_face, dtype=np.bool_),
+            (np.arange(grid.n_face), face_partition),
+        ),
+        shape=(grid.n_face, n_partitions),
+    )
+    if halo_width > 0:
+        adjacency = _face_adjacency(grid)
+        for _ in range(halo_width):
+            membership = membership + adjacency @ membership
+    membership = membership.tocsc()
+
+    # each edge is owned by the partition that owns its first face, which may follow a fill value in connectivity
+    # read from a source file (i.e. MPAS ``cellsOnEdge`` of limited-area meshes)
+    edge_faces = grid.edge_face_connectivity.values
+    first_edge_faces = np.where(
+        edge_faces[:, 0] != INT_FILL_VALUE, edge_faces[:, 0], edge_faces[:, 1]
+    )
+    edge_partition = face_partition[first_edge_faces]
+
+    # each node is owned by the lowest partition that owns one of its faces
+    face_nodes = grid.face_node_connectivity.values
+    valid = face_nodes != INT_FILL_VALUE
+    node_partition = np.full(grid.n_node, n_partitions, dtype=INT_DTYPE)
+    np.minimum.at(
+        node_partition,
+        face_nodes[valid],
+        np.broadcast_to(face_partition[:, None], face_nodes.shape)[valid],
+    )
+
+    partitions = []
+    for partition_idx in range(n_partitions):
+        owned_faces = np.flatnonzero(face_partition == partition_idx)
+        member_faces = membership.indices[
+            membership.indptr[partition_idx] : membership.indptr[partition_idx + 1]
+        ]
+        halo_faces = np.setdiff1d(member_faces, owned_faces)
+
+        # owned faces are placed first, so that their local indices are contiguous
+        subgrid = _slice_face_indices(grid, np.concatenate([owned_faces, halo_faces]))
+
+        face_indices = subgrid._ds["subgrid_face_indices"].values
+        edge_indices = subgrid._ds["subgrid_edge_indices"].values
+        node_indices = subgrid._ds["subgrid_node_indices"].values
+
+        partitions.append(
+            {
+                "grid": subgrid,
+                "face_indices": face_indices,
+                "edge_indices": edge_indices,
+                "node_indices": node_indices,
+                "owned_faces": np.arange(owned_faces.size, dtype=INT_DTYPE),
+                "halo_faces": np.arange(
+                    owned_faces.size, face_indices.size, dtype=INT_DTYPE
+                ),
+                "owned_edges": np.flatnonzero(
+                    edge_partition[edge_indices] == partition_idx
+                ),
+                "owned_nodes": np.flatnonzero(
+                    node_partition[node_indices] == partition_idx
+                ),
+            }
+        )
+
+    return partitions
@@ -0,0 +1,214 @@
+import numpy as np
+import xarray as xr
+
+from numba import njit
+
+from uxarray.constants import INT_FILL_VALUE, INT_DTYPE, ENABLE_JIT_CACHE
+from uxarray.conventions import ugrid
+
+# number of bits used to quantize each coordinate, with three coordinates fitting in a signed 64-bit key
+SFC_BITS = 21
+
+
+def _get_reordering_indices(grid, method="hilbert"):
+    """Computes the permutation of each grid dimension (``n_node``,
+    ``n_edge`` and ``n_face``) that sorts its elements along a space-filling
+    curve through the Cartesian coordinates of their centroids.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    method : str, default="hilbert"
+        Space-filling curve to order the elements with, either "hilbert" or "morton"
+
+    Returns
+    -------
+    indices : dict
+        Permutation of each grid dimension stored in the grid, where the element at position ``i`` of the reordered
+        grid is the element ``indices[dim][i]`` of the source grid
+    """
+    # construct deferred variables, so that the permutations cover every variable of the reordered grid
+    grid._parse_deferred()
+
+    node_xyz = np.column_stack(
+        [grid.node_x.values, grid.node_y.values, grid.node_z.values]
+    ).astype(np.float64)
+
+    indices = {}
+
+    # nodes ordered by their own coordinates
+    indices[ugrid.NODE_DIM] = _sfc_order(node_xyz, method)
+
+    # faces ordered by the cartesian average of their nodes
+    face_nodes = grid.face_node_connectivity.values
+    valid = face_nodes != INT_FILL_VALUE
+    face_xyz = (
+        np.where(valid[..., None], node_xyz[np.where(valid, face_nodes, 0)], 0.0).sum(
+            axis=1
+        )
+        / valid.sum(axis=1)[:, None]
+    )
+    indices[ugrid.FACE_DIM] = _sfc_order(face_xyz, method)
+
+    if "edge_node_connectivity" in grid._ds:
+        # edges ordered by their midpoints
+        edge_xyz = node_xyz[grid.edge_node_connectivity.values].mean(axis=1)
+        indices[ugrid.EDGE_DIM] = _sfc_order(edge_xyz, method)
+
+    return indices
+
+
+def _reorder_grid(grid, indices):
+    """Permutes the nodes, edges and faces of a grid, updating every
+    connectivity variable to point to the new index of each element.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Source grid
+    indices : dict
+        Permutation of each grid dimension, as returned by ``_get_reordering_indices``
+
+    Returns
+    -------
+    reordered_grid : uxarray.Grid
+        Grid with its elements reordered
+    """
+    from uxarray.grid import Grid
+
+    # construct deferred variables and face edges now, so that they are reordered consistently
+    # with the edges instead of reconstructed afterwards
+    grid._parse_deferred()
+    if "edge_node_connectivity" in grid._ds:
+        grid.face_edge_connectivity
+
+    ds = grid._ds.isel(
+        {dim: idx for dim, idx in indices.items() if dim in grid._ds.dims}
+    )
+
+    # new index of each element of the source grid
+    new_indices = {}
+    for dim, idx in indices.items():
+        new_indices[dim] = np.empty(idx.size, dtype=INT_DTYPE)
+        new_indices[dim][idx] = np.arange(idx.size, dtype=INT_DTYPE)
+
+    for conn_name in ugrid.CONNECTIVITY_NAMES:
+        if conn_name not in ds:
+            continue
+
+        # element type that the connectivity indexes into (i.e. "node" for "face_node_connectivity")
+        target_dim = f"n_{conn_name.split('_')[1]}"
+        if target_dim not in new_indices:
+            continue
+
+        conn = ds[conn_name].values
+        valid = conn != INT_FILL_VALUE
+
+        reordered_conn = np.full(conn.shape, INT_FILL_VALUE, dtype=INT_DTYPE)
+        reordered_conn[valid] = new_indices[target_dim][conn[valid]]
+
+        # drop cached arrays (i.e. inverse_indices), which refer to the source ordering
+        attrs = {
+            key: value
+            for key, value in ds[conn_name].attrs.items()
+            if not isinstance(value, np.ndarray)
+        }
+
+        ds[conn_name] = xr.DataArray(
+            reordered_conn, dims=ds[conn_name].dims, attrs=attrs
+        )
+
+    return Grid.from_dataset(ds, source_grid_spec=grid.source_grid_spec)
+
+
+def _sfc_order(xyz, method="hilbert"):
+    """Returns the indices that sort a set of Cartesian coordinates along a
+    space-filling curve, with ties broken by their original order."""
+    return np.argsort(_sfc_keys(xyz, method), kind="stable").astype(INT_DTYPE)
+
+
+def _sfc_keys(xyz, method="hilbert"):
+    """Computes the position of each point along a space-filling curve
+    ("hilbert" or "morton") through the bounding box of the points, quantized
+    to ``SFC_BITS`` bits per coordinate.
+
+    Parameters
+    ----------
+    xyz : np.ndarray
+        Cartesian coordinates of each point, shape ``(n, 3)``
+    method : str, default="hilbert"
+        Space-filling curve, either "hilbert" or "morton"
+
+    Returns
+    -------
+    keys : np.ndarray
+        Key of each point along the curve, shape ``(n, )``
+    """
+    if method not in ("hilbert", "morton"):
+        raise ValueError(
+            f"Invalid reordering method: {method}. Expected one of 'hilbert' or 'morton'"
+        )
+
+    xyz = np.asarray(xyz, dtype=np.float64)
+    if xyz.shape[0] == 0:
+        return np.empty(0, dtype=np.int64)
+
+    lower = xyz.min(axis=0)
+    extent = xyz.max(axis=0) - lower
+    extent[extent == 0] = 1.0
+
+    max_cell = (1 << SFC_BITS) - 1
+    cells = np.clip(np.floor((xyz - lower) / extent * max_cell), 0, max_cell).astype(
+        np.int64
+    )
+
+    return _sfc_keys_from_cells(cells, method == "hilbert", SFC_BITS)
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _sfc_keys_from_cells(cells, hilbert, bits):
+    """Interleaves the bits of the quantized coordinates of each point into
+    a single key, after transforming them to the transposed Hilbert index
+    (Skilling, 2004) if ``hilbert`` is true."""
+    n_points, n_dims = cells.shape
+    keys = np.empty(n_points, dtype=np.int64)
+
+    x = np.empty(n_dims, dtype=np.int64)
+    for point_idx in range(n_points):
+        for d in range(n_dims):
+            x[d] = cells[point_idx, d]
+
+        if hilbert:
+            # inverse undo of the excess work
+            q = np.int64(1) << (bits - 1)
+            while q > 1:
+                p = q - 1
+                for d in range(n_dims):
+                    if x[d] & q:
+                        x[0] ^= p
+                    else:
+                        t = (x[0] ^ x[d]) & p
+                        x[0] ^= t
+                        x[d] ^= t
+                q >>= 1
+
+            # gray encode
+            for d in range(1, n_dims):
+                x[d] ^= x[d - 1]
+            t = np.int64(0)
+            q = np.int64(1) << (bits - 1)
+            while q > 1:
+                if x[n_dims - 1] & q:
+                    t ^= q - 1
+                q >>= 1
+            for d in range(n_dims):
+                x[d] ^= t
+
+        key = np.int64(0)
+        for b in range(bits - 1, -1, -1):
+            for d in range(n_dims):
+                key = (key << 1) | ((x[d] >> b) & 1)
+        keys[point_idx] = key
+
+    return keys
@@ -10,6 +10,14 @@ if TYPE_CHECKING:
     pass
 
 
+# connectivity variables whose entries do not depend on their position in each row
+UNORDERED_CONNECTIVITY_NAMES = [
+    "edge_face_connectivity",
+    "node_edge_connectivity",
+    "node_face_connectivity",
+]
+
+
 def _slice_node_indices(grid, indices, inclusive=True):
     """Slices (indexes) an unstructured grid given a list/array of node
     indices, returning a new Grid composed of elements that contain the nodes
@@ -83,6 +91,10 @@ def _slice_face_indices(grid, indices, inclusive=True):
 
     from uxarray.grid import Grid
 
+    # variables deferred by a lazy read would otherwise be reconstructed for the subgrid in a different order than
+    # the connectivity that is kept (i.e. the edges of a sliced ``face_edge_connectivity``)
+    grid._parse_deferred()
+
     ds = grid._ds
 
     indices = np.asarray(indices, dtype=INT_DTYPE)
@@ -109,26 +121,44 @@ def _slice_face_indices(grid, indices, inclusive=True):
     ds["subgrid_face_indices"] = xr.DataArray(face_indices, dims=["n_face"])
     ds["subgrid_edge_indices"] = xr.DataArray(edge_indices, dims=["n_edge"])
 
-    # mapping to update existing connectivity
-    node_indices_dict = {
-        key: val for key, val in zip(node_indices, np.arange(0, len(node_indices)))
-    }
-    node_indices_dict[INT_FILL_VALUE] = INT_FILL_VALUE
+    # new index of each element of the source grid, with elements outside the subgrid mapped to fill values
+    new_indices = {}
+    for dim, dim_indices in [
+        ("n_node", node_indices),
+        ("n_edge", edge_indices),
+        ("n_face", face_indices),
+    ]:
+        if dim not in grid._ds.dims:
+            continue
+        new_indices[dim] = np.full(grid._ds.sizes[dim], INT_FILL_VALUE, dtype=INT_DTYPE)
+        new_indices[dim][dim_indices] = np.arange(dim_indices.size, dtype=INT_DTYPE)
 
     for conn_name in grid._ds.data_vars:
-        # update or drop connectivity variables to correctly point to the new index of each element
-
-        if "_node_connectivity" in conn_name:
-            # update connectivity vars that index into nodes
-            ds[conn_name] = xr.DataArray(
-                np.vectorize(node_indices_dict.__getitem__, otypes=[INT_DTYPE])(
-                    ds[conn_name].values
-                ),
-                dims=ds[conn_name].dims,
-            )
+        # update connectivity vars to correctly point to the new index of each element
+        if "_connectivity" not in conn_name:
+            continue
 
-        elif "_connectivity" in conn_name:
+        # element type that the connectivity indexes into (i.e. "node" for "face_node_connectivity")
+        target_dim = f"n_{conn_name.split('_')[1]}"
+        if target_dim not in new_indices:
             # drop any conn that would require re-computation
             ds = ds.drop_vars(conn_name)
+            continue
+
+        conn = ds[conn_name].values
+        valid = conn != INT_FILL_VALUE
+
+        sliced_conn = np.full(conn.shape, INT_FILL_VALUE, dtype=INT_DTYPE)
+        sliced_conn[valid] = new_indices[target_dim][conn[valid]]
+
+        if conn_name in UNORDERED_CONNECTIVITY_NAMES:
+            # elements outside the subgrid are removed, keeping the remaining ones first
+            sliced_conn = np.take_along_axis(
+                sliced_conn,
+                np.argsort(sliced_conn == INT_FILL_VALUE, axis=1, kind="stable"),
+                axis=1,
+            )
+
+        ds[conn_name] = xr.DataArray(sliced_conn, dims=ds[conn_name].dims)
 
     return Grid.from_dataset(ds, source_grid_spec=grid.source_grid_spec)
@@ -1,8 +1,13 @@
+import hashlib
+
 import numpy as np
-from uxarray.constants import ERROR_TOLERANCE, INT_FILL_VALUE
+from uxarray.constants import ERROR_TOLERANCE, INT_FILL_VALUE, ENABLE_JIT_CACHE
+import itertools
 import warnings
 import uxarray.utils.computing as ac_utils
 
+from numba import njit
+
 
 def _replace_fill_values(grid_var, original_fill, new_fill, new_dtype=None):
     """Replaces all instances of the current fill value (``original_fill``) in
@@ -309,3 +314,209 @@ def _get_lonlat_rad_face_edge_nodes(
     )
 
     return lonlat_coordinates
+
+
+def _deduplicate_nodes(coords, tolerance=None, fill_value=INT_FILL_VALUE):
+    """Identifies the unique nodes in a set of coordinates, merging any nodes
+    that are within ``tolerance`` of each other in every coordinate.
+
+    Uses a hash table keyed on the (quantized) coordinates of each node, which
+    runs in linear time and only allocates a few integer arrays proportional
+    to the number of nodes, unlike ``np.unique(axis=0)``, which sorts all the
+    rows. Only the unique nodes are sorted, in the same order as ``np.unique``.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        Coordinates of each node with shape ``(n, k)``
+    tolerance : float, optional
+        Maximum difference in each coordinate for two nodes to be merged, with
+        only exactly matching nodes merged if not provided
+    fill_value : constant, optional
+        Coordinate value used to pad missing nodes, which are mapped to
+        ``INT_FILL_VALUE``
+
+    Returns
+    -------
+    unique_coords : np.ndarray
+        Coordinates of each unique node with shape ``(n_unique, k)``
+    inverse_indices : np.ndarray
+        Index of the unique node that each input node is mapped to
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    n_dims = coords.shape[1]
+
+    if fill_value is not None:
+        valid = ~np.any(coords == fill_value, axis=1)
+    else:
+        valid = np.ones(coords.shape[0], dtype=np.bool_)
+
+    if tolerance:
+        # key each node by the cell of side length `tolerance` that it resides in, nodes within
+        # tolerance can only reside in the same or an adjacent cell
+        keys = np.floor(np.where(valid[:, None], coords, 0.0) / tolerance).astype(
+            np.int64
+        )
+        probe_offsets = np.array(
+            list(itertools.product([0, -1, 1], repeat=n_dims)), dtype=np.int64
+        )
+    else:
+        tolerance = 0.0
+        # key each node by the bits of its coordinates, normalizing -0.0 to 0.0
+        keys = (coords + 0.0).view(np.int64)
+        probe_offsets = np.zeros((1, n_dims), dtype=np.int64)
+
+    unique_indices, inverse_indices = _hash_unique_nodes(
+        keys, coords, valid, tolerance, probe_offsets
+    )
+    unique_coords = coords[unique_indices]
+
+    # sort only the unique nodes (lexicographically, as ``np.unique``) and remap the inverse indices
+    order = np.lexsort(unique_coords.T[::-1])
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    inverse_indices[valid] = rank[inverse_indices[valid]]
+
+    return unique_coords[order], inverse_indices
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _hash_cell(cell):
+    """Hashes the integer key of a cell."""
+    h = np.int64(-3750763034362895579)
+    for i in range(cell.shape[0]):
+        h = (h ^ cell[i]) * np.int64(1099511628211)
+    return h ^ (h >> np.int64(29))
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _hash_unique_nodes(keys, coords, valid, tolerance, probe_offsets):
+    """Helper for (``_deduplicate_nodes``), assigning each node to the first
+    previously found unique node within ``tolerance`` in one of the cells
+    given by ``probe_offsets``, or storing it as a new unique node."""
+    n_nodes, n_dims = keys.shape
+
+    # open addressing table, at most half full, mapping a cell to the first unique node in it
+    capacity = 1
+    while capacity < 2 * n_nodes:
+        capacity *= 2
+    mask = capacity - 1
+    table = np.full(capacity, -1, dtype=np.int64)
+
+    # rounding can place nodes that are further apart than tolerance in the same cell, so the unique nodes of
+    # each cell are chained in the order that they are found
+    next_in_cell = np.full(n_nodes, -1, dtype=np.int64)
+
+    unique_indices = np.empty(n_nodes, dtype=np.int64)
+    inverse_indices = np.full(n_nodes, INT_FILL_VALUE, dtype=np.int64)
+    n_unique = 0
+
+    cell = np.empty(n_dims, dtype=np.int64)
+
+    for node_idx in range(n_nodes):
+        if not valid[node_idx]:
+            continue
+
+        match = -1
+        own_slot = -1
+
+        for offset_idx in range(probe_offsets.shape[0]):
+            for d in range(n_dims):
+                cell[d] = keys[node_idx, d] + probe_offsets[offset_idx, d]
+
+            # locate the slot of this cell in the table
+            slot = _hash_cell(cell) & mask
+            while table[slot] != -1:
+                candidate = unique_indices[table[slot]]
+                same_cell = True
+                for d in range(n_dims):
+                    if keys[candidate, d] != cell[d]:
+                        same_cell = False
+                        break
+                if same_cell:
+                    break
+                slot = (slot + 1) & mask
+
+            if offset_idx == 0:
+                # the slot of the cell of this node, in case no match is found
+                own_slot = slot
+
+            unique_idx = table[slot]
+            while unique_idx != -1:
+                candidate = unique_indices[unique_idx]
+                within_tolerance = True
+                for d in range(n_dims):
+                    if abs(coords[candidate, d] - coords[node_idx, d]) > tolerance:
+                        within_tolerance = False
+                        break
+                if within_tolerance:
+                    match = unique_idx
+                    break
+                unique_idx = next_in_cell[unique_idx]
+
+            if match != -1:
+                break
+
+        if match == -1:
+            # append the node to the chain of its cell, or start the chain if the cell is empty
+            if table[own_slot] == -1:
+                table[own_slot] = n_unique
+            else:
+                last_idx = table[own_slot]
+                while next_in_cell[last_idx] != -1:
+                    last_idx = next_in_cell[last_idx]
+                next_in_cell[last_idx] = n_unique
+            unique_indices[n_unique] = node_idx
+            match = n_unique
+            n_unique += 1
+
+        inverse_indices[node_idx] = match
+
+    return unique_indices[:n_unique], inverse_indices
+
+
+def _grid_fingerprint(ds, source_grid_spec=None, var_names=None):
+    """Computes a content hash of the coordinates and topology of a grid,
+    which is equal for two grids only if they have the same source grid
+    specification and the same connectivity and coordinate variables, each
+    with the same dimensions, dtype and values.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        Internal grid dataset (``Grid._ds``)
+    source_grid_spec : str, optional
+        Original unstructured grid format (i.e. UGRID, MPAS, etc.)
+    var_names : iterable of str, optional
+        Names of the variables that may be hashed, all variables of ``ds`` if not provided
+
+    Returns
+    -------
+    fingerprint : str
+        Hexadecimal digest of the grid
+    """
+    from uxarray.conventions.ugrid import (
+        CARTESIAN_COORD_NAMES,
+        CONNECTIVITY_NAMES,
+        SPHERICAL_COORD_NAMES,
+    )
+
+    digest = hashlib.blake2b(str(source_grid_spec).encode(), digest_size=16)
+
+    topology_names = set(
+        CONNECTIVITY_NAMES + SPHERICAL_COORD_NAMES + CARTESIAN_COORD_NAMES
+    )
+    topology_names.add("n_nodes_per_face")
+
+    if var_names is not None:
+        topology_names.intersection_update(var_names)
+
+    for var_name in sorted(topology_names.intersection(ds.variables)):
+        var = ds[var_name]
+        values = np.ascontiguousarray(var.values)
+        digest.update(
+            f"{var_name}{tuple(var.sizes.items())}{values.dtype.str}".encode()
+        )
+        digest.update(values)
+
+    return digest.hexdigest()
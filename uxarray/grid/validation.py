@@ -1,67 +1,186 @@
 import numpy as np
-from warnings import warn
 
-from uxarray.constants import ERROR_TOLERANCE
+from numba import njit, prange
 
+from uxarray.constants import ERROR_TOLERANCE, ENABLE_JIT_CACHE, INT_DTYPE
+from uxarray.grid.utils import _deduplicate_nodes
 
-# validation helper functions
-def _check_connectivity(self):
-    """Check if all nodes are referenced by at least one element.
 
-    If not, the mesh may have hanging nodes and may not a valid UGRID
-    mesh
+def _validation_report(grid, tolerance=ERROR_TOLERANCE):
+    """Runs all validation checks on a grid, returning the offending
+    elements of each check instead of only whether it passed.
+
+    Parameters
+    ----------
+    grid : uxarray.Grid
+        Grid to validate
+    tolerance : float, default=ERROR_TOLERANCE
+        Maximum difference in each Cartesian coordinate for two nodes to be considered duplicates
+
+    Returns
+    -------
+    report : dict
+        Dictionary with the following entries
+
+        - ``"valid"``: whether all checks passed
+        - ``"duplicate_nodes"``: indices of nodes that duplicate a node with a lower index
+        - ``"dangling_nodes"``: indices of nodes that are not referenced by any face
+        - ``"non_manifold_edges"``: node pairs of edges shared by more than two faces, shape ``(n, 2)``
+        - ``"inconsistent_edges"``: node pairs of edges that are traversed in the same direction by two faces,
+          shape ``(n, 2)``
+        - ``"degenerate_faces"``: indices of faces with an area close to zero
+    """
+    non_manifold_edges, inconsistent_edges = _find_invalid_edges(grid)
+
+    report = {
+        "duplicate_nodes": _find_duplicate_nodes(grid, tolerance),
+        "dangling_nodes": _find_dangling_nodes(grid),
+        "non_manifold_edges": non_manifold_edges,
+        "inconsistent_edges": inconsistent_edges,
+        "degenerate_faces": _find_degenerate_faces(grid),
+    }
+    report["valid"] = all(value.shape[0] == 0 for value in report.values())
+
+    return report
+
+
+def _find_duplicate_nodes(grid, tolerance=ERROR_TOLERANCE):
+    """Finds the nodes that are within ``tolerance`` in each Cartesian
+    coordinate of a node with a lower index, using a hash table instead of
+    sorting the coordinates."""
+    coords = np.column_stack(
+        [grid.node_x.values, grid.node_y.values, grid.node_z.values]
+    )
+
+    _, inverse_indices = _deduplicate_nodes(coords, tolerance, fill_value=None)
+
+    if inverse_indices.size == 0:
+        # a grid without nodes has no duplicates
+        return np.array([], dtype=INT_DTYPE)
+
+    # the first node mapped to each unique node is the original
+    first_nodes = np.full(inverse_indices.max() + 1, grid.n_node, dtype=INT_DTYPE)
+    np.minimum.at(first_nodes, inverse_indices, np.arange(grid.n_node))
+
+    duplicate = np.ones(grid.n_node, dtype=np.bool_)
+    duplicate[first_nodes] = False
+
+    return np.flatnonzero(duplicate)
+
+
+def _find_dangling_nodes(grid):
+    """Finds the nodes that are not referenced by any face."""
+    face_nodes = grid.face_node_connectivity.values
+    node_counts = np.bincount(face_nodes[face_nodes >= 0], minlength=grid.n_node)
+
+    return np.flatnonzero(node_counts == 0)
+
+
+def _find_invalid_edges(grid):
+    """Finds the edges shared by more than two faces (non-manifold edges) and
+    the edges traversed in the same direction by two faces (inconsistently
+    oriented neighbors) by sorting the directed edges of every face.
+
+    Returns
+    -------
+    non_manifold_edges : np.ndarray
+        Sorted node pairs of each non-manifold edge, shape ``(n, 2)``
+    inconsistent_edges : np.ndarray
+        Node pairs of each directed edge found more than once, shape ``(n, 2)``
     """
+    face_nodes = grid.face_node_connectivity.values
+    n_nodes_per_face = grid.n_nodes_per_face.values
+
+    # directed edges of each face, from each node to the next one
+    valid = np.arange(face_nodes.shape[1]) < n_nodes_per_face[:, None]
+    next_index = (
+        np.arange(1, face_nodes.shape[1] + 1)[None, :] % n_nodes_per_face[:, None]
+    )
+    start_nodes = face_nodes[valid]
+    end_nodes = np.take_along_axis(face_nodes, next_index, axis=1)[valid]
+
+    # edges repeated within a single face (i.e. collapsed nodes) are not shared
+    keep = start_nodes != end_nodes
+    start_nodes, end_nodes = start_nodes[keep], end_nodes[keep]
+
+    # encode each node pair as a single integer to sort them as scalars
+    n_node = np.int64(grid.n_node)
+    start_nodes = start_nodes.astype(np.int64)
+    end_nodes = end_nodes.astype(np.int64)
+
+    edge_keys, edge_counts = np.unique(
+        np.minimum(start_nodes, end_nodes) * n_node
+        + np.maximum(start_nodes, end_nodes),
+        return_counts=True,
+    )
+    non_manifold_keys = edge_keys[edge_counts > 2]
+
+    directed_keys, directed_counts = np.unique(
+        start_nodes * n_node + end_nodes, return_counts=True
+    )
+    inconsistent_keys = directed_keys[directed_counts > 1]
+
+    non_manifold_edges = np.stack(
+        [non_manifold_keys // n_node, non_manifold_keys % n_node], axis=-1
+    ).astype(INT_DTYPE)
+    inconsistent_edges = np.stack(
+        [inconsistent_keys // n_node, inconsistent_keys % n_node], axis=-1
+    ).astype(INT_DTYPE)
+
+    return non_manifold_edges, inconsistent_edges
+
+
+def _find_degenerate_faces(grid):
+    """Finds the faces with an area close to zero, using the exact area of
+    each face as a spherical polygon."""
+    face_areas = _spherical_polygon_areas(
+        grid.node_x.values.astype(np.float64),
+        grid.node_y.values.astype(np.float64),
+        grid.node_z.values.astype(np.float64),
+        grid.face_node_connectivity.values,
+        grid.n_nodes_per_face.values,
+    )
+
+    return np.flatnonzero(np.isclose(face_areas, 0, atol=ERROR_TOLERANCE))
+
+
+@njit(cache=ENABLE_JIT_CACHE, parallel=True)
+def _spherical_polygon_areas(node_x, node_y, node_z, face_nodes, n_nodes_per_face):
+    """Area of each face on the unit sphere, with edges as great circle arcs,
+    computed in parallel as the sum of the signed areas of a fan of spherical
+    triangles (Van Oosterom and Strackee) from the first node of each
+    face."""
+    n_face = face_nodes.shape[0]
+    face_areas = np.zeros(n_face, dtype=np.float64)
+
+    for face_idx in prange(n_face):
+        n_nodes = n_nodes_per_face[face_idx]
+
+        first = face_nodes[face_idx, 0]
+        ax, ay, az = node_x[first], node_y[first], node_z[first]
+        a_norm = np.sqrt(ax**2 + ay**2 + az**2)
+        ax, ay, az = ax / a_norm, ay / a_norm, az / a_norm
+
+        area = 0.0
+        for i in range(1, n_nodes - 1):
+            b = face_nodes[face_idx, i]
+            c = face_nodes[face_idx, i + 1]
+
+            bx, by, bz = node_x[b], node_y[b], node_z[b]
+            b_norm = np.sqrt(bx**2 + by**2 + bz**2)
+            bx, by, bz = bx / b_norm, by / b_norm, bz / b_norm
+
+            cx, cy, cz = node_x[c], node_y[c], node_z[c]
+            c_norm = np.sqrt(cx**2 + cy**2 + cz**2)
+            cx, cy, cz = cx / c_norm, cy / c_norm, cz / c_norm
+
+            triple = ax * (by * cz - bz * cy) + ay * (bz * cx - bx * cz)
+            triple += az * (bx * cy - by * cx)
+            denom = 1.0 + ax * bx + ay * by + az * bz
+            denom += bx * cx + by * cy + bz * cz + cx * ax + cy * ay + cz * az
+
+            area += 2.0 * np.arctan2(triple, denom)
+
+        face_areas[face_idx] = abs(area)
 
-    # Check if all nodes are referenced by at least one element
-    # get unique nodes in connectivity
-    nodes_in_conn = np.unique(self.face_node_connectivity.values.flatten())
-    #  remove negative indices/fill values from the list
-    nodes_in_conn = nodes_in_conn[nodes_in_conn >= 0]
-
-    # check if the size of unique nodes in connectivity is equal to the number of nodes
-    if nodes_in_conn.size == self.n_node:
-        print("-All nodes are referenced by at least one element.")
-        return True
-    else:
-        warn(
-            "Some nodes may not be referenced by any element. {0} and {1}".format(
-                nodes_in_conn.size, self.n_node
-            ),
-            RuntimeWarning,
-        )
-        return False
-
-
-def _check_duplicate_nodes(self):
-    """Check if there are duplicate nodes in the mesh."""
-
-    coords1 = np.column_stack((np.vstack(self.node_lon), np.vstack(self.node_lat)))
-    unique_nodes, indices = np.unique(coords1, axis=0, return_index=True)
-    duplicate_indices = np.setdiff1d(np.arange(len(coords1)), indices)
-
-    if duplicate_indices.size > 0:
-        warn(
-            "Duplicate nodes found in the mesh. {0} nodes are duplicates.".format(
-                duplicate_indices.size
-            ),
-            RuntimeWarning,
-        )
-        return False
-    else:
-        print("-No duplicate nodes found in the mesh.")
-        return True
-
-
-def _check_area(self):
-    """Check if each face area is greater than our constant ERROR_TOLERANCE."""
-    areas = self.face_areas
-    # Check if area of any face is close to zero
-    if np.any(np.isclose(areas, 0, atol=ERROR_TOLERANCE)):
-        warn(
-            "At least one face area is close to zero. Mesh may contain inverted elements",
-            RuntimeWarning,
-        )
-        return False
-    else:
-        print("-No face area is close to zero.")
-        return True
+    return face_areas
@@ -1,3 +1,4 @@
+import numpy as np
 import xarray as xr
 
 
@@ -73,25 +74,37 @@ def _read_esmf(in_ds):
             "Reading in ESMF grids with Cartesian coordinates not yet supported"
         )
 
-    n_nodes_per_face = in_ds["numElementConn"].values.astype(INT_DTYPE)
+    n_nodes_per_face = in_ds["numElementConn"].values.astype(INT_DTYPE, copy=False)
     out_ds["n_nodes_per_face"] = xr.DataArray(
         data=n_nodes_per_face,
         dims=ugrid.N_NODES_PER_FACE_DIMS,
         attrs=ugrid.N_NODES_PER_FACE_ATTRS,
     )
 
-    if "start_index" in in_ds["elementConn"]:
+    if "start_index" in in_ds["elementConn"].attrs:
         start_index = in_ds["elementConn"].start_index
     else:
         # assume start index is 1 if one is not provided
         start_index = 1
 
-    face_node_connectivity = in_ds["elementConn"].values.astype(INT_DTYPE)
+    element_conn = in_ds["elementConn"].values
 
-    for i, max_nodes in enumerate(n_nodes_per_face):
-        # convert to zero index and standardize fill values
-        face_node_connectivity[i, 0:max_nodes] -= start_index
-        face_node_connectivity[i, max_nodes:] = INT_FILL_VALUE
+    # entries past the number of nodes of each element are padding
+    valid_nodes = (
+        np.arange(element_conn.shape[1], dtype=INT_DTYPE) < n_nodes_per_face[:, None]
+    )
+
+    # convert to zero index and standardize fill values in a single pass, without casting the padding (i.e. NaN)
+    face_node_connectivity = np.full(
+        element_conn.shape, INT_FILL_VALUE, dtype=INT_DTYPE
+    )
+    np.subtract(
+        element_conn,
+        start_index,
+        out=face_node_connectivity,
+        where=valid_nodes,
+        casting="unsafe",
+    )
 
     out_ds["face_node_connectivity"] = xr.DataArray(
         data=face_node_connectivity,
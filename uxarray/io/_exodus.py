@@ -3,7 +3,7 @@ import numpy as np
 from pathlib import PurePath
 from datetime import datetime
 
-from uxarray.grid.connectivity import _replace_fill_values
+from uxarray.grid.connectivity import _replace_fill_values, _build_n_nodes_per_face
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
 
 from uxarray.grid.coordinates import _lonlat_rad_to_xyz, _xyz_to_lonlat_deg
@@ -183,59 +183,33 @@ def _encode_exodus(ds, outfile=None):
     # Note: Don't get orig dimension from Mesh2 attribute topology dimension
     if "node_x" not in ds:
         x, y, z = _lonlat_rad_to_xyz(ds["node_lon"].values, ds["node_lat"].values)
-        c_data = xr.DataArray([x, y, z])
+        c_data = np.stack([x, y, z])
     else:
-        c_data = xr.DataArray(
-            [
-                ds["node_x"].data.tolist(),
-                ds["node_y"].data.tolist(),
-                ds["node_z"].data.tolist(),
-            ]
+        c_data = np.stack(
+            [ds["node_x"].values, ds["node_y"].values, ds["node_z"].values]
         )
 
     exo_ds["coord"] = xr.DataArray(data=c_data, dims=["num_dim", "num_nodes"])
 
-    # process face nodes, this array holds num faces at corresponding location
-    # eg num_el_all_blks = [0, 0, 6, 12] signifies 6 TRI and 12 SHELL elements
-    num_el_all_blks = np.zeros(ds["n_max_face_nodes"].size, "i8")
-    # this list stores connectivity without filling
-    conn_nofill = []
-
-    # store the number of faces in an array
-    for row in ds["face_node_connectivity"].astype(INT_DTYPE).data:
-        # find out -1 in each row, this indicates lower than max face nodes
-        arr = np.where(row == -1)
-        # arr[0].size returns the location of first -1 in the conn list
-        # if > 0, arr[0][0] is the num_nodes forming the face
-        if arr[0].size > 0:
-            # increment the number of faces at the corresponding location
-            num_el_all_blks[arr[0][0] - 1] += 1
-            # append without -1s eg. [1, 2, 3, -1] to [1, 2, 3]
-            # convert to list (for sorting later)
-            row = row[: (arr[0][0])].tolist()
-            list_node = list(map(int, row))
-            conn_nofill.append(list_node)
-        elif arr[0].size == 0:
-            # increment the number of faces for this "n_max_face_nodes" face
-            num_el_all_blks[ds["n_max_face_nodes"].size - 1] += 1
-            # get integer list nodes
-            list_node = list(map(int, row.tolist()))
-            conn_nofill.append(list_node)
-        else:
-            raise RuntimeError(
-                "num nodes in conn array is greater than n_max_face_nodes. Abort!"
-            )
-    # get number of blks found
-    num_blks = np.count_nonzero(num_el_all_blks)
+    # group faces into element blocks by their number of nodes, lower dim faces first
+    face_nodes = ds["face_node_connectivity"].values.astype(INT_DTYPE, copy=False)
+    n_face, n_max_face_nodes = face_nodes.shape
+
+    if "n_nodes_per_face" in ds:
+        n_nodes_per_face = ds["n_nodes_per_face"].values
+    else:
+        n_nodes_per_face = _build_n_nodes_per_face(face_nodes, n_face, n_max_face_nodes)
 
-    # sort connectivity by size, lower dim faces first
-    conn_nofill.sort(key=len)
+    # stable sort keeps the original order of faces within each block
+    sorted_face_indices = np.argsort(n_nodes_per_face, kind="stable")
+    blk_num_nodes, blk_starts, blk_num_faces = np.unique(
+        n_nodes_per_face[sorted_face_indices], return_index=True, return_counts=True
+    )
 
-    # get index of blocks found
-    nonzero_el_index_blks = np.nonzero(num_el_all_blks)
+    # get number of blks found
+    num_blks = blk_num_nodes.size
 
     # break face_node_connectivity into blks
-    start = 0
     for blk in range(num_blks):
         blkID = blk + 1
         str_el_in_blk = "num_el_in_blk" + str(blkID)
@@ -246,25 +220,25 @@ def _encode_exodus(ds, outfile=None):
         str_attrib = "attrib" + str(blkID)
         str_connect = "connect" + str(blkID)
 
+        start = blk_starts[blk]
+        num_faces = blk_num_faces[blk]
+        num_nodes = blk_num_nodes[blk]
+
         # get element type
-        num_nodes = len(conn_nofill[start])
         element_type = _get_element_type(num_nodes)
 
-        # get number of faces for this block
-        num_faces = num_el_all_blks[nonzero_el_index_blks[0][blk]]
-        # assign Data variables
-        # convert list to np.array, sorted list guarantees we have the correct info
-        conn_blk = conn_nofill[start : start + num_faces]
-        conn_np = np.array([np.array(xi, dtype=INT_DTYPE) for xi in conn_blk])
+        # one-based connectivity of the faces in this block, without fill values
+        blk_face_indices = sorted_face_indices[start : start + num_faces]
+        conn_np = face_nodes[blk_face_indices, :num_nodes] + 1
         exo_ds[str_connect] = xr.DataArray(
-            data=xr.DataArray((conn_np[:] + 1)),
+            data=conn_np,
             dims=[str_el_in_blk, str_nod_per_el],
             attrs={"elem_type": element_type},
         )
 
         # edge type
         exo_ds[str_edge_type] = xr.DataArray(
-            data=xr.DataArray(np.zeros((num_faces, num_nodes), dtype=INT_DTYPE)),
+            data=np.zeros((num_faces, num_nodes), dtype=INT_DTYPE),
             dims=[str_el_in_blk, str_nod_per_el],
         )
 
@@ -276,12 +250,10 @@ def _encode_exodus(ds, outfile=None):
         # TODO: fix num attr
         num_attr = 1
         exo_ds[str_attrib] = xr.DataArray(
-            data=xr.DataArray(np.zeros((num_faces, num_attr), float)),
+            data=np.zeros((num_faces, num_attr), float),
             dims=[str_el_in_blk, str_att_in_blk],
         )
 
-        start = num_faces
-
     # blk for loop ends
 
     # eb_prop1
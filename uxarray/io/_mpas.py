@@ -1,11 +1,13 @@
 import xarray as xr
 import numpy as np
 
+from functools import partial
+
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
 from uxarray.conventions import ugrid, descriptors
 
 
-def _primal_to_ugrid(in_ds, out_ds):
+def _primal_to_ugrid(in_ds, out_ds, lazy=False):
     """Encodes the MPAS Primal-Mesh in the UGRID conventions.
 
     Parameters
@@ -15,6 +17,9 @@ def _primal_to_ugrid(in_ds, out_ds):
     out_ds : xarray.Dataset
         Output dataset where the MPAS Primal-Mesh is encoded in the UGRID
         conventions
+    lazy : bool, optional
+        Flag to skip parsing the variables returned by ``_deferred_parsers``.
+        Defaults to False
     """
 
     source_dims_dict = {}
@@ -38,23 +43,13 @@ def _primal_to_ugrid(in_ds, out_ds):
         _parse_edge_xyz_coords(in_ds, out_ds, mesh_type="primal")
 
     _parse_face_nodes(in_ds, out_ds, mesh_type="primal")
-    _parse_node_faces(in_ds, out_ds, mesh_type="primal")
 
     if "verticesOnEdge" in in_ds:
-        _parse_edge_nodes(in_ds, out_ds, "primal")
         source_dims_dict[in_ds["verticesOnEdge"].dims[0]] = "n_edge"
 
-    if "edgesOnCell" in in_ds:
-        _parse_face_edges(in_ds, out_ds, mesh_type="primal")
-
-    if "cellsOnEdge" in in_ds:
-        _parse_edge_faces(in_ds, out_ds, mesh_type="primal")
-
-    if "dvEdge" in in_ds:
-        _parse_edge_node_distances(in_ds, out_ds)
-
-    if "dcEdge" in in_ds:
-        _parse_edge_face_distances(in_ds, out_ds)
+    if not lazy:
+        for parser in _deferred_parsers(in_ds, use_dual=False).values():
+            parser(out_ds)
 
     # set global attributes
     _parse_global_attrs(in_ds, out_ds)
@@ -67,7 +62,7 @@ def _primal_to_ugrid(in_ds, out_ds):
     return source_dims_dict
 
 
-def _dual_to_ugrid(in_ds, out_ds):
+def _dual_to_ugrid(in_ds, out_ds, lazy=False):
     """Encodes the MPAS Dual-Mesh in the UGRID conventions.
 
     Parameters
@@ -77,6 +72,9 @@ def _dual_to_ugrid(in_ds, out_ds):
     out_ds : xarray.Dataset
         Output dataset where the MPAS Dual-Mesh is encoded in the UGRID
         conventions
+    lazy : bool, optional
+        Flag to skip parsing the variables returned by ``_deferred_parsers``.
+        Defaults to False
     """
 
     source_dims_dict = {}
@@ -100,23 +98,13 @@ def _dual_to_ugrid(in_ds, out_ds):
         _parse_edge_xyz_coords(in_ds, out_ds, mesh_type="dual")
 
     _parse_face_nodes(in_ds, out_ds, mesh_type="dual")
-    _parse_node_faces(in_ds, out_ds, mesh_type="dual")
 
     if "cellsOnEdge" in in_ds:
-        _parse_edge_nodes(in_ds, out_ds, mesh_type="dual")
         source_dims_dict[in_ds["cellsOnEdge"].dims[0]] = "n_edge"
 
-    if "edgesOnVertex" in in_ds:
-        _parse_face_edges(in_ds, out_ds, mesh_type="dual")
-
-    if "verticesOnEdge" in in_ds:
-        _parse_edge_faces(in_ds, out_ds, mesh_type="dual")
-
-    if "dvEdge" in in_ds:
-        _parse_edge_node_distances(in_ds, out_ds)
-
-    if "dcEdge" in in_ds:
-        _parse_edge_face_distances(in_ds, out_ds)
+    if not lazy:
+        for parser in _deferred_parsers(in_ds, use_dual=True).values():
+            parser(out_ds)
 
     # set global attributes
     _parse_global_attrs(in_ds, out_ds)
@@ -258,31 +246,11 @@ def _parse_edge_xyz_coords(in_ds, out_ds, mesh_type):
 def _parse_face_nodes(in_ds, out_ds, mesh_type):
     """Parses face node connectivity for either the Primal or Dual Mesh."""
     if mesh_type == "primal":
-        verticesOnCell = np.array(in_ds["verticesOnCell"].values, dtype=INT_DTYPE)
-
-        nEdgesOnCell = np.array(in_ds["nEdgesOnCell"].values, dtype=INT_DTYPE)
-
-        # replace padded values with fill values
-        verticesOnCell = _replace_padding(verticesOnCell, nEdgesOnCell)
-
-        # replace missing/zero values with fill values
-        verticesOnCell = _replace_zeros(verticesOnCell)
-
-        # convert to zero-indexed
-        verticesOnCell = _to_zero_index(verticesOnCell)
-
-        face_nodes = verticesOnCell
-
+        face_nodes = _to_ugrid_connectivity(
+            in_ds["verticesOnCell"], in_ds["nEdgesOnCell"]
+        )
     else:
-        cellsOnVertex = np.array(in_ds["cellsOnVertex"].values, dtype=INT_DTYPE)
-
-        # replace missing/zero values with fill values
-        cellsOnVertex = _replace_zeros(cellsOnVertex)
-
-        # convert to zero-indexed
-        cellsOnVertex = _to_zero_index(cellsOnVertex)
-
-        face_nodes = cellsOnVertex
+        face_nodes = _to_ugrid_connectivity(in_ds["cellsOnVertex"])
 
     out_ds["face_node_connectivity"] = xr.DataArray(
         data=face_nodes,
@@ -295,26 +263,10 @@ def _parse_edge_nodes(in_ds, out_ds, mesh_type):
     """Parses edge node connectivity for either the Primal or Dual Mesh."""
     if mesh_type == "primal":
         # vertex indices that saddle a given edge
-        verticesOnEdge = np.array(in_ds["verticesOnEdge"].values, dtype=INT_DTYPE)
-
-        # replace missing/zero values with fill value
-        verticesOnEdge = _replace_zeros(verticesOnEdge)
-
-        # convert to zero-indexed
-        verticesOnEdge = _to_zero_index(verticesOnEdge)
-
-        edge_nodes = verticesOnEdge
+        edge_nodes = _to_ugrid_connectivity(in_ds["verticesOnEdge"])
     else:
-        # vertex indices that saddle a given edge
-        cellsOnEdge = np.array(in_ds["cellsOnEdge"].values, dtype=INT_DTYPE)
-
-        # replace missing/zero values with fill values
-        cellsOnEdge = _replace_zeros(cellsOnEdge)
-
-        # convert to zero-indexed
-        cellsOnEdge = _to_zero_index(cellsOnEdge)
-
-        edge_nodes = cellsOnEdge
+        # cell indices that saddle a given edge
+        edge_nodes = _to_ugrid_connectivity(in_ds["cellsOnEdge"])
 
     out_ds["edge_node_connectivity"] = xr.DataArray(
         data=edge_nodes,
@@ -326,30 +278,11 @@ def _parse_edge_nodes(in_ds, out_ds, mesh_type):
 def _parse_node_faces(in_ds, out_ds, mesh_type):
     """Parses node face connectivity for either the Primal or Dual Mesh."""
     if mesh_type == "primal":
-        cellsOnVertex = np.array(in_ds["cellsOnVertex"].values, dtype=INT_DTYPE)
-
-        # replace missing/zero values with fill values
-        cellsOnVertex = _replace_zeros(cellsOnVertex)
-
-        # convert to zero-indexed
-        cellsOnVertex = _to_zero_index(cellsOnVertex)
-
-        node_faces = cellsOnVertex
+        node_faces = _to_ugrid_connectivity(in_ds["cellsOnVertex"])
     else:
-        verticesOnCell = np.array(in_ds["verticesOnCell"].values, dtype=INT_DTYPE)
-
-        nEdgesOnCell = np.array(in_ds["nEdgesOnCell"].values, dtype=INT_DTYPE)
-
-        # replace padded values with fill values
-        verticesOnCell = _replace_padding(verticesOnCell, nEdgesOnCell)
-
-        # replace missing/zero values with fill values
-        verticesOnCell = _replace_zeros(verticesOnCell)
-
-        # convert to zero-indexed
-        verticesOnCell = _to_zero_index(verticesOnCell)
-
-        node_faces = verticesOnCell
+        node_faces = _to_ugrid_connectivity(
+            in_ds["verticesOnCell"], in_ds["nEdgesOnCell"]
+        )
 
     out_ds["node_face_connectivity"] = xr.DataArray(
         data=node_faces,
@@ -361,31 +294,9 @@ def _parse_node_faces(in_ds, out_ds, mesh_type):
 def _parse_face_edges(in_ds, out_ds, mesh_type):
     """Parses face edge connectivity for either the Primal or Dual Mesh."""
     if mesh_type == "primal":
-        edgesOnCell = np.array(in_ds["edgesOnCell"].values, dtype=INT_DTYPE)
-
-        nEdgesOnCell = np.array(in_ds["nEdgesOnCell"].values, dtype=INT_DTYPE)
-
-        # replace padded values with fill values
-        edgesOnCell = _replace_padding(edgesOnCell, nEdgesOnCell)
-
-        # replace missing/zero values with fill values
-        edgesOnCell = _replace_zeros(edgesOnCell)
-
-        # convert to zero-indexed
-        edgesOnCell = _to_zero_index(edgesOnCell)
-
-        face_edges = edgesOnCell
-
+        face_edges = _to_ugrid_connectivity(in_ds["edgesOnCell"], in_ds["nEdgesOnCell"])
     else:
-        edgesOnVertex = np.array(in_ds["edgesOnVertex"].values, dtype=INT_DTYPE)
-
-        # replace missing/zero values with fill values
-        edgesOnVertex = _replace_zeros(edgesOnVertex)
-
-        # convert to zero-indexed
-        edgesOnVertex = _to_zero_index(edgesOnVertex)
-
-        face_edges = edgesOnVertex
+        face_edges = _to_ugrid_connectivity(in_ds["edgesOnVertex"])
 
     out_ds["face_edge_connectivity"] = xr.DataArray(
         data=face_edges,
@@ -395,30 +306,13 @@ def _parse_face_edges(in_ds, out_ds, mesh_type):
 
 
 def _parse_edge_faces(in_ds, out_ds, mesh_type):
-    """Parses edge node connectivity for either the Primal or Dual Mesh."""
+    """Parses edge face connectivity for either the Primal or Dual Mesh."""
     if mesh_type == "primal":
-        # vertex indices that saddle a given edge
-        cellsOnEdge = np.array(in_ds["cellsOnEdge"].values, dtype=INT_DTYPE)
-
-        # replace missing/zero values with fill values
-        cellsOnEdge = _replace_zeros(cellsOnEdge)
-
-        # convert to zero-indexed
-        cellsOnEdge = _to_zero_index(cellsOnEdge)
-
-        edge_faces = cellsOnEdge
-
+        # cell indices that saddle a given edge
+        edge_faces = _to_ugrid_connectivity(in_ds["cellsOnEdge"])
     else:
         # vertex indices that saddle a given edge
-        verticesOnEdge = np.array(in_ds["verticesOnEdge"].values, dtype=INT_DTYPE)
-
-        # replace missing/zero values with fill value
-        verticesOnEdge = _replace_zeros(verticesOnEdge)
-
-        # convert to zero-indexed
-        verticesOnEdge = _to_zero_index(verticesOnEdge)
-
-        edge_faces = verticesOnEdge
+        edge_faces = _to_ugrid_connectivity(in_ds["verticesOnEdge"])
 
     out_ds["edge_face_connectivity"] = xr.DataArray(
         data=edge_faces,
@@ -536,7 +430,102 @@ def _to_zero_index(grid_var):
     return grid_var
 
 
-def _read_mpas(ext_ds, use_dual=False):
+def _to_ugrid_connectivity(mpas_var, n_elements=None):
+    """Converts a one-indexed MPAS connectivity variable into a zero-indexed
+    ``INT_DTYPE`` array, with missing (zero) and padded entries replaced by
+    ``INT_FILL_VALUE``.
+
+    Equivalent to applying ``_replace_padding``, ``_replace_zeros`` and
+    ``_to_zero_index`` to an ``INT_DTYPE`` copy of ``mpas_var``, but writes the
+    result in a single pass, allocating only the output array and a boolean
+    mask. The source variable is never modified.
+
+    Parameters
+    ----------
+    mpas_var : xarray.DataArray
+        One-indexed MPAS connectivity variable (i.e. ``verticesOnCell``)
+    n_elements : xarray.DataArray, optional
+        Number of valid entries in each row (i.e. ``nEdgesOnCell``), with
+        any entries past it treated as padding
+
+    Returns
+    -------
+    grid_var : numpy.ndarray
+        Zero-indexed connectivity with fill values
+    """
+    values = mpas_var.values
+
+    # entries that index into a valid element
+    valid = values != 0
+
+    if n_elements is not None:
+        valid &= np.arange(values.shape[1]) < n_elements.values[:, None]
+
+    # shift to zero-indexed while converting to INT_DTYPE
+    grid_var = np.subtract(values, 1, dtype=INT_DTYPE, casting="unsafe")
+
+    grid_var[np.logical_not(valid, out=valid)] = INT_FILL_VALUE
+
+    return grid_var
+
+
+def _deferred_parsers(in_ds, use_dual=False):
+    """Collects the parsers for the connectivity and descriptor variables that
+    are not needed to construct a minimal ``Grid``, each of which can be run
+    independently when the corresponding variable is first accessed.
+
+    Parameters
+    ----------
+    in_ds : xarray.Dataset
+        Input MPAS dataset
+    use_dual : bool, optional
+        Flag to select whether to encode the Dual-Mesh. Defaults to False
+
+    Returns
+    -------
+    parsers : dict
+        Mapping of each UGRID variable name to a callable that parses it into
+        an output dataset
+    """
+    if use_dual:
+        mesh_type = "dual"
+        source_vars = {
+            "node_face_connectivity": "verticesOnCell",
+            "edge_node_connectivity": "cellsOnEdge",
+            "face_edge_connectivity": "edgesOnVertex",
+            "edge_face_connectivity": "verticesOnEdge",
+        }
+    else:
+        mesh_type = "primal"
+        source_vars = {
+            "node_face_connectivity": "cellsOnVertex",
+            "edge_node_connectivity": "verticesOnEdge",
+            "face_edge_connectivity": "edgesOnCell",
+            "edge_face_connectivity": "cellsOnEdge",
+        }
+
+    conn_parsers = {
+        "node_face_connectivity": _parse_node_faces,
+        "edge_node_connectivity": _parse_edge_nodes,
+        "face_edge_connectivity": _parse_face_edges,
+        "edge_face_connectivity": _parse_edge_faces,
+    }
+
+    parsers = {}
+    for name, source_var in source_vars.items():
+        if source_var in in_ds:
+            parsers[name] = partial(conn_parsers[name], in_ds, mesh_type=mesh_type)
+
+    if "dvEdge" in in_ds:
+        parsers["edge_node_distances"] = partial(_parse_edge_node_distances, in_ds)
+
+    if "dcEdge" in in_ds:
+        parsers["edge_face_distances"] = partial(_parse_edge_face_distances, in_ds)
+
+    return parsers
+
+
+def _read_mpas(ext_ds, use_dual=False, lazy=False):
     """Function to read in a MPAS Grid dataset and encode either the Primal or
     Dual Mesh in the UGRID conventions.
 
@@ -549,6 +538,10 @@ def _read_mpas(ext_ds, use_dual=False):
         MPAS datafile of interest
     use_dual : bool, optional
         Flag to select whether to encode the Dual-Mesh. Defaults to False
+    lazy : bool, optional
+        Flag to only encode the coordinates and ``face_node_connectivity``,
+        leaving the variables returned by ``_deferred_parsers`` to be parsed
+        on first access. Defaults to False
 
     Returns
     -------
@@ -561,9 +554,9 @@ def _read_mpas(ext_ds, use_dual=False):
 
     # convert dual-mesh to UGRID
     if use_dual:
-        source_dim_map = _dual_to_ugrid(ext_ds, ds)
+        source_dim_map = _dual_to_ugrid(ext_ds, ds, lazy=lazy)
     # convert primal-mesh to UGRID
     else:
-        source_dim_map = _primal_to_ugrid(ext_ds, ds)
+        source_dim_map = _primal_to_ugrid(ext_ds, ds, lazy=lazy)
 
     return ds, source_dim_map
@@ -2,12 +2,13 @@ import xarray as xr
 import numpy as np
 
 from uxarray.grid.connectivity import _replace_fill_values
+from uxarray.grid.utils import _deduplicate_nodes
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
 
 from uxarray.conventions import ugrid
 
 
-def _to_ugrid(in_ds, out_ds):
+def _to_ugrid(in_ds, out_ds, tolerance=None):
     """If input dataset (``in_ds``) file is an unstructured SCRIP file,
     function will reassign SCRIP variables to UGRID conventions in output file
     (``out_ds``).
@@ -20,6 +21,10 @@ def _to_ugrid(in_ds, out_ds):
     out_ds : xarray.Variable
         file to be returned by ``_populate_scrip_data``, used as an empty placeholder file
         to store reassigned SCRIP variables in UGRID conventions
+
+    tolerance : float, optional
+        Maximum difference in degrees between the longitude and latitude of two corners for them to be merged into
+        a single node, with only exactly matching corners merged if not provided
     """
 
     source_dims_dict = {}
@@ -35,14 +40,14 @@ def _to_ugrid(in_ds, out_ds):
         # Combine flat lat and lon arrays
         corner_lon_lat = np.vstack((corner_lon, corner_lat)).T
 
-        # Run numpy unique to determine which rows/values are actually unique
-        _, unq_ind, unq_inv = np.unique(
-            corner_lon_lat, return_index=True, return_inverse=True, axis=0
+        # Determine which corners are unique (within tolerance), mapping each corner to its node
+        unq_lon_lat, unq_inv = _deduplicate_nodes(
+            corner_lon_lat, tolerance=tolerance, fill_value=None
         )
 
         # Now, calculate unique lon and lat values to account for 'node_lon' and 'node_lat'
-        unq_lon = corner_lon_lat[unq_ind, :][:, 0]
-        unq_lat = corner_lon_lat[unq_ind, :][:, 1]
+        unq_lon = unq_lon_lat[:, 0]
+        unq_lat = unq_lon_lat[:, 1]
 
         # Reshape face nodes array into original shape for use in 'face_node_connectivity'
         unq_inv = np.reshape(unq_inv, (len(in_ds.grid_size), len(in_ds.grid_corners)))
@@ -90,7 +95,7 @@ def _to_ugrid(in_ds, out_ds):
     return source_dims_dict
 
 
-def _read_scrip(ext_ds):
+def _read_scrip(ext_ds, tolerance=None):
     """Function to reassign lat/lon variables to node variables.
 
     Currently, supports unstructured SCRIP grid files following traditional SCRIP
@@ -106,6 +111,8 @@ def _read_scrip(ext_ds):
     ----------
     ext_ds : xarray.Dataset, required
         SCRIP datafile of interest
+    tolerance : float, optional
+        Maximum difference in degrees between two corners for them to be merged into a single node
 
     Returns
     -------
@@ -114,7 +121,7 @@ def _read_scrip(ext_ds):
     """
     ds = xr.Dataset()
 
-    source_dims_dict = _to_ugrid(ext_ds, ds)
+    source_dims_dict = _to_ugrid(ext_ds, ds, tolerance=tolerance)
 
     return ds, source_dims_dict
 
@@ -87,7 +87,7 @@ def _encode_ugrid(ds):
     if "grid_topology" in ds:
         ds = ds.drop_vars(["grid_topology"])
 
-    grid_topology = ugrid.BASE_GRID_TOPOLOGY_ATTRS
+    grid_topology = ugrid.BASE_GRID_TOPOLOGY_ATTRS.copy()
 
     if "n_edge" in ds:
         grid_topology["edge_dimension"] = "n_edge"
@@ -125,6 +125,13 @@ def _standardize_connectivity(ds, conn_name):
         Input Dataset with correct index variables
     """
 
+    # already standardized, avoid loading the connectivity (i.e. when stored lazily in a zarr store)
+    if (
+        ds[conn_name].dtype == INT_DTYPE
+        and ds[conn_name].attrs.get("_FillValue") == INT_FILL_VALUE
+    ):
+        return ds
+
     # original connectivity
     conn = ds[conn_name].values
 
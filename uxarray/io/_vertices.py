@@ -1,10 +1,10 @@
 import xarray as xr
-import numpy as np
 
 from uxarray.constants import INT_FILL_VALUE, INT_DTYPE
+from uxarray.grid.utils import _deduplicate_nodes
 
 
-def _read_face_vertices(face_vertices, latlon):
+def _read_face_vertices(face_vertices, latlon, tolerance=None):
     """Create a grid with faces constructed from vertices specified by the
     given argument.
 
@@ -12,6 +12,11 @@ def _read_face_vertices(face_vertices, latlon):
     ----------
     dataset : ndarray, list, tuple, required
         Input vertex coordinates that form our face(s)
+    latlon : bool
+        Indicates whether the inputted vertices are in lat/lon, with units in degrees
+    tolerance : float, optional
+        Maximum difference in each coordinate for two vertices to be merged into a single node, with only exactly
+        matching vertices merged if not provided
     """
     grid_ds = xr.Dataset()
 
@@ -31,35 +36,13 @@ def _read_face_vertices(face_vertices, latlon):
     # else:
     #     z_coord = x_coord * 0.0
 
-    # Identify unique vertices and their indices
-    unique_verts, indices = np.unique(
-        face_vertices.reshape(-1, face_vertices.shape[-1]), axis=0, return_inverse=True
+    # Identify unique vertices (within tolerance) and their indices, with padded vertices mapped to fill values
+    unique_verts, indices = _deduplicate_nodes(
+        face_vertices.reshape(-1, face_vertices.shape[-1]),
+        tolerance=tolerance,
+        fill_value=INT_FILL_VALUE,
     )
-
-    # Nodes index that contain a fill value
-    fill_value_mask = np.logical_or(
-        unique_verts[:, 0] == INT_FILL_VALUE, unique_verts[:, 1] == INT_FILL_VALUE
-    )
-    if face_vertices[0][0].size > 2:
-        fill_value_mask = np.logical_or(
-            unique_verts[:, 0] == INT_FILL_VALUE,
-            unique_verts[:, 1] == INT_FILL_VALUE,
-            unique_verts[:, 2] == INT_FILL_VALUE,
-        )
-
-    # Get the indices of all the False values in fill_value_mask
-    false_indices = np.where(fill_value_mask)[0]
-
-    # Check if any False values were found
     indices = indices.astype(INT_DTYPE)
-    if false_indices.size > 0:
-        # Remove the rows corresponding to False values in unique_verts
-        unique_verts = np.delete(unique_verts, false_indices, axis=0)
-
-        # Update indices accordingly
-        for i, idx in enumerate(false_indices):
-            indices[indices == idx] = INT_FILL_VALUE
-            indices[(indices > idx) & (indices != INT_FILL_VALUE)] -= 1
 
     if latlon:
         grid_ds["node_lon"] = xr.DataArray(
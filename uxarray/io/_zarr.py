@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import xarray as xr
+
+from collections.abc import MutableMapping
+
+from uxarray.constants import GRID_DIMS
+from uxarray.io._ugrid import _encode_ugrid
+
+# default number of elements along each grid dimension (n_node, n_edge, n_face) stored in a single chunk
+ZARR_DEFAULT_CHUNK_SIZE = 2**18
+
+
+def _encode_zarr(ds, chunks=None):
+    """Encodes an unstructured grid represented under a ``Grid`` object as a
+    ``xr.Dataset`` in the UGRID conventions that can be written to a Zarr
+    store, along with the encoding used to chunk each variable.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        Internal grid dataset (``Grid._ds``)
+    chunks : dict, optional
+        Mapping of dimension names to chunk sizes. Grid dimensions that are not
+        provided are chunked using ``ZARR_DEFAULT_CHUNK_SIZE`` and all others
+        are stored as a single chunk
+
+    Returns
+    -------
+    out_ds : xarray.Dataset
+        UGRID dataset with attributes that can be stored as Zarr metadata
+    encoding : dict
+        Per-variable encoding passed to ``xarray.Dataset.to_zarr``
+    """
+    if chunks is None:
+        chunks = {}
+
+    out_ds = _encode_ugrid(ds.copy())
+
+    encoding = {}
+    for var_name, var in out_ds.variables.items():
+        attrs = {}
+        var_encoding = {}
+        for key, value in var.attrs.items():
+            if key == "_FillValue":
+                # stored as the fill value of the Zarr array instead
+                var_encoding["_FillValue"] = value
+            elif not isinstance(value, (np.ndarray, type)):
+                # drops cached arrays (i.e. inverse_indices) and dtypes
+                attrs[key] = value
+        var.attrs = attrs
+
+        # encoding inherited from the source dataset may not match the grid variables
+        var.encoding = {}
+
+        var_encoding["chunks"] = tuple(
+            min(size, chunks.get(dim, ZARR_DEFAULT_CHUNK_SIZE))
+            if dim in GRID_DIMS or dim in chunks
+            else size
+            for dim, size in zip(var.dims, var.shape)
+        )
+        encoding[var_name] = var_encoding
+
+    return out_ds, encoding
+
+
+def _read_zarr(store, **kwargs):
+    """Opens a grid stored with ``Grid.to_zarr`` as an ``xarray.Dataset``.
+
+    Variables are not loaded until they are accessed, at which point only
+    the chunks required are read from the store.
+
+    Parameters
+    ----------
+    store : str, os.PathLike or MutableMapping
+        Path to or mapping of a Zarr store
+    **kwargs :
+        Additional arguments passed on to ``xarray.open_zarr``
+
+    Returns
+    -------
+    ds : xarray.Dataset
+        UGRID dataset with unmasked connectivity variables
+    """
+    # keep the integer fill values of connectivity variables instead of masking them as NaN
+    kwargs.setdefault("mask_and_scale", False)
+    kwargs.setdefault("chunks", None)
+
+    return xr.open_zarr(store, **kwargs)
+
+
+def _is_zarr(store):
+    """Checks whether a given input is a path to or mapping of a Zarr
+    store."""
+    if isinstance(store, MutableMapping):
+        # dictionaries are reserved for grid topology definitions
+        return not isinstance(store, dict)
+
+    if not isinstance(store, (str, os.PathLike)):
+        return False
+
+    store = os.fspath(store)
+
+    if store.rstrip("/").endswith(".zarr"):
+        return True
+
+    return os.path.isdir(store) and (
+        os.path.exists(os.path.join(store, ".zgroup"))
+        or os.path.exists(os.path.join(store, "zarr.json"))
+    )
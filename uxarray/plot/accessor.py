@@ -5,6 +5,8 @@ import functools
 
 
 if TYPE_CHECKING:
+    import cartopy.crs as ccrs
+
     from uxarray.core.dataset import UxDataset
     from uxarray.core.dataarray import UxDataArray
     from uxarray.grid import Grid
@@ -13,8 +15,6 @@ import uxarray.plot.grid_plot as grid_plot
 import uxarray.plot.dataarray_plot as dataarray_plot
 import uxarray.plot.utils
 
-import cartopy.crs as ccrs
-
 
 class GridPlotAccessor:
     """Plotting Accessor for Grid, accessed through ``Grid.plot()`` or
@@ -34,6 +34,7 @@ class GridPlotAccessor:
         self,
         backend: Optional[str] = "bokeh",
         exclude_antimeridian: Optional[bool] = False,
+        rasterize: Optional[bool] = False,
         width: Optional[int] = 1000,
         height: Optional[int] = 500,
         **kwargs,
@@ -46,6 +47,8 @@ class GridPlotAccessor:
             Selects whether to use Holoview's "matplotlib" or "bokeh" backend for rendering plots
          exclude_antimeridian: bool,
             Whether to exclude edges that cross the antimeridian
+        rasterize: bool
+            Whether to rasterize the edges with datashader instead of drawing each edge as a vector line
         height: int
             Plot Height for Bokeh Backend
         width: int
@@ -55,6 +58,7 @@ class GridPlotAccessor:
             self._uxgrid,
             backend=backend,
             exclude_antimeridian=exclude_antimeridian,
+            rasterize=rasterize,
             width=width,
             height=height,
             **kwargs,
@@ -65,6 +69,7 @@ class GridPlotAccessor:
         self,
         backend: Optional[str] = "bokeh",
         exclude_antimeridian: Optional[bool] = False,
+        rasterize: Optional[bool] = False,
         width: Optional[int] = 1000,
         height: Optional[int] = 500,
         **kwargs,
@@ -78,6 +83,8 @@ class GridPlotAccessor:
             Selects whether to use Holoview's "matplotlib" or "bokeh" backend for rendering plots
          exclude_antimeridian: bool,
             Whether to exclude edges that cross the antimeridian
+        rasterize: bool
+            Whether to rasterize the edges with datashader instead of drawing each edge as a vector line
         height: int
             Plot Height for Bokeh Backend
         width: int
@@ -87,6 +94,7 @@ class GridPlotAccessor:
             self._uxgrid,
             backend=backend,
             exclude_antimeridian=exclude_antimeridian,
+            rasterize=rasterize,
             width=width,
             height=height,
             **kwargs,
@@ -344,10 +352,11 @@ class UxDataArrayPlotAccessor:
         cmap: Optional[str] = "Blues",
         aggregator: Optional[str] = "mean",
         interpolation: Optional[str] = "linear",
-        npartitions: Optional[int] = 1,
+        npartitions: Optional[int] = None,
         cache: Optional[bool] = True,
         override: Optional[bool] = False,
         size: Optional[int] = 5,
+        lod: Optional[bool] = False,
         **kwargs,
     ):
         """Raster plot of a data variable residing on an unstructured grid
@@ -356,7 +365,7 @@ class UxDataArrayPlotAccessor:
         Parameters
         ----------
         method: str
-            Selects what type of element to rasterize (point, trimesh, polygon).
+            Selects what type of element to rasterize (point, trimesh, polygon, lookup).
         backend: str
             Selects whether to use Holoview's "matplotlib" or "bokeh" backend for rendering plots
         projection: ccrs
@@ -366,6 +375,9 @@ class UxDataArrayPlotAccessor:
         cache: bool
             Determines where computed elements (i.e. points, polygons) should be cached internally for subsequent plotting
             calls
+        lod: bool
+            Whether to rasterize face-centered data as the points of a precomputed level-of-detail pyramid of face
+            clusters (Point Raster Only), selecting a level for each viewport
 
         Notes
         -----
@@ -392,14 +404,46 @@ class UxDataArrayPlotAccessor:
             cache=cache,
             override=override,
             size=size,
+            lod=lod,
             **kwargs,
         )
 
+    @functools.wraps(dataarray_plot.render_frames)
+    def render_frames(
+        self,
+        dim: Optional[str] = None,
+        filename: Optional[str] = None,
+        width: Optional[int] = 1000,
+        height: Optional[int] = 500,
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        projection: Optional[ccrs] = None,
+        cmap: Optional[str] = "Blues",
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+        processes: Optional[int] = None,
+    ):
+        return dataarray_plot.render_frames(
+            self._uxda,
+            dim=dim,
+            filename=filename,
+            width=width,
+            height=height,
+            x_range=x_range,
+            y_range=y_range,
+            projection=projection,
+            cmap=cmap,
+            vmin=vmin,
+            vmax=vmax,
+            processes=processes,
+        )
+
     @functools.wraps(dataarray_plot.polygons)
     def polygons(
         self,
         backend: Optional[str] = "bokeh",
         exclude_antimeridian: Optional[bool] = False,
+        projection: Optional[ccrs] = None,
         width: Optional[int] = 1000,
         height: Optional[int] = 500,
         colorbar: Optional[bool] = True,
@@ -416,6 +460,8 @@ class UxDataArrayPlotAccessor:
             Selects whether to use Holoview's "matplotlib" or "bokeh" backend for rendering plots
         exclude_antimeridian: bool,
             Whether to exclude faces that cross the antimeridian (Polygon Raster Only)
+        projection: ccrs
+            Custom projection to transform the polygons to
         height: int
             Plot Height for Bokeh Backend
         width: int
@@ -426,6 +472,7 @@ class UxDataArrayPlotAccessor:
             self._uxda,
             backend=backend,
             exclude_antimeridian=exclude_antimeridian,
+            projection=projection,
             width=width,
             height=height,
             colorbar=colorbar,
@@ -1,22 +1,32 @@
 from __future__ import annotations
 
-import matplotlib
-
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from uxarray.core.dataarray import UxDataArray
-
-# consider making these required depndencies
-from cartopy import crs as ccrs
-import dask.dataframe as dd
-import holoviews as hv
-from holoviews.operation.datashader import rasterize as hds_rasterize
+    from cartopy import crs as ccrs
 
+    from uxarray.core.dataarray import UxDataArray
 
 import numpy as np
+import pandas as pd
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 import uxarray.plot.utils
+from uxarray.constants import INT_FILL_VALUE
+from uxarray.grid.geometry import (
+    _get_point_coordinates,
+    _get_projected_coordinates,
+    _get_trimesh,
+    _raster_extent,
+)
+from uxarray.grid.lod import (
+    LOD_CLUSTERS_PER_PIXEL,
+    _coarsen_face_values,
+    _get_lod_pyramid,
+    _select_lod_level,
+)
 
 
 def plot(uxda, **kwargs):
@@ -65,6 +75,7 @@ def datashade(
     """
     import datashader as ds
     import datashader.transfer_functions as tf
+    import matplotlib
 
     cvs = ds.Canvas(plot_width, plot_height, x_range, y_range)
     gdf = uxda.to_geodataframe()
@@ -102,10 +113,11 @@ def rasterize(
     cmap: Optional[str] = "Blues",
     aggregator: Optional[str] = "mean",
     interpolation: Optional[str] = "linear",
-    npartitions: Optional[int] = 1,
+    npartitions: Optional[int] = None,
     cache: Optional[bool] = True,
     override: Optional[bool] = False,
     size: Optional[int] = 5,
+    lod: Optional[bool] = False,
     **kwargs,
 ):
     """Rasterized Plot of a Data Variable Residing on an Unstructured Grid.
@@ -113,23 +125,34 @@ def rasterize(
     Parameters
     ----------
     method: str
-        Selects what type of element to rasterize (point, trimesh, polygon), with "point" being the only currently
-        implemented method.
+        Selects what type of element to rasterize (point, trimesh, polygon). The "trimesh" method rasterizes a fan
+        triangulation of each face, with node-centered data interpolated across each triangle and face-centered data
+        constant across each face. The "lookup" method indexes face-centered data with the face that covers each
+        pixel, which is computed once for each canvas and cached on the grid (see ``Grid.to_raster_lookup``)
     backend: str
         Selects whether to use Holoview's "matplotlib" or "bokeh" backend for rendering plots
     exclude_antimeridian: bool,
         Whether to exclude faces that cross the antimeridian (Polygon Raster Only)
     projection: ccrs
-         Custom projection to transform (lon, lat) coordinates for rendering
+         Custom projection to transform (lon, lat) coordinates for rendering (Point, Polygon and Lookup Raster
+         Only), which is computed once for each projection and cached on the grid. A ``ValueError`` is raised if
+         it is provided with the "trimesh" method or ``lod``
     pixel_ratio: float
         Determines the resolution of the outputted raster.
     height: int
         Plot Height for Bokeh Backend
     width: int
         Plot Width for Bokeh Backend
+    npartitions: int
+        Number of partitions of a ``dask.dataframe`` constructed from in-memory data (Point Raster Only). By default,
+        in-memory data is rasterized directly and dask-backed data with one partition for each chunk
     cache: bool
             Determines where computed elements (i.e. points, polygons) should be cached internally for subsequent plotting
             calls
+    lod: bool
+        Whether to rasterize face-centered data as the points of a precomputed level-of-detail pyramid of face
+        clusters (Point Raster Only), selecting the finest level with about as many clusters inside the viewport as
+        pixels, which is updated on each zoom and pan event if ``dynamic`` is set
 
     Notes
     -----
@@ -137,7 +160,27 @@ def rasterize(
     or run holoviews.help(holoviews.operation.datashader.rasterize).
     """
 
-    if method == "point":
+    if projection is not None and (method == "trimesh" or (method == "point" and lod)):
+        raise ValueError(
+            "Projections are only supported by the point (without lod), polygon and lookup rasterization methods."
+        )
+
+    if method == "point" and lod:
+        raster = _lod_raster(
+            uxda=uxda,
+            backend=backend,
+            pixel_ratio=pixel_ratio,
+            dynamic=dynamic,
+            precompute=precompute,
+            width=width,
+            height=height,
+            colorbar=colorbar,
+            cmap=cmap,
+            aggregator=aggregator,
+            interpolation=interpolation,
+            **kwargs,
+        )
+    elif method == "point":
         # perform point rasterization
         raster = _point_raster(
             uxda=uxda,
@@ -157,11 +200,39 @@ def rasterize(
             size=size,
             **kwargs,
         )
+    elif method == "trimesh":
+        raster = _trimesh_raster(
+            uxda=uxda,
+            backend=backend,
+            pixel_ratio=pixel_ratio,
+            dynamic=dynamic,
+            precompute=precompute,
+            width=width,
+            height=height,
+            colorbar=colorbar,
+            cmap=cmap,
+            aggregator=aggregator,
+            interpolation=interpolation,
+            **kwargs,
+        )
+    elif method == "lookup":
+        raster = _lookup_raster(
+            uxda=uxda,
+            backend=backend,
+            pixel_ratio=pixel_ratio,
+            projection=projection,
+            width=width,
+            height=height,
+            colorbar=colorbar,
+            cmap=cmap,
+            **kwargs,
+        )
     elif method == "polygon":
         raster = _polygon_raster(
             uxda=uxda,
             backend=backend,
             exclude_antimeridian=exclude_antimeridian,
+            projection=projection,
             dynamic=dynamic,
             precompute=precompute,
             width=width,
@@ -194,7 +265,7 @@ def _point_raster(
     cmap: Optional[str] = "Blues",
     aggregator: Optional[str] = "mean",
     interpolation: Optional[str] = "linear",
-    npartitions: Optional[int] = 1,
+    npartitions: Optional[int] = None,
     cache: Optional[bool] = True,
     xlabel: Optional[str] = "Longitude",
     ylabel: Optional[str] = "Latitude",
@@ -203,36 +274,36 @@ def _point_raster(
 ):
     """Implementation of Point Rasterization."""
 
+    import holoviews as hv
+    from holoviews.operation.datashader import rasterize as hds_rasterize
+
     if "clabel" not in kwargs:
         # set default label for color bar
         kwargs["clabel"] = uxda.name
 
     if uxda._face_centered():
         # data mapped to face centroid coordinates
-        lon, lat = uxda.uxgrid.face_lon.values, uxda.uxgrid.face_lat.values
+        element = "face"
     elif uxda._node_centered():
         # data mapped to face corner coordinates
-        lon, lat = uxda.uxgrid.node_lon.values, uxda.uxgrid.node_lat.values
+        element = "node"
     elif uxda._edge_centered():
         # data mapped to face corner coordinates
-        lon, lat = uxda.uxgrid.edge_lon.values, uxda.uxgrid.edge_lat.values
+        element = "edge"
     else:
         raise ValueError(
             f"The Dimension of Data Variable {uxda.name} is not Node or Face centered."
         )
 
-    if projection is not None:
-        # apply projection to coordinates
-        lon, lat, _ = projection.transform_points(ccrs.PlateCarree(), lon, lat).T
+    # coordinates, cached on the grid for each element and projection
+    point_coordinates = _get_point_coordinates(uxda.uxgrid, element, projection)
 
     uxarray.plot.utils.backend.assign(backend=backend)
 
-    # construct a dask dataframe from coordinates and data
-    point_dict = {"lon": lon, "lat": lat, "var": uxda.data}
-    point_ddf = dd.from_dict(data=point_dict, npartitions=npartitions)
+    point_df = _point_dataframe(point_coordinates, uxda.data, npartitions)
 
     # construct a holoviews points oobject
-    points = hv.Points(point_ddf, ["lon", "lat"]).opts(size=size)
+    points = hv.Points(point_df, ["lon", "lat"]).opts(size=size)
 
     if backend == "matplotlib":
         # use holoviews matplotlib backend
@@ -277,10 +348,159 @@ def _point_raster(
     return raster
 
 
+def _point_dataframe(point_coordinates, data, npartitions=None):
+    """Constructs the dataframe of points that is passed to the aggregator,
+    appending a ``var`` column with the data to the cached coordinates.
+
+    In-memory data is appended to a ``pandas.DataFrame`` without copying the coordinates, unless ``npartitions`` is
+    set. Dask-backed data is kept lazy, with one partition for each of its chunks.
+    """
+
+    import dask.array as da
+    import dask.dataframe as dd
+
+    if isinstance(data, da.Array):
+        # align the coordinates with the chunks of the data, instead of re-chunking the data
+        var = dd.from_dask_array(data, columns="var")
+        return var.to_frame().assign(
+            lon=da.from_array(point_coordinates["lon"].values, chunks=data.chunks),
+            lat=da.from_array(point_coordinates["lat"].values, chunks=data.chunks),
+        )
+
+    point_df = pd.DataFrame(
+        {
+            "lon": point_coordinates["lon"].values,
+            "lat": point_coordinates["lat"].values,
+            "var": np.asarray(data),
+        },
+        copy=False,
+    )
+
+    if npartitions is not None:
+        return dd.from_pandas(point_df, npartitions=npartitions)
+
+    return point_df
+
+
+def _lod_raster(
+    uxda: UxDataArray,
+    backend: Optional[str] = "bokeh",
+    pixel_ratio: Optional[float] = 1.0,
+    dynamic: Optional[bool] = False,
+    precompute: Optional[bool] = True,
+    width: Optional[int] = 1000,
+    height: Optional[int] = 500,
+    colorbar: Optional[bool] = True,
+    cmap: Optional[str] = "Blues",
+    aggregator: Optional[str] = "mean",
+    interpolation: Optional[str] = "linear",
+    xlabel: Optional[str] = "Longitude",
+    ylabel: Optional[str] = "Latitude",
+    **kwargs,
+):
+    """Implementation of Level-of-Detail Point Rasterization.
+
+    Face-centered data is aggregated once to every level of the level-of-
+    detail pyramid of the grid, and each viewport only renders the clusters
+    of a single level.
+    """
+
+    import holoviews as hv
+    from holoviews.operation.datashader import rasterize as hds_rasterize
+
+    if "clabel" not in kwargs:
+        # set default label for color bar
+        kwargs["clabel"] = uxda.name
+
+    if not uxda._face_centered() or uxda.ndim > 1:
+        raise ValueError(
+            f"Level-of-detail rasterization requires the data variable {uxda.name} to be 1-dimensional and face "
+            f"centered."
+        )
+
+    face_order, level_offsets, cluster_lon, cluster_lat, cluster_area = (
+        _get_lod_pyramid(uxda.uxgrid)
+    )
+    cluster_values = _coarsen_face_values(
+        uxda.values, face_order, level_offsets, cluster_area
+    )
+
+    plot_width, plot_height = width, height
+
+    def _lod_points(x_range=None, y_range=None, width=None, height=None, scale=None):
+        # clusters of the finest level with about as many clusters inside the viewport as pixels
+        if x_range is None:
+            x_range = (-180, 180)
+        if y_range is None:
+            y_range = (-90, 90)
+        if width is None or height is None:
+            width, height = plot_width, plot_height
+        max_clusters = (
+            LOD_CLUSTERS_PER_PIXEL
+            * int(width * pixel_ratio)
+            * int(height * pixel_ratio)
+        )
+        _, visible = _select_lod_level(
+            level_offsets, cluster_lon, cluster_lat, x_range, y_range, max_clusters
+        )
+        return hv.Points(
+            (cluster_lon[visible], cluster_lat[visible], cluster_values[visible]),
+            ["lon", "lat"],
+            ["var"],
+        )
+
+    uxarray.plot.utils.backend.assign(backend=backend)
+
+    if dynamic:
+        # select a level on each zoom, pan and resize event
+        points = hv.DynamicMap(
+            _lod_points, streams=[hv.streams.RangeXY(), hv.streams.PlotSize()]
+        )
+    else:
+        points = _lod_points()
+
+    raster = hds_rasterize(
+        points,
+        pixel_ratio=pixel_ratio,
+        dynamic=dynamic,
+        precompute=precompute,
+        aggregator=aggregator,
+        interpolation=interpolation,
+    )
+
+    if backend == "matplotlib":
+        # use holoviews matplotlib backend
+        raster = raster.opts(
+            colorbar=colorbar,
+            cmap=cmap,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            **kwargs,
+        )
+    elif backend == "bokeh":
+        # use holoviews bokeh backend
+        raster = raster.opts(
+            width=width,
+            height=height,
+            colorbar=colorbar,
+            cmap=cmap,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            **kwargs,
+        )
+    else:
+        raise ValueError(
+            f"Invalid backend selected. Expected one of ['matplotlib', 'bokeh'] but received {backend}."
+        )
+
+    return raster
+
+
 def _polygon_raster(
     uxda: UxDataArray,
     backend: Optional[str] = "bokeh",
     exclude_antimeridian: Optional[bool] = True,
+    projection: Optional[ccrs] = None,
     pixel_ratio: Optional[float] = 1.0,
     dynamic: Optional[bool] = False,
     precompute: Optional[bool] = True,
@@ -298,12 +518,18 @@ def _polygon_raster(
 ):
     """Implementation of Polygon Rasterization."""
 
+    import holoviews as hv
+    from holoviews.operation.datashader import rasterize as hds_rasterize
+
     if "clabel" not in kwargs:
         # set default label for color bar
         kwargs["clabel"] = uxda.name
 
     gdf = uxda.to_geodataframe(
-        exclude_antimeridian=exclude_antimeridian, cache=cache, override=override
+        exclude_antimeridian=exclude_antimeridian,
+        cache=cache,
+        override=override,
+        projection=projection,
     )
 
     hv_polygons = hv.Polygons(gdf, vdims=[uxda.name])
@@ -353,6 +579,336 @@ def _polygon_raster(
     return raster
 
 
+def _trimesh_raster(
+    uxda: UxDataArray,
+    backend: Optional[str] = "bokeh",
+    pixel_ratio: Optional[float] = 1.0,
+    dynamic: Optional[bool] = False,
+    precompute: Optional[bool] = True,
+    width: Optional[int] = 1000,
+    height: Optional[int] = 500,
+    colorbar: Optional[bool] = True,
+    cmap: Optional[str] = "Blues",
+    aggregator: Optional[str] = "mean",
+    interpolation: Optional[str] = "linear",
+    xlabel: Optional[str] = "Longitude",
+    ylabel: Optional[str] = "Latitude",
+    x_range: Optional[tuple] = (-180, 180),
+    y_range: Optional[tuple] = (-90, 90),
+    **kwargs,
+):
+    """Implementation of Trimesh Rasterization.
+
+    Node-centered data is interpolated linearly across each triangle
+    (Gouraud shading), while face-centered data is constant across the
+    triangles of each face (flat shading).
+    """
+
+    import holoviews as hv
+    from holoviews.operation.datashader import rasterize as hds_rasterize
+
+    if "clabel" not in kwargs:
+        # set default label for color bar
+        kwargs["clabel"] = uxda.name
+
+    # fan triangulation of each face, cached on the grid
+    triangles, triangle_faces, vertices, vertex_nodes = _get_trimesh(uxda.uxgrid)
+
+    simplices = pd.DataFrame(
+        {"v0": triangles[:, 0], "v1": triangles[:, 1], "v2": triangles[:, 2]}
+    )
+
+    if uxda._face_centered():
+        # values stored on each triangle
+        simplices["var"] = uxda.values[triangle_faces]
+        nodes = hv.Points(vertices, ["lon", "lat"])
+        trimesh = hv.TriMesh((simplices, nodes), vdims=["var"])
+    elif uxda._node_centered():
+        # values stored on each vertex
+        nodes = hv.Nodes(
+            (
+                vertices[:, 0],
+                vertices[:, 1],
+                np.arange(vertices.shape[0]),
+                uxda.values[vertex_nodes],
+            ),
+            ["lon", "lat", "index"],
+            ["var"],
+        )
+        trimesh = hv.TriMesh((simplices, nodes))
+    else:
+        raise ValueError(
+            f"Trimesh rasterization requires the data variable {uxda.name} to be node or face centered."
+        )
+
+    uxarray.plot.utils.backend.assign(backend=backend)
+
+    # triangles split across the antimeridian extend past it and are clipped to the plotted range
+    raster = hds_rasterize(
+        trimesh,
+        pixel_ratio=pixel_ratio,
+        dynamic=dynamic,
+        precompute=precompute,
+        aggregator=aggregator,
+        interpolation=interpolation,
+        x_range=x_range,
+        y_range=y_range,
+    )
+
+    if backend == "matplotlib":
+        # use holoviews matplotlib backend
+        raster = raster.opts(
+            colorbar=colorbar,
+            cmap=cmap,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            **kwargs,
+        )
+    elif backend == "bokeh":
+        # use holoviews bokeh backend
+        raster = raster.opts(
+            width=width,
+            height=height,
+            colorbar=colorbar,
+            cmap=cmap,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            **kwargs,
+        )
+    else:
+        raise ValueError(
+            f"Invalid backend selected. Expected one of ['matplotlib', 'bokeh'] but received {backend}."
+        )
+
+    return raster
+
+
+def _lookup_raster(
+    uxda: UxDataArray,
+    backend: Optional[str] = "bokeh",
+    pixel_ratio: Optional[float] = 1.0,
+    projection: Optional[ccrs] = None,
+    width: Optional[int] = 1000,
+    height: Optional[int] = 500,
+    colorbar: Optional[bool] = True,
+    cmap: Optional[str] = "Blues",
+    xlabel: Optional[str] = "Longitude",
+    ylabel: Optional[str] = "Latitude",
+    x_range: Optional[tuple] = None,
+    y_range: Optional[tuple] = None,
+    **kwargs,
+):
+    """Implementation of Lookup Rasterization.
+
+    Face-centered data is indexed with the face that covers each pixel,
+    which is computed once for each canvas and projection, so that
+    repeated rasters of the same grid skip the aggregation.
+    """
+
+    import holoviews as hv
+
+    if "clabel" not in kwargs:
+        # set default label for color bar
+        kwargs["clabel"] = uxda.name
+
+    if uxda.ndim > 1:
+        raise ValueError(
+            f"Data Variable must be 1-dimensional, with shape {uxda.uxgrid.n_face} "
+            f"for face-centered data."
+        )
+
+    raster = uxda.to_raster(
+        width=int(width * pixel_ratio),
+        height=int(height * pixel_ratio),
+        x_range=x_range,
+        y_range=y_range,
+        projection=projection,
+    )
+
+    x_range, y_range = _raster_extent(x_range, y_range, projection)
+
+    uxarray.plot.utils.backend.assign(backend=backend)
+
+    image = hv.Image(
+        raster.values,
+        bounds=(x_range[0], y_range[0], x_range[1], y_range[1]),
+        kdims=["lon", "lat"],
+        vdims=["var"],
+    )
+
+    if backend == "matplotlib":
+        # use holoviews matplotlib backend
+        raster = image.opts(
+            colorbar=colorbar,
+            cmap=cmap,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            **kwargs,
+        )
+    elif backend == "bokeh":
+        # use holoviews bokeh backend
+        raster = image.opts(
+            width=width,
+            height=height,
+            colorbar=colorbar,
+            cmap=cmap,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            **kwargs,
+        )
+    else:
+        raise ValueError(
+            f"Invalid backend selected. Expected one of ['matplotlib', 'bokeh'] but received {backend}."
+        )
+
+    return raster
+
+
+def render_frames(
+    uxda: UxDataArray,
+    dim: Optional[str] = None,
+    filename: Optional[str] = None,
+    width: Optional[int] = 1000,
+    height: Optional[int] = 500,
+    x_range: Optional[tuple] = None,
+    y_range: Optional[tuple] = None,
+    projection: Optional[ccrs] = None,
+    cmap: Optional[str] = "Blues",
+    vmin: Optional[float] = None,
+    vmax: Optional[float] = None,
+    processes: Optional[int] = None,
+):
+    """Renders each slice of a face-centered data variable along a dimension
+    (i.e. each time step) to an RGBA image, using a single lookup of the face
+    that covers each pixel for every frame (see ``Grid.to_raster_lookup``).
+
+    Parameters
+    ----------
+    dim: str, optional
+        Dimension to render a frame for each index of, defaulting to the only dimension other than "n_face"
+    filename: str, optional
+        Format string for the path of each frame (i.e. "frame_{:04d}.png"), formatted with the index of the frame.
+        If provided, frames are saved as PNG images instead of returned.
+    width, height : int
+        Size of each frame in pixels
+    x_range, y_range : tuple, optional
+        Extent of each frame, defaulting to the whole globe in degrees, or the limits of ``projection``
+    projection: ccrs
+        Projection that the faces are transformed to before rendering
+    cmap: str or matplotlib.colors.Colormap
+        Colormap used for shading, either a colormap or the name of a registered ``matplotlib`` colormap
+    vmin, vmax : float, optional
+        Limits of the colormap, shared by every frame, defaulting to the limits of the data
+    processes: int, optional
+        Number of worker processes to render frames across. If not provided, frames are rendered in the calling
+        process.
+
+    Returns
+    -------
+    frames : list
+        RGBA image of each frame with shape ``(height, width, 4)``, with transparent pixels where no face is
+        present, or the path of each saved frame if ``filename`` is provided
+    """
+    if not uxda._face_centered():
+        raise ValueError(
+            f"Data Variable {uxda.name} must be mapped to the faces of the grid to be rendered."
+        )
+
+    if dim is None:
+        other_dims = [d for d in uxda.dims if d != "n_face"]
+        if len(other_dims) != 1:
+            raise ValueError(
+                f"Expected a single dimension other than 'n_face' to render frames along, but found {other_dims}."
+            )
+        dim = other_dims[0]
+
+    if uxda.ndim != 2:
+        raise ValueError(
+            f"Data Variable must be 2-dimensional, with dimensions ({dim}, n_face)."
+        )
+
+    import matplotlib
+
+    # raises a ValueError naming the colormap if it is not registered
+    cmap = matplotlib.colormaps.get_cmap(cmap)
+
+    raster_lookup = uxda.uxgrid.to_raster_lookup(
+        width, height, x_range, y_range, projection
+    )
+
+    if vmin is None:
+        vmin = float(uxda.min())
+    if vmax is None:
+        vmax = float(uxda.max())
+
+    n_frames = uxda.sizes[dim]
+    frames = (uxda.isel(**{dim: i}).values for i in range(n_frames))
+
+    if filename is None:
+        filenames = [None] * n_frames
+    else:
+        filenames = [filename.format(i) for i in range(n_frames)]
+
+    if processes is None:
+        return [
+            _render_frame(values, raster_lookup, cmap, vmin, vmax, frame_filename)
+            for values, frame_filename in zip(frames, filenames)
+        ]
+
+    # the lookup is sent to each worker once, instead of with every frame, and workers are spawned instead of forked
+    # since forking a process that runs threaded numba or dask code can deadlock
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_frame_worker,
+        initargs=(raster_lookup, cmap, vmin, vmax),
+    ) as executor:
+        return list(executor.map(_render_frame_in_worker, frames, filenames))
+
+
+# lookup and colormap of each worker process used by ``render_frames``
+_frame_worker_state = None
+
+
+def _init_frame_worker(raster_lookup, cmap, vmin, vmax):
+    """Stores the lookup and colormap shared by every frame rendered by a
+    worker process."""
+    global _frame_worker_state
+    _frame_worker_state = (raster_lookup, cmap, vmin, vmax)
+
+
+def _render_frame_in_worker(values, filename=None):
+    """Renders a single frame in a worker process."""
+    return _render_frame(values, *_frame_worker_state, filename=filename)
+
+
+def _render_frame(values, raster_lookup, cmap, vmin, vmax, filename=None):
+    """Renders the face-centered values of a single frame to an RGBA image by
+    indexing them with the face that covers each pixel and shading them with
+    the ``matplotlib.colors.Colormap`` ``cmap``, saving it as a PNG image if
+    ``filename`` is provided."""
+
+    import matplotlib.colors
+    import matplotlib.image
+
+    covered = raster_lookup != INT_FILL_VALUE
+    raster = np.ma.masked_array(
+        np.asarray(values)[np.where(covered, raster_lookup, 0)], mask=~covered
+    )
+
+    # support mpl colormaps, with pixels that are not covered by a face left transparent
+    _cmap = cmap.with_extremes(bad=(0.0, 0.0, 0.0, 0.0))
+
+    norm = matplotlib.colors.Normalize(vmin=vmin, vmax=vmax)
+    rgba = _cmap(norm(raster), bytes=True)
+
+    if filename is not None:
+        matplotlib.image.imsave(filename, rgba)
+        return filename
+
+    return rgba
+
+
 def polygons(
     uxda: UxDataArray,
     backend: Optional[str] = "bokeh",
@@ -376,17 +932,26 @@ def polygons(
         Selects whether to use Holoview's "matplotlib" or "bokeh" backend for rendering plots
     exclude_antimeridian: bool,
         Whether to exclude faces that cross the antimeridian (Polygon Raster Only)
+    projection: ccrs
+        Custom projection to transform the polygons to, which is computed once for each projection and cached
+        on the grid
     height: int
         Plot Height for Bokeh Backend
     width: int
         Plot Width for Bokeh Backend
     """
+
+    import holoviews as hv
+
     if "clabel" not in kwargs:
         # set default label for color bar
         kwargs["clabel"] = uxda.name
 
     gdf = uxda.to_geodataframe(
-        exclude_antimeridian=exclude_antimeridian, cache=cache, override=override
+        exclude_antimeridian=exclude_antimeridian,
+        cache=cache,
+        override=override,
+        projection=projection,
     )
 
     hv_polygons = hv.Polygons(gdf, vdims=[uxda.name])
@@ -494,17 +1059,15 @@ def _plot_data_as_points(
         kwargs["clabel"] = uxda.name
 
     uxgrid = uxda.uxgrid
-    if element == "node":
-        lon, lat = uxgrid.node_lon.values, uxgrid.node_lat.values
-    elif element == "face":
-        lon, lat = uxgrid.face_lon.values, uxgrid.face_lat.values
-    elif element == "edge":
-        lon, lat = uxgrid.edge_lon.values, uxgrid.edge_lat.values
-    else:
+    if element not in ("node", "face", "edge"):
         raise ValueError("Invalid element selected.")
 
     if projection is not None:
-        lon, lat, _ = projection.transform_points(ccrs.PlateCarree(), lon, lat).T
+        # projected coordinates, cached on the grid for each projection
+        lon, lat = _get_projected_coordinates(uxgrid, element, projection).T
+    else:
+        lon = getattr(uxgrid, f"{element}_lon").values
+        lat = getattr(uxgrid, f"{element}_lat").values
 
     verts = np.column_stack([lon, lat, uxda.values])
     hv_points = Points(verts, vdims=["z"])
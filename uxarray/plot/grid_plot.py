@@ -6,9 +6,10 @@ if TYPE_CHECKING:
     from uxarray.grid import Grid
 
 import numpy as np
-import holoviews as hv
+import pandas as pd
 
 import uxarray.plot.utils
+from uxarray.grid.geometry import _get_edge_segments
 
 
 def plot(grid: Grid, **kwargs):
@@ -20,6 +21,7 @@ def mesh(
     uxgrid: Grid,
     backend: Optional[str] = "bokeh",
     exclude_antimeridian: Optional[bool] = False,
+    rasterize: Optional[bool] = False,
     width: Optional[int] = 1000,
     height: Optional[int] = 500,
     xlabel: Optional[str] = "Longitude",
@@ -34,25 +36,44 @@ def mesh(
         Selects whether to use Holoview's "matplotlib" or "bokeh" backend for rendering plots
      exclude_antimeridian: bool,
         Whether to exclude edges that cross the antimeridian
+    rasterize: bool
+        Whether to rasterize the edges with datashader instead of drawing each edge as a vector line
     height: int
         Plot Height for Bokeh Backend
     width: int
         Plot Width for Bokeh Backend
     """
 
-    gdf = uxgrid.to_geodataframe(exclude_antimeridian=exclude_antimeridian)
+    import holoviews as hv
 
-    hv_paths = hv.Path(gdf)
+    # a single segment for each edge, split at the antimeridian
+    edge_segments, antimeridian_edge_indices = _get_edge_segments(uxgrid)
+
+    if exclude_antimeridian:
+        keep = np.ones(uxgrid.n_edge, dtype=bool)
+        keep[antimeridian_edge_indices] = False
+        edge_segments = edge_segments[: uxgrid.n_edge][keep]
+
+    segment_df = pd.DataFrame(
+        edge_segments.reshape(-1, 4), columns=["x0", "y0", "x1", "y1"], copy=False
+    )
+    hv_segments = hv.Segments(segment_df, ["x0", "y0", "x1", "y1"])
 
     uxarray.plot.utils.backend.assign(backend=backend)
 
+    if rasterize:
+        from holoviews.operation.datashader import rasterize as hds_rasterize
+
+        hv_segments = hds_rasterize(hv_segments, aggregator="any", dynamic=False)
+        kwargs.setdefault("cmap", ["#ffffff00", "black"])
+
     if backend == "matplotlib":
         # use holoviews matplotlib backend
-        return hv_paths.opts(**kwargs)
+        return hv_segments.opts(**kwargs)
 
     elif backend == "bokeh":
         # use holoviews bokeh backend
-        return hv_paths.opts(
+        return hv_segments.opts(
             width=width, height=height, xlabel=xlabel, ylabel=ylabel, **kwargs
         )
 
@@ -166,6 +187,8 @@ def _plot_coords_as_points(
     """Helper function for plotting coordinates (node, edge, face) as Points
     with Holoviews."""
 
+    import holoviews as hv
+
     if element == "node":
         hv_points = hv.Points(np.array([uxgrid.node_lon, uxgrid.node_lat.values]).T)
     elif element == "face":
@@ -1,14 +1,14 @@
-import holoviews as hv
-import matplotlib as mpl
-
-
 class HoloviewsBackend:
     """Utility class to compare and set a HoloViews plotting backend for
-    visualization."""
+    visualization.
+
+    ``holoviews`` and ``matplotlib`` are imported on the first assignment of a backend, so that importing
+    ``uxarray`` does not import any plotting library.
+    """
 
     def __init__(self):
         self.backend = None
-        self.matplotlib_backend = mpl.get_backend()
+        self.matplotlib_backend = None
 
     def assign(self, backend: str):
         """Assigns a backend for use with HoloViews visualization.
@@ -24,13 +24,27 @@ class HoloviewsBackend:
                 f"Unsupported backend. Expected one of ['bokeh', 'matplotlib'], but received {backend}"
             )
 
+        if self.matplotlib_backend is None:
+            # store the default matplotlib backend before holoviews changes it
+            import matplotlib as mpl
+
+            self.matplotlib_backend = mpl.get_backend()
+
         if backend != self.backend:
+            import holoviews as hv
+
             # only call hv.extension if it needs to be changed
             hv.extension(backend)
             self.backend = backend
 
     def reset_mpl_backend(self):
         """Resets the default backend for the ``matplotlib`` module."""
+        if self.matplotlib_backend is None:
+            # no backend was assigned, so the matplotlib backend was not changed
+            return
+
+        import matplotlib as mpl
+
         mpl.use(self.matplotlib_backend)
 
 
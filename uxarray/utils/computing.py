@@ -1,6 +1,10 @@
 import numpy as np
 import sys
 
+from numba import njit
+
+from uxarray.constants import ENABLE_JIT_CACHE
+
 
 def _fmms(a, b, c, d):
     """
@@ -40,6 +44,78 @@ def _fmms(a, b, c, d):
     return dop + err
 
 
+@njit(cache=ENABLE_JIT_CACHE)
+def _two_prod_split(a, b):
+    """Error-free transformation of the product of two floating-point numbers
+    such that a * b = x + y exactly, using Dekker's splitting instead of a
+    hardware FMA so that it can be compiled.
+
+    Parameters
+    ----------
+    a, b : float
+        The floating-point numbers to be multiplied.
+
+    Returns
+    -------
+    tuple of float
+        The product and the error term.
+
+    Reference
+    ---------
+    T. J. Dekker. A Floating-Point Technique for Extending the Available Precision.
+    Numerische Mathematik, 18(3), 224–242,1971. 10.1007/BF01397083.
+    """
+    x = a * b
+
+    t = 134217729.0 * a
+    a_hi = t - (t - a)
+    a_lo = a - a_hi
+
+    t = 134217729.0 * b
+    b_hi = t - (t - b)
+    b_lo = b - b_hi
+
+    y = a_lo * b_lo - (((x - a_hi * b_hi) - a_lo * b_hi) - a_hi * b_lo)
+    return x, y
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _fmms_split(a, b, c, d):
+    """Compiled equivalent of (``_fmms``), calculating the difference of
+    products (a * b) - (c * d) from their error-free transformations.
+
+    Parameters
+    ----------
+    a, b, c, d : float
+        The values of the two products.
+
+    Returns
+    -------
+    float
+        The difference of the two products.
+    """
+    ab, ab_err = _two_prod_split(a, b)
+    cd, cd_err = _two_prod_split(c, d)
+
+    # error-free transformation of ab - cd
+    x = ab - cd
+    z = x - ab
+    y = (ab - (x - z)) + (-cd - z)
+
+    return x + (y + (ab_err - cd_err))
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _cross_split(ux, uy, uz, vx, vy, vz):
+    """Compiled equivalent of (``cross_fma``) that operates on the components
+    of two 3D vectors, avoiding an array allocation per call."""
+    return (
+        _fmms_split(uy, vz, uz, vy),
+        _fmms_split(uz, vx, ux, vz),
+        _fmms_split(ux, vy, uy, vx),
+    )
+
+
 def cross_fma(v1, v2):
     """Calculate the cross product of two 3D vectors utilizing the fused
     multiply-add operation.
@@ -627,3 +703,286 @@ def _split(a):
     x = y - (y - a)
     y = a - x
     return x, y
+
+
+# compiled equivalents of the error-free transformations that only use basic arithmetic
+_two_sum_jit = njit(cache=ENABLE_JIT_CACHE)(_two_sum)
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _fast_two_sum_jit(a, b):
+    """Compiled equivalent of (``_fast_two_sum``), without checking that |a|
+    is no less than |b|."""
+    x = a + b
+    y = b - (x - a)
+    return x, y
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _acc_sqrt_split(T, t):
+    """Compiled equivalent of (``_acc_sqrt``)."""
+    P = np.sqrt(T)
+    if P == 0.0:
+        return P
+    H, h = _two_prod_split(P, P)
+    r = t + ((T - H) - h)
+    return P + r / (2 * P)
+
+
+def _as_vectors(*arrays):
+    """Broadcasts arrays of vectors against each other and flattens them to
+    two-dimensional arrays of shape ``(n, k)`` that can be passed to a
+    compiled kernel, along with the leading shape of the broadcasted
+    arrays."""
+    arrays = np.broadcast_arrays(*[np.asarray(arr, dtype=np.float64) for arr in arrays])
+    shape = arrays[0].shape
+    if len(shape) == 0:
+        raise ValueError("Input must be an array of vectors")
+    return [np.ascontiguousarray(arr.reshape(-1, shape[-1])) for arr in arrays], shape[
+        :-1
+    ]
+
+
+def cross_fma_batch(v1, v2):
+    """Calculate the cross products of arrays of 3D vectors in a single
+    compiled call, equivalent to applying (``cross_fma``) to each pair of
+    vectors.
+
+    The difference of products in each component is computed using
+    error-free transformations based on Dekker's splitting, which does not
+    require ``pyfma``.
+
+    Parameters
+    ----------
+    v1 : np.ndarray
+        Array of vectors with shape ``(..., 3)``
+    v2 : np.ndarray
+        Array of vectors with shape ``(..., 3)``, broadcastable against ``v1``
+
+    Returns
+    -------
+    np.ndarray
+        The cross product of each pair of vectors with shape ``(..., 3)``
+
+    Examples
+    --------
+    >>> cross_fma_batch([[1.0, 2.0, 3.0]], [[4.0, 5.0, 6.0]])
+    array([[-3.,  6., -3.]])
+    """
+    (v1, v2), shape = _as_vectors(v1, v2)
+    if v1.shape[1] != 3:
+        raise ValueError("Input vectors must be of size 3")
+    return _cross_batch(v1, v2).reshape(shape + (3,))
+
+
+def dot_fma_batch(v1, v2):
+    """Calculate the dot products of arrays of vectors in a single compiled
+    call, equivalent to applying (``dot_fma``) to each pair of vectors.
+
+    Parameters
+    ----------
+    v1 : np.ndarray
+        Array of vectors with shape ``(..., k)``
+    v2 : np.ndarray
+        Array of vectors with shape ``(..., k)``, broadcastable against ``v1``
+
+    Returns
+    -------
+    np.ndarray
+        The compensated dot product of each pair of vectors with shape ``(...)``
+
+    Examples
+    --------
+    >>> dot_fma_batch([[1.0, 2.0, 3.0]], [[4.0, 5.0, 6.0]])
+    array([32.])
+    """
+    (v1, v2), shape = _as_vectors(v1, v2)
+    return _dot_batch(v1, v2).reshape(shape)
+
+
+def _vec_sum_batch(p):
+    """Compute the compensated sum along the last axis of an array, equivalent
+    to applying (``_vec_sum``) to each vector.
+
+    Parameters
+    ----------
+    p : np.ndarray
+        Array of vectors with shape ``(..., k)``
+
+    Returns
+    -------
+    np.ndarray
+        The compensated sum of each vector with shape ``(...)``
+    """
+    (p,), shape = _as_vectors(p)
+    return _vec_sum_kernel(p).reshape(shape)
+
+
+def _comp_prod_batch(vec):
+    """Compute the compensated product along the last axis of an array,
+    equivalent to applying (``_comp_prod_fma``) to each vector.
+
+    Parameters
+    ----------
+    vec : np.ndarray
+        Array of vectors with shape ``(..., k)``
+
+    Returns
+    -------
+    np.ndarray
+        The compensated product of each vector with shape ``(...)``
+    """
+    (vec,), shape = _as_vectors(vec)
+    return _comp_prod_kernel(vec).reshape(shape)
+
+
+def _norm_faithful_batch(x):
+    """Compute the faithful L2 norm along the last axis of an array,
+    equivalent to applying (``_norm_faithful``) to each vector.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Array of vectors with shape ``(..., k)``
+
+    Returns
+    -------
+    np.ndarray
+        The faithful norm of each vector with shape ``(...)``
+    """
+    (x,), shape = _as_vectors(x)
+    return _norm_kernel(x).reshape(shape)
+
+
+def _two_prod_batch(a, b):
+    """Error-free transformation of the element-wise products of two arrays,
+    such that a * b = x + y exactly, equivalent to applying
+    (``_two_prod_fma``) to each element.
+
+    Parameters
+    ----------
+    a, b : np.ndarray
+        Arrays of floating-point numbers to be multiplied, broadcastable against each other
+
+    Returns
+    -------
+    tuple of np.ndarray
+        The products and the error terms.
+    """
+    a, b = np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    )
+    x, y = _two_prod_kernel(a.ravel(), b.ravel())
+    return x.reshape(a.shape), y.reshape(a.shape)
+
+
+def _acc_sqrt_batch(T, t):
+    """Compute the accurate square roots of an array of double-word numbers,
+    equivalent to applying (``_acc_sqrt``) to each element.
+
+    Parameters
+    ----------
+    T : np.ndarray
+        The numbers whose square roots are to be computed.
+    t : np.ndarray
+        The compensation terms for round-off error.
+
+    Returns
+    -------
+    np.ndarray
+        The accurate square roots.
+    """
+    T, t = np.broadcast_arrays(
+        np.asarray(T, dtype=np.float64), np.asarray(t, dtype=np.float64)
+    )
+    return _acc_sqrt_kernel(T.ravel(), t.ravel()).reshape(T.shape)
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _cross_batch(v1, v2):
+    """Compiled kernel for (``cross_fma_batch``)."""
+    out = np.empty_like(v1)
+    for i in range(v1.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2] = _cross_split(
+            v1[i, 0], v1[i, 1], v1[i, 2], v2[i, 0], v2[i, 1], v2[i, 2]
+        )
+    return out
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _dot_batch(v1, v2):
+    """Compiled kernel for (``dot_fma_batch``)."""
+    out = np.empty(v1.shape[0], dtype=np.float64)
+    for i in range(v1.shape[0]):
+        s, c = _two_prod_split(v1[i, 0], v2[i, 0])
+        for j in range(1, v1.shape[1]):
+            p, pi = _two_prod_split(v1[i, j], v2[i, j])
+            s, sigma = _two_sum_jit(s, p)
+            c = c + pi + sigma
+        out[i] = s + c
+    return out
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _vec_sum_kernel(p):
+    """Compiled kernel for (``_vec_sum_batch``)."""
+    out = np.empty(p.shape[0], dtype=np.float64)
+    for i in range(p.shape[0]):
+        s = p[i, 0]
+        sigma = 0.0
+        for j in range(1, p.shape[1]):
+            s, q = _two_sum_jit(s, p[i, j])
+            sigma += q
+        out[i] = s + sigma
+    return out
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _comp_prod_kernel(vec):
+    """Compiled kernel for (``_comp_prod_batch``)."""
+    out = np.empty(vec.shape[0], dtype=np.float64)
+    for i in range(vec.shape[0]):
+        p = vec[i, 0]
+        e = 0.0
+        for j in range(1, vec.shape[1]):
+            p, pi = _two_prod_split(p, vec[i, j])
+            e = e * vec[i, j] + pi
+        out[i] = p + e
+    return out
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _norm_kernel(x):
+    """Compiled kernel for (``_norm_faithful_batch``)."""
+    out = np.empty(x.shape[0], dtype=np.float64)
+    for i in range(x.shape[0]):
+        S, sum_p = _two_prod_split(x[i, 0], x[i, 0])
+        s = 0.0
+        for j in range(1, x.shape[1]):
+            P, p = _two_prod_split(x[i, j], x[i, j])
+            sum_p += p
+            H, h = _two_sum_jit(S, P)
+            S, s = _two_sum_jit(H, s + h)
+        H, h = _two_sum_jit(S, sum_p)
+        S, s = _fast_two_sum_jit(H, s + h)
+        out[i] = _acc_sqrt_split(S, s)
+    return out
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _two_prod_kernel(a, b):
+    """Compiled kernel for (``_two_prod_batch``)."""
+    x = np.empty_like(a)
+    y = np.empty_like(a)
+    for i in range(a.shape[0]):
+        x[i], y[i] = _two_prod_split(a[i], b[i])
+    return x, y
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _acc_sqrt_kernel(T, t):
+    """Compiled kernel for (``_acc_sqrt_batch``)."""
+    out = np.empty_like(T)
+    for i in range(T.shape[0]):
+        out[i] = _acc_sqrt_split(T[i], t[i])
+    return out